@@ -0,0 +1,63 @@
+import asyncio
+from time import perf_counter
+
+from sqlalchemy import event
+
+from claon_admin.common.util.db import db
+from claon_admin.schema.center import Center, CenterHold, CenterHoldRepository
+from claon_admin.schema.user import User, UserRepository
+from claon_admin.common.enum import Role
+
+ENTITY_COUNT = 500
+
+center_hold_repository = CenterHoldRepository()
+statements = []
+
+
+async def merge_per_entity(session, holds):
+    session.add_all(holds)
+    [await session.merge(hold) for hold in holds]
+
+
+async def save_all(session, holds):
+    await center_hold_repository.save_all(session, holds)
+
+
+async def insert_all(session, holds):
+    await center_hold_repository.insert_all(session, holds)
+
+
+async def run(name, strategy):
+    async with db.async_session_maker() as session:
+        user = await UserRepository().save(
+            session,
+            User(oauth_id=name, nickname=name, profile_img="", sns=name, role=Role.CENTER_ADMIN)
+        )
+        center = Center(user_id=user.id, name=name, profile_img="", address="", tel="", approved=True)
+        session.add(center)
+        await session.flush()
+        holds = [CenterHold(center_id=center.id, name=f"hold_{i}", difficulty="easy") for i in range(ENTITY_COUNT)]
+
+        statements.clear()
+        start = perf_counter()
+        await strategy(session, holds)
+        await session.flush()
+        elapsed = perf_counter() - start
+
+        print(f"{name:>20}: {len(statements):>5} statements, {elapsed * 1000:8.1f} ms")
+        await session.rollback()
+
+
+async def main():
+    await db.create_database()
+    event.listen(db._engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    print(f"inserting {ENTITY_COUNT} center holds")
+    await run("add + merge", merge_per_entity)
+    await run("save_all", save_all)
+    await run("insert_all", insert_all)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
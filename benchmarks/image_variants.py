@@ -0,0 +1,69 @@
+import asyncio
+import io
+import os
+from time import perf_counter
+
+from PIL import Image
+
+from claon_admin.common.util import image as image_util
+
+IMAGE_SIZE = (3000, 2000)
+REQUEST_COUNT = 8
+
+
+def create_payload() -> bytes:
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", IMAGE_SIZE, os.urandom(IMAGE_SIZE[0] * IMAGE_SIZE[1] * 3)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+async def measure_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(0.005)
+        lags.append(perf_counter() - start - 0.005)
+
+
+async def run(name: str, handle, payload: bytes):
+    stop, lags, pending = asyncio.Event(), [], []
+    lag_task = asyncio.create_task(measure_lag(stop, lags))
+
+    async def request():
+        start = perf_counter()
+        await handle(payload, pending)
+        return perf_counter() - start
+
+    start = perf_counter()
+    latencies = await asyncio.gather(*[request() for _ in range(REQUEST_COUNT)])
+    await asyncio.gather(*pending)
+    elapsed = perf_counter() - start
+
+    stop.set()
+    await lag_task
+
+    print(f"{name:>14}: {max(latencies) * 1000:8.1f} ms max response, {elapsed * 1000:8.1f} ms until variants, "
+          f"max loop lag {max(lags, default=0) * 1000:7.1f} ms")
+
+
+async def inline(payload: bytes, _):
+    await asyncio.sleep(0)
+    image_util.create_variants(payload)
+
+
+async def process_pool(payload: bytes, pending: list):
+    await asyncio.sleep(0)
+    pending.append(asyncio.get_running_loop().run_in_executor(image_util.executor, image_util.create_variants, payload))
+
+
+async def main():
+    payload = create_payload()
+    image_util.create_variants(payload)
+
+    print(f"{REQUEST_COUNT} concurrent uploads of {IMAGE_SIZE[0]}x{IMAGE_SIZE[1]} JPEG")
+    await run("inline", inline, payload)
+    await run("process pool", process_pool, payload)
+    image_util.shutdown_executor()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+import random
+from collections import defaultdict
+from datetime import date, timedelta
+from time import perf_counter
+
+from claon_admin.common.enum import PostCountPeriod
+from claon_admin.common.util.time import get_start_of_week
+from claon_admin.model.post import PostSummaryResponseDto
+from claon_admin.schema.center import Center
+from claon_admin.schema.post import PostCountHistory, PostCountTotal, PostCountRollup
+from claon_admin.schema.user import User  # noqa: F401, registers the mapper used by Center and Post
+
+REPEAT = 200
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+def summarize_with_pandas(end_date: date, history_list):
+    count_by_month = list(filter(lambda x: end_date - timedelta(days=4 * 7) <= x.reg_date < end_date, history_list))
+    count_by_week = list(filter(lambda x: end_date - timedelta(days=7) <= x.reg_date < end_date, count_by_month))
+    count_by_day = list(filter(lambda x: end_date - timedelta(days=1) <= x.reg_date < end_date, count_by_week))
+
+    data_default = pd.DataFrame(pd.date_range(history_list[0].reg_date, end_date - timedelta(days=1), freq="D"),
+                                columns=["reg_date"]).fillna(0)
+    data = pd.DataFrame([{"reg_date": history.reg_date, "count": history.count} for history in history_list])
+    data.reg_date = data.reg_date.astype("datetime64[ns]")
+    data = pd.merge(data_default, data, on="reg_date", how="left").fillna(0).set_index("reg_date")
+    data_per_day = data.iloc[-7:].T.to_dict("records")[0]
+    data_per_week = data.resample("W")["count"].sum().to_frame()
+    if end_date.weekday() > 0:
+        data_per_week = data_per_week[0:-1]
+
+    return count_by_day, count_by_week, count_by_month, data_per_day, data_per_week.T.to_dict("records")[0]
+
+
+def measure(name: str, func):
+    start = perf_counter()
+    for _ in range(REPEAT):
+        func()
+    elapsed = (perf_counter() - start) / REPEAT
+    print(f"{name:>24}: {elapsed * 1000:8.3f} ms/request")
+
+
+def main():
+    center = Center(id="benchmark", name="benchmark")
+    end_date = date.today()
+    start_date = end_date - timedelta(days=52 * 7 + end_date.weekday())
+
+    history_list = [
+        PostCountHistory(center_id=center.id, reg_date=start_date + timedelta(days=i), count=random.randint(0, 30))
+        for i in range((end_date - start_date).days)
+    ]
+    count_per_week = defaultdict(int)
+    for history in history_list:
+        count_per_week[get_start_of_week(history.reg_date)] += history.count
+    rollup_list = [PostCountRollup(center_id=center.id, period=PostCountPeriod.WEEK, reg_date=week, count=count)
+                   for week, count in count_per_week.items()]
+    count_total = PostCountTotal(
+        center_id=center.id,
+        count=sum(history.count for history in history_list),
+        first_reg_date=start_date,
+        last_reg_date=end_date - timedelta(days=1)
+    )
+    history_by_month = [history for history in history_list if history.reg_date >= end_date - timedelta(weeks=4)]
+
+    print(f"{len(history_list)} daily rows, {len(rollup_list)} weekly rollups")
+    if pd is not None:
+        measure("pandas (daily rows)", lambda: summarize_with_pandas(end_date, history_list))
+    measure("buckets (rollups)", lambda: PostSummaryResponseDto.from_entity(
+        center,
+        history_list[0].reg_date,
+        end_date,
+        count_total,
+        history_by_month,
+        rollup_list
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import asyncio
+import mimetypes
+import os
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from time import perf_counter
+
+import boto3
+from fastapi import UploadFile
+from moto import mock_aws
+
+from claon_admin.common.util import s3 as s3_util
+from claon_admin.common.util.db import db
+
+BUCKET = "claon-benchmark"
+FILE_SIZE = 10 * 1024 * 1024
+UPLOAD_COUNT = 8
+
+
+async def upload_with_temp_file(file: UploadFile, domain: str, purpose: str):
+    with NamedTemporaryFile() as temp_file:
+        temp_file.write(await file.read())
+        temp_file.seek(0)
+        s3_util.s3.upload_fileobj(
+            temp_file,
+            BUCKET,
+            os.path.join(domain, purpose, file.filename),
+            ExtraArgs={"ContentType": mimetypes.guess_type(f"{file.filename}")[0], "ACL": "public-read"}
+        )
+
+
+def create_upload_file(index: int, payload: bytes) -> UploadFile:
+    spool = SpooledTemporaryFile(max_size=1024 * 1024)
+    spool.write(payload)
+    spool.seek(0)
+    return UploadFile(file=spool, filename=f"benchmark-{index}.png")
+
+
+async def measure_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(0.005)
+        lags.append(perf_counter() - start - 0.005)
+
+
+async def run(name: str, upload, payload: bytes):
+    files = [create_upload_file(i, payload) for i in range(UPLOAD_COUNT)]
+    stop, lags = asyncio.Event(), []
+    lag_task = asyncio.create_task(measure_lag(stop, lags))
+
+    start = perf_counter()
+    await asyncio.gather(*[upload(file, "center", "benchmark") for file in files])
+    elapsed = perf_counter() - start
+
+    stop.set()
+    await lag_task
+    for file in files:
+        await file.close()
+
+    print(f"{name:>16}: {elapsed * 1000:8.1f} ms total, max loop lag {max(lags, default=0) * 1000:7.1f} ms")
+
+
+async def main():
+    with mock_aws():
+        s3_util.s3 = boto3.client("s3", region_name="us-east-1")
+        s3_util.s3.create_bucket(Bucket=BUCKET)
+        s3_util.AWS_S3_BUCKET = BUCKET
+        s3_util.AWS_REGION = "us-east-1"
+
+        await db.create_database()
+        payload = os.urandom(FILE_SIZE)
+
+        print(f"{UPLOAD_COUNT} concurrent uploads of {FILE_SIZE // 1024 // 1024} MiB")
+        await run("temp file", upload_with_temp_file, payload)
+        await run("streaming", s3_util.put_file, payload)
+
+        await s3_util.upload_file(create_upload_file(0, payload), "center", "benchmark")
+        await run("deduplicated", s3_util.upload_file, payload)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
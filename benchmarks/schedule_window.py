@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timedelta, date
+from time import perf_counter
+
+from sqlalchemy import select, and_, func, event, text
+
+from claon_admin.common.enum import Role
+from claon_admin.common.util.db import db
+from claon_admin.schema.center import Center, CenterSchedule, CenterScheduleRepository
+from claon_admin.schema.user import User, UserRepository
+
+CENTER_COUNT = 3
+SCHEDULE_COUNT_PER_CENTER = 30000
+REPEAT = 20
+
+center_schedule_repository = CenterScheduleRepository()
+statements = []
+
+
+async def find_by_date_function(session, center_id: str, date_from: date):
+    result = await session.execute(select(CenterSchedule)
+                                   .where(and_(CenterSchedule.center_id == center_id,
+                                               func.date(CenterSchedule.start_time)
+                                               .between(date_from, date_from + timedelta(days=42))))
+                                   .order_by(CenterSchedule.start_time.asc(), CenterSchedule.end_time.desc()))
+    return result.scalars().all()
+
+
+async def run(session, name, find, center_id: str, date_from: date):
+    statements.clear()
+    start = perf_counter()
+    for _ in range(REPEAT):
+        count = len(await find(session, center_id, date_from))
+    elapsed = (perf_counter() - start) / REPEAT
+
+    statement, parameters = statements[0]
+    prefix = "EXPLAIN QUERY PLAN" if session.bind.dialect.name == "sqlite" else "EXPLAIN"
+    connection = await session.connection()
+    plan = await connection.exec_driver_sql(f"{prefix} {statement}", parameters)
+
+    print(f"{name:>16}: {count} rows, {elapsed * 1000:8.2f} ms/query")
+    for row in plan.fetchall():
+        print(f"{'':>18}{row[-1]}")
+
+
+async def main():
+    await db.create_database()
+    event.listen(db._engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters)))
+
+    async with db.async_session_maker() as session:
+        user = await UserRepository().save(
+            session,
+            User(oauth_id="benchmark", nickname="benchmark", profile_img="", sns="benchmark", role=Role.CENTER_ADMIN)
+        )
+        centers = [Center(user_id=user.id, name=f"center_{i}", profile_img="", address="", tel="", approved=True)
+                   for i in range(CENTER_COUNT)]
+        session.add_all(centers)
+        await session.flush()
+
+        first_day = datetime(2020, 1, 1)
+        for center in centers:
+            await center_schedule_repository.insert_all(session, [
+                CenterSchedule(
+                    center_id=center.id,
+                    title="schedule",
+                    start_time=first_day + timedelta(hours=i),
+                    end_time=first_day + timedelta(hours=i + 1)
+                ) for i in range(SCHEDULE_COUNT_PER_CENTER)
+            ])
+        await session.execute(text("ANALYZE"))
+
+        print(f"{CENTER_COUNT} centers x {SCHEDULE_COUNT_PER_CENTER} schedules on {session.bind.dialect.name}")
+        for name, find in [
+            ("date() between", find_by_date_function),
+            ("half-open range", center_schedule_repository.find_by_center_id_and_date_from)
+        ]:
+            await run(session, name, find, centers[0].id, date(2021, 6, 1))
+
+        await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -31,6 +31,9 @@ class CenterUploadPurpose(Enum):
     def is_valid_extension(self, extension: str):
         return extension in self.get_extensions()
 
+    def has_variants(self):
+        return self.value == "profile" or self.value == "image" or self.value == "fee"
+
 
 class LectorUploadPurpose(Enum):
     PROOF = "proof"
@@ -101,3 +104,24 @@ class CenterFeeUploadPurpose(Enum):
 class PeriodType(Enum):
     DAY = "day"
     MONTH = "month"
+
+
+class PostCountPeriod(Enum):
+    WEEK = "week"
+
+
+class JobRunStatus(Enum):
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class FileDeletionStatus(Enum):
+    PENDING = "pending"
+    DELETED = "deleted"
+    FAILED = "failed"
+
+
+class CursorDirection(Enum):
+    NEXT = "next"
+    PREVIOUS = "previous"
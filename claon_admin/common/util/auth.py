@@ -5,11 +5,12 @@ from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from claon_admin.common.error.exception import UnauthorizedException, ErrorCode
-from claon_admin.common.util.db import db
+from claon_admin.common.util.cache import user_cache
 from claon_admin.common.util.jwt import resolve_access_token
-from claon_admin.common.util.redis import find_user_id_by_refresh_key, delete_refresh_key, save_refresh_key
+from claon_admin.common.util.redis import rotate_refresh_key
+from claon_admin.common.util.transaction import current_session
 from claon_admin.container import Container
-from claon_admin.model.auth import RequestUser
+from claon_admin.model.auth import RequestUser, RefreshUser
 from claon_admin.schema.user import UserRepository
 
 
@@ -18,8 +19,13 @@ async def __find_user_by_id(
         user_id: str,
         user_repository: UserRepository = Depends(Provide[Container.user_repository])
 ):
-    async with db.async_session_maker() as session:
+    async with current_session() as session:
+        in_transaction = session.in_transaction()
         user = await user_repository.find_by_id(session, user_id)
+        if not in_transaction:
+            # end the transaction the lookup autobegan, so the request session does not stay idle in transaction
+            await session.commit()
+
         if user is None:
             raise UnauthorizedException(
                 ErrorCode.USER_DOES_NOT_EXIST,
@@ -28,15 +34,14 @@ async def __find_user_by_id(
         return user
 
 
-async def get_subject(
-    token: HTTPAuthorizationCredentials
-) -> RequestUser:
-    token = token.dict().get("credentials")
-    payload = resolve_access_token(token)
+async def __find_request_user_by_id(user_id: str) -> RequestUser:
+    request_user = user_cache.get(user_id)
+    if request_user is not None:
+        return request_user
 
-    user = await __find_user_by_id(user_id=payload.get("sub"))
+    user = await __find_user_by_id(user_id=user_id)
 
-    return RequestUser(
+    request_user = RequestUser(
         id=user.id,
         profile_img=user.profile_img,
         nickname=user.nickname,
@@ -45,14 +50,26 @@ async def get_subject(
         instagram_nickname=user.instagram_name,
         role=user.role
     )
+    user_cache.put(user_id, request_user)
+
+    return request_user
+
+
+async def get_subject(
+    token: HTTPAuthorizationCredentials
+) -> RequestUser:
+    token = token.dict().get("credentials")
+    payload = resolve_access_token(token)
+
+    return await __find_request_user_by_id(user_id=payload.get("sub"))
 
 
 async def get_refresh(
     refresh_key: HTTPAuthorizationCredentials = Depends(HTTPBearer())
-) -> RequestUser:
+) -> RefreshUser:
     refresh_key = refresh_key.dict().get("credentials")
 
-    user_id = find_user_id_by_refresh_key(refresh_key)
+    user_id, new_refresh_key = await rotate_refresh_key(refresh_key)
 
     if user_id is None:
         raise UnauthorizedException(
@@ -60,20 +77,9 @@ async def get_refresh(
             "refresh key is expired."
         )
 
-    user = await __find_user_by_id(user_id=user_id)
+    user = await __find_request_user_by_id(user_id=user_id)
 
-    delete_refresh_key(refresh_key=refresh_key)
-    save_refresh_key(refresh_key=refresh_key, user_id=user_id)
-
-    return RequestUser(
-        id=user.id,
-        profile_img=user.profile_img,
-        nickname=user.nickname,
-        email=user.email,
-        sns=user.sns,
-        instagram_nickname=user.instagram_name,
-        role=user.role
-    )
+    return RefreshUser(**user.dict(), refresh_key=new_refresh_key)
 
 
 async def get_user(
@@ -113,4 +119,4 @@ async def get_admin(
 CurrentUser = Annotated[RequestUser, Depends(get_user)]
 AdminUser = Annotated[RequestUser, Depends(get_admin)]
 CenterAdminUser = Annotated[RequestUser, Depends(get_center_admin)]
-CurrentRefreshUser = Annotated[RequestUser, Depends(get_refresh)]
+CurrentRefreshUser = Annotated[RefreshUser, Depends(get_refresh)]
@@ -0,0 +1,42 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from claon_admin.common.util.time import get_start_of_week
+
+DAY = timedelta(days=1)
+WEEK = timedelta(days=7)
+
+
+def to_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def group_by_day(counts: Iterable[Tuple[date | datetime, int]]) -> Dict[date, int]:
+    result = defaultdict(int)
+    for day, count in counts:
+        result[to_date(day)] += count
+    return result
+
+
+def sum_by_windows(counts: Dict[date, int], end: date, windows: List[int]) -> List[int]:
+    result = [0] * len(windows)
+    for day, count in counts.items():
+        age = (end - day).days
+        for i, window in enumerate(windows):
+            if 0 < age <= window:
+                result[i] += count
+    return result
+
+
+def fill_days(counts: Dict[date, int], start: date, end: date) -> Dict[date, int]:
+    return {start + DAY * i: counts.get(start + DAY * i, 0) for i in range((end - start).days)}
+
+
+def fill_weeks(counts: Dict[date, int], start: date, end: date) -> Dict[date, int]:
+    result = {}
+    week = get_start_of_week(start)
+    while week + WEEK <= end:
+        result[week + WEEK - DAY] = counts.get(week, 0)
+        week += WEEK
+    return result
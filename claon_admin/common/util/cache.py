@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Generic, TypeVar, Hashable
+
+from claon_admin.config.env import config
+from claon_admin.model.auth import RequestUser
+
+T = TypeVar('T')
+
+USER_CACHE_CONFIG = config.get_by_key("cache", {}).get_by_key("user", {})
+USER_CACHE_TTL = USER_CACHE_CONFIG.get_by_key("ttl", 60)
+USER_CACHE_MAX_SIZE = USER_CACHE_CONFIG.get_by_key("max-size", 10000)
+
+
+class LRUCache(Generic[T]):
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> T | None:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = item
+        if expires_at <= monotonic():
+            del self._items[key]
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: T):
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._items[key] = (value, monotonic() + self.ttl)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def evict(self, key: Hashable):
+        self._items.pop(key, None)
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / requests if requests > 0 else 0.0
+        }
+
+
+user_cache: LRUCache[RequestUser] = LRUCache(max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL)
@@ -1,9 +1,17 @@
-from sqlalchemy import Column, DateTime
+from random import random
+from time import monotonic, perf_counter
+
+from sqlalchemy import Column, DateTime, Integer, event, inspect, select, delete, func, Index
+from sqlalchemy.engine import make_url, Connection
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker, declarative_base, declared_attr
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.schema import DropIndex
+from sqlalchemy.util.queue import AsyncAdaptedQueue
 
 from claon_admin.common.util.time import now
 from claon_admin.config.config import Config
+from claon_admin.config.log import logger
 
 
 class DeclarativeBase(object):
@@ -20,12 +28,136 @@ class DeclarativeBase(object):
 Base = declarative_base(cls=DeclarativeBase)
 
 
-class Database:
+class MeasuredQueue(AsyncAdaptedQueue):
+    on_wait = None
+
+    def get(self, block=True, timeout=None):
+        start = perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            if self.on_wait is not None:
+                self.on_wait(perf_counter() - start)
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    _queue_class = MeasuredQueue
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_count = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self._pool.on_wait = self.record_wait
+
+    def record_wait(self, elapsed: float):
+        self.checkout_count += 1
+        self.checkout_wait_total += elapsed
+        self.checkout_wait_max = max(self.checkout_wait_max, elapsed)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.checkout_count = self.checkout_count
+        pool.checkout_wait_total = self.checkout_wait_total
+        pool.checkout_wait_max = self.checkout_wait_max
+        return pool
+
+    def stats(self):
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "checkout_count": self.checkout_count,
+            "checkout_wait_avg_ms":
+                self.checkout_wait_total / self.checkout_count * 1000 if self.checkout_count > 0 else 0.0,
+            "checkout_wait_max_ms": self.checkout_wait_max * 1000
+        }
+
+
+def create_engine(db_url: str) -> AsyncEngine:
+    database_config = Config.DATABASE_CONFIG
+    options = {"pool_pre_ping": database_config.POOL_PRE_PING}
+
+    if make_url(db_url).get_backend_name() != "sqlite":
+        options.update(database_config.ENGINE_OPTIONS, poolclass=MeasuredQueuePool)
+        if database_config.PREPARED_STATEMENT_CACHE_SIZE is not None:
+            options["connect_args"] = {
+                "prepared_statement_cache_size": database_config.PREPARED_STATEMENT_CACHE_SIZE
+            }
+    elif "query_cache_size" in database_config.ENGINE_OPTIONS:
+        options["query_cache_size"] = database_config.ENGINE_OPTIONS["query_cache_size"]
+
+    engine = create_async_engine(db_url, echo=database_config.ECHO and database_config.ECHO_SAMPLE_RATE >= 1, **options)
+
+    if database_config.ECHO and 0 < database_config.ECHO_SAMPLE_RATE < 1:
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def log_sampled_statement(conn, cursor, statement, parameters, context, executemany):
+            if random() < database_config.ECHO_SAMPLE_RATE:
+                logger.info("%s %r", statement, parameters)
+
+    return engine
+
+
+def pool_stats(engine: AsyncEngine):
+    pool = engine.pool
+    if isinstance(pool, MeasuredQueuePool):
+        return pool.stats()
+
+    return {"status": pool.status()}
+
+
+class Replica:
     def __init__(self, db_url: str) -> None:
-        self._engine: AsyncEngine = create_async_engine(db_url, echo=True, pool_pre_ping=True)
+        self._engine: AsyncEngine = create_engine(db_url)
         self.async_session_maker = sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
+        self.ejected_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until <= monotonic()
+
+    def stats(self):
+        return {"healthy": self.healthy, "pool": pool_stats(self._engine)}
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
+
+
+class Database:
+    def __init__(self, db_url: str, replica_urls: list[str] = None, replica_eject_seconds: float = 30) -> None:
+        self._engine: AsyncEngine = create_engine(db_url)
+        self.async_session_maker = sessionmaker(
+            self._engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self.replicas = [Replica(replica_url) for replica_url in replica_urls or []]
+        self.replica_eject_seconds = replica_eject_seconds
+        self._replica_index = 0
+
+    def next_replica(self) -> Replica | None:
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._replica_index % len(self.replicas)]
+            self._replica_index += 1
+            if replica.healthy:
+                return replica
+
+        return None
+
+    def eject(self, replica: Replica):
+        replica.ejected_until = monotonic() + self.replica_eject_seconds
+
+    def stats(self):
+        return {
+            "primary": {"pool": pool_stats(self._engine)},
+            "replicas": [replica.stats() for replica in self.replicas]
+        }
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
+        for replica in self.replicas:
+            await replica.dispose()
 
     async def create_database(self) -> None:
         async with self._engine.begin() as conn:
@@ -34,8 +166,52 @@ class Database:
                 await conn.run_sync(Base.metadata.create_all)
             elif Config.DATABASE_CONFIG.DDL_AUTO == "none":
                 await conn.run_sync(Base.metadata.create_all)
+            elif Config.DATABASE_CONFIG.DDL_AUTO == "update":
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.run_sync(self.__create_missing_indexes)
             else:
                 await conn.run_sync(Base.metadata.create_all)
 
+    @staticmethod
+    def __create_missing_indexes(conn: Connection):
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index_name in table.info.get("obsolete_indexes", []):
+                if index_name in existing_indexes:
+                    logger.info("Drop index %s on %s", index_name, table.name)
+                    conn.execute(DropIndex(Index(index_name)))
+
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    if index.unique:
+                        Database.__delete_duplicates(conn, index)
+                    logger.info("Create index %s on %s", index.name, table.name)
+                    index.create(conn)
+
+    @staticmethod
+    def __delete_duplicates(conn: Connection, index: Index):
+        table = index.table
+        primary_keys = list(table.primary_key.columns)
+        if len(primary_keys) != 1 or not isinstance(primary_keys[0].type, Integer):
+            # without an autoincrement key there is no reliable way to tell which duplicate was written last
+            duplicate = conn.execute(select(*index.columns).group_by(*index.columns)
+                                     .having(func.count() > 1).limit(1)).first()
+            if duplicate is not None:
+                raise RuntimeError(f"Cannot create {index.name}: {table.name} has duplicate rows for "
+                                   f"{dict(duplicate._mapping)}, remove them before starting the server")
+            return
+
+        primary_key = primary_keys[0]
+        latest = select(func.max(primary_key)).group_by(*index.columns).scalar_subquery()
+        result = conn.execute(delete(table).where(primary_key.not_in(latest)))
+        if result.rowcount > 0:
+            logger.warning("Delete %d duplicate rows of %s before creating %s, keeping the row with the highest %s",
+                           result.rowcount, table.name, index.name, primary_key.name)
+
 
-db = Database(db_url=Config.DATABASE_CONFIG.URL)
+db = Database(
+    db_url=Config.DATABASE_CONFIG.URL,
+    replica_urls=Config.DATABASE_CONFIG.REPLICA_URLS,
+    replica_eject_seconds=Config.DATABASE_CONFIG.REPLICA_EJECT_SECONDS
+)
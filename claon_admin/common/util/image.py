@@ -0,0 +1,99 @@
+import asyncio
+import io
+import os
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict
+
+from PIL import Image, ImageOps
+
+from claon_admin.common.util import s3 as s3_util
+from claon_admin.common.util.db import db
+from claon_admin.config.celery import celery
+from claon_admin.config.env import config
+from claon_admin.config.log import logger
+from claon_admin.schema.file import ImageVariantRepository
+
+IMAGE_CONFIG = config.get_by_key("image", {})
+THUMBNAIL_SIZE = IMAGE_CONFIG.get_by_key("thumbnail-size", 320)
+WEBP_MAX_SIZE = IMAGE_CONFIG.get_by_key("webp-max-size", 1920)
+WEBP_QUALITY = IMAGE_CONFIG.get_by_key("webp-quality", 80)
+PROCESS_WORKERS = IMAGE_CONFIG.get_by_key("process-workers", 2)
+
+THUMBNAIL = "thumbnail"
+WEBP = "webp"
+
+image_variant_repository = ImageVariantRepository()
+
+executor = ProcessPoolExecutor(max_workers=PROCESS_WORKERS)
+background_tasks = set()
+
+
+def to_webp(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def create_variants(data: bytes) -> Dict[str, bytes]:
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+        thumbnail = ImageOps.fit(image, (THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.LANCZOS)
+        image.thumbnail((WEBP_MAX_SIZE, WEBP_MAX_SIZE), Image.Resampling.LANCZOS)
+
+        return {THUMBNAIL: to_webp(thumbnail), WEBP: to_webp(image)}
+
+
+def create_variant_key_names(key_name: str) -> Dict[str, str]:
+    stem = os.path.splitext(key_name)[0]
+    return {THUMBNAIL: stem + ".thumbnail.webp", WEBP: stem + ".webp"}
+
+
+def shutdown_executor():
+    executor.shutdown(cancel_futures=True)
+
+
+async def create_image_variants(url: str, pool: Executor | None = None):
+    async with db.async_session_maker() as session:
+        if await image_variant_repository.find_by_id(session, url) is not None:
+            return
+
+    key_name = url.replace(s3_util.get_url_prefix(), "")[1:]
+    response = await asyncio.to_thread(s3_util.s3.get_object, Bucket=s3_util.AWS_S3_BUCKET, Key=key_name)
+    data = await asyncio.to_thread(response["Body"].read)
+
+    variants = await asyncio.get_running_loop().run_in_executor(pool, create_variants, data)
+
+    variant_urls = {}
+    for variant, variant_key_name in create_variant_key_names(key_name).items():
+        await asyncio.to_thread(
+            s3_util.s3.put_object,
+            Bucket=s3_util.AWS_S3_BUCKET,
+            Key=variant_key_name,
+            Body=variants[variant],
+            ContentType="image/webp",
+            ACL="public-read"
+        )
+        variant_urls[variant] = os.path.join(s3_util.get_url_prefix(), variant_key_name)
+
+    async with db.async_session_maker() as session:
+        await image_variant_repository.register(session, url, variant_urls[THUMBNAIL], variant_urls[WEBP])
+        await session.commit()
+
+
+async def request_image_variants(url: str):
+    if celery is not None:
+        celery.send_task("claon_celery.tasks.create_image_variants", args=[url])
+        return
+
+    async def run():
+        try:
+            await create_image_variants(url, executor)
+        except Exception:
+            logger.error("이미지 변환을 실패했습니다. url: %s\n%s", url, traceback.format_exc())
+
+    task = asyncio.create_task(run())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
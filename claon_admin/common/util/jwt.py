@@ -23,9 +23,9 @@ def create_access_token(user_id: str) -> str:
     return jwt.encode(to_encode, JWT_SECRET_KEY, JWT_ALGORITHM)
 
 
-def create_refresh_key(user_id: str) -> str:
+async def create_refresh_key(user_id: str) -> str:
     refresh_key = str(uuid.uuid4())
-    save_refresh_key(refresh_key=refresh_key, user_id=user_id)
+    await save_refresh_key(refresh_key=refresh_key, user_id=user_id)
     return refresh_key
 
 
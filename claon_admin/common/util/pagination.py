@@ -1,28 +1,143 @@
-from typing import TypeVar, Generic, List, Type
+import base64
+import json
+from datetime import datetime
+from typing import TypeVar, Generic, List, Type, Annotated
 
-from fastapi_pagination import Page
+from fastapi import Depends, Query
+from fastapi_pagination import Page, Params
 from pydantic import BaseModel
 from pydantic.generics import GenericModel
+from sqlalchemy import and_, or_, asc, desc, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import CursorDirection
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
 
 T = TypeVar('T', bound=BaseModel)
 
+COUNT_LIMIT = 1000
+
 
 class Pagination(GenericModel, Generic[T]):
     next_page_num: int
     previous_page_num: int
     total_num: int
     results: List[T]
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+
+class CursorParams(BaseModel):
+    cursor: str = ""
+    size: int = 50
+    count: bool = False
+
+
+class Cursor(BaseModel):
+    created_at: datetime
+    id: str
+    direction: CursorDirection = CursorDirection.NEXT
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.json().encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def decode(cursor: str):
+        try:
+            return Cursor(**json.loads(base64.urlsafe_b64decode(cursor.encode("utf-8"))))
+        except (ValueError, TypeError) as e:
+            raise BadRequestException(
+                ErrorCode.INVALID_FORMAT,
+                "잘못된 커서입니다."
+            ) from e
 
 
 S = TypeVar('S')
 
 
-async def paginate(t: Type[T], p: Page[S]):
+class CursorPage(Generic[S]):
+    def __init__(self, items: List[S], next_cursor: str | None, previous_cursor: str | None, total: int | None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.total = total
+
+
+def get_page_params(params: Params = Depends(),
+                    cursor: str | None = Query(None),
+                    count: bool = Query(False)) -> Params | CursorParams:
+    if cursor is None:
+        return params
+
+    return CursorParams(cursor=cursor, size=params.size, count=count)
+
+
+PageParams = Annotated[Params | CursorParams, Depends(get_page_params)]
+
+
+async def paginate(t: Type[T], p: Page[S] | CursorPage[S], **kwargs):
+    if isinstance(p, CursorPage):
+        return Pagination(
+            next_page_num=-1,
+            previous_page_num=-1,
+            total_num=p.total if p.total is not None else -1,
+            results=[t.from_entity(item, **kwargs) for item in p.items],
+            next_cursor=p.next_cursor,
+            previous_cursor=p.previous_cursor
+        )
+
     return Pagination(
         next_page_num=__build_next_page(p),
         previous_page_num=__build_previous_page(p),
         total_num=p.total,
-        results=[t.from_entity(item) for item in p.items]
+        results=[t.from_entity(item, **kwargs) for item in p.items]
+    )
+
+
+async def paginate_by_cursor(session: AsyncSession, query, params: CursorParams, created_at_column, id_column):
+    total = None
+    if params.count:
+        total = await session.scalar(select(func.count()).select_from(query.limit(COUNT_LIMIT).subquery()))
+
+    cursor = Cursor.decode(params.cursor) if params.cursor != "" else None
+    backward = cursor is not None and cursor.direction == CursorDirection.PREVIOUS
+
+    if cursor is not None and backward:
+        query = query.where(or_(created_at_column > cursor.created_at,
+                                and_(created_at_column == cursor.created_at, id_column > cursor.id)))
+    elif cursor is not None:
+        query = query.where(or_(created_at_column < cursor.created_at,
+                                and_(created_at_column == cursor.created_at, id_column < cursor.id)))
+
+    order = asc if backward else desc
+    result = await session.execute(
+        query.order_by(order(created_at_column), order(id_column)).limit(params.size + 1)
+    )
+    items = result.all() if len(query.column_descriptions) > 1 else result.scalars().all()
+
+    has_more = len(items) > params.size
+    items = items[:params.size]
+    if backward:
+        items.reverse()
+
+    if len(items) == 0:
+        return CursorPage(items=items, next_cursor=None, previous_cursor=None, total=total)
+
+    def build_cursor(item, direction: CursorDirection):
+        entity = item[0] if isinstance(item, Row) else item
+        return Cursor(
+            created_at=getattr(entity, created_at_column.key),
+            id=getattr(entity, id_column.key),
+            direction=direction
+        ).encode()
+
+    return CursorPage(
+        items=items,
+        next_cursor=build_cursor(items[-1], CursorDirection.NEXT) if has_more or backward else None,
+        previous_cursor=(build_cursor(items[0], CursorDirection.PREVIOUS)
+                         if (has_more if backward else cursor is not None) else None),
+        total=total
     )
 
 
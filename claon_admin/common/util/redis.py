@@ -1,20 +1,93 @@
+import uuid
+
 from claon_admin.config.env import config
 from claon_admin.config.redis import redis
 
 REFRESH_TOKEN_EXPIRE_MINUTES = config.get("security.jwt.expire.refresh")
+REFRESH_KEY_INDEX_PREFIX = "refresh-keys:"
+
+# KEYS[1]: old refresh key, KEYS[2]: new refresh key / ARGV[1]: expire seconds, ARGV[2]: index prefix
+ROTATE_REFRESH_KEY_SCRIPT = """
+local user_id = redis.call('GET', KEYS[1])
+if not user_id then
+    return false
+end
+
+local index_key = ARGV[2] .. user_id
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], user_id, 'EX', ARGV[1])
+redis.call('SREM', index_key, KEYS[1])
+redis.call('SADD', index_key, KEYS[2])
+redis.call('EXPIRE', index_key, ARGV[1])
+return user_id
+"""
+
+# KEYS[1]: refresh key / ARGV[1]: index prefix
+DELETE_REFRESH_KEY_SCRIPT = """
+local user_id = redis.call('GET', KEYS[1])
+if not user_id then
+    return 0
+end
+
+redis.call('SREM', ARGV[1] .. user_id, KEYS[1])
+return redis.call('DEL', KEYS[1])
+"""
+
+# KEYS[1]: index key of user
+REVOKE_REFRESH_KEYS_SCRIPT = """
+local refresh_keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #refresh_keys, 1000 do
+    redis.call('DEL', unpack(refresh_keys, i, math.min(i + 999, #refresh_keys)))
+end
+
+redis.call('DEL', KEYS[1])
+return #refresh_keys
+"""
+
+
+def __refresh_key_index(user_id: str):
+    return REFRESH_KEY_INDEX_PREFIX + user_id
+
+
+async def save_refresh_key(refresh_key: str, user_id: str):
+    expire_seconds = REFRESH_TOKEN_EXPIRE_MINUTES * 60
+
+    async with redis.measure("save_refresh_key"), redis.get_connection() as conn:
+        async with conn.pipeline(transaction=True) as pipe:
+            pipe.set(refresh_key, user_id, ex=expire_seconds)
+            pipe.sadd(__refresh_key_index(user_id), refresh_key)
+            pipe.expire(__refresh_key_index(user_id), expire_seconds)
+            await pipe.execute()
+
+
+async def delete_refresh_key(refresh_key: str):
+    async with redis.measure("delete_refresh_key"), redis.get_connection() as conn:
+        script = conn.register_script(DELETE_REFRESH_KEY_SCRIPT)
+        await script(keys=[refresh_key], args=[REFRESH_KEY_INDEX_PREFIX])
+
+
+async def find_user_id_by_refresh_key(refresh_key: str) -> str | None:
+    async with redis.measure("find_user_id_by_refresh_key"), redis.get_connection() as conn:
+        return await conn.get(refresh_key)
+
 
+async def rotate_refresh_key(refresh_key: str) -> tuple[str | None, str | None]:
+    new_refresh_key = str(uuid.uuid4())
 
-def save_refresh_key(refresh_key: str, user_id: str):
-    with redis.get_connection() as conn:
-        conn.set(refresh_key, user_id, ex=REFRESH_TOKEN_EXPIRE_MINUTES * 60)
+    async with redis.measure("rotate_refresh_key"), redis.get_connection() as conn:
+        script = conn.register_script(ROTATE_REFRESH_KEY_SCRIPT)
+        user_id = await script(
+            keys=[refresh_key, new_refresh_key],
+            args=[REFRESH_TOKEN_EXPIRE_MINUTES * 60, REFRESH_KEY_INDEX_PREFIX]
+        )
 
+    if user_id is None:
+        return None, None
 
-def delete_refresh_key(refresh_key: str):
-    with redis.get_connection() as conn:
-        if conn.get(refresh_key) is not None:
-            conn.delete(refresh_key)
+    return user_id, new_refresh_key
 
 
-def find_user_id_by_refresh_key(refresh_key: str) -> str | None:
-    with redis.get_connection() as conn:
-        return conn.get(refresh_key)
+async def revoke_refresh_keys_by_user_id(user_id: str) -> int:
+    async with redis.measure("revoke_refresh_keys_by_user_id"), redis.get_connection() as conn:
+        script = conn.register_script(REVOKE_REFRESH_KEYS_SCRIPT)
+        return await script(keys=[__refresh_key_index(user_id)])
@@ -1,28 +1,143 @@
+from collections import defaultdict
 from typing import TypeVar, Generic, List
 
-from sqlalchemy import select
+from sqlalchemy import inspect, insert, select, and_, or_, literal
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 T = TypeVar('T')
 
+# PostgreSQL caps a statement at 32767 bind parameters, so multi-row inserts are split into chunks below it
+MAX_BIND_PARAMETERS = 32767
+
+
+def insert_on_conflict(session: AsyncSession, entity_class):
+    dialect = postgresql if session.bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(entity_class)
+
 
 class Repository(Generic[T]):
     __orig_bases__ = Generic[T]
 
+    @property
+    def entity_class(self):
+        return self.__orig_bases__[0].__args__[0]
+
     async def find_by_id(self, session: AsyncSession, entity_id):
-        entity_class = self.__orig_bases__[0].__args__[0]
-        result = await session.execute(select(entity_class).where(entity_class.id == entity_id))
-        return result.scalars().one_or_none()
+        return await session.get(self.entity_class, entity_id)
 
     async def save(self, session: AsyncSession, entity: T):
         session.add(entity)
-        await session.merge(entity)
+        await session.flush()
         return entity
 
     async def save_all(self, session: AsyncSession, entity_list: List[T]):
         session.add_all(entity_list)
-        [await session.merge(entity) for entity in entity_list]
+        await session.flush()
         return entity_list
 
+    async def insert_all(self, session: AsyncSession, entity_list: List[T]):
+        if len(entity_list) == 0:
+            return entity_list
+
+        rows = [self.__to_row(entity) for entity in entity_list]
+        primary_keys = [column.key for column in inspect(self.entity_class).primary_key]
+        if any(row.get(key) is None for row in rows for key in primary_keys):
+            return await self.save_all(session, entity_list)
+
+        for entity in entity_list:
+            if entity in session:
+                session.expunge(entity)
+
+        for chunk in self.__chunk(rows):
+            await session.execute(insert(self.entity_class).values(chunk))
+
+        for entity, row in zip(entity_list, rows):
+            make_transient_to_detached(entity)
+            session.add(entity)
+            server_defaults = [attribute.key for attribute in inspect(self.entity_class).column_attrs
+                               if attribute.columns[0].key not in row]
+            if server_defaults:
+                session.expire(entity, server_defaults)
+
+        return entity_list
+
+    async def upsert_all(self, session: AsyncSession, entity_list: List[T], index_elements: List[str]) -> List[T]:
+        if len(entity_list) == 0:
+            return []
+
+        primary_keys = [column.key for column in inspect(self.entity_class).primary_key]
+        rows = [
+            {key: value for key, value in self.__to_row(entity).items() if value is not None or key not in primary_keys}
+            for entity in entity_list
+        ]
+        returning = session.bind.dialect.name == "postgresql"
+
+        persisted = []
+        for chunk in self.__chunk(rows):
+            statement = insert_on_conflict(session, self.entity_class).values(chunk)
+            statement = statement.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={
+                    key: statement.excluded[key] for key in chunk[0].keys()
+                    if key not in index_elements + primary_keys + ["created_at"]
+                }
+            )
+
+            if returning:
+                result = await session.execute(
+                    select(self.entity_class)
+                    .from_statement(statement.returning(*inspect(self.entity_class).columns))
+                    .execution_options(populate_existing=True)
+                )
+                persisted.extend(result.scalars().all())
+            else:
+                await session.execute(statement)
+
+        if not returning:
+            keys = [{key: row[key] for key in index_elements} for row in rows]
+            for chunk in self.__chunk(keys):
+                result = await session.execute(
+                    select(self.entity_class)
+                    .where(or_(*[
+                        and_(*[
+                            column == literal(key_row[column.key], column.type)
+                            for column in inspect(self.entity_class).columns if column.key in key_row
+                        ])
+                        for key_row in chunk
+                    ]))
+                    .execution_options(populate_existing=True)
+                )
+                persisted.extend(result.scalars().all())
+        return persisted
+
     async def delete(self, session: AsyncSession, entity: T):
-        return await session.delete(entity)
+        await session.delete(entity)
+        await session.flush()
+
+    @staticmethod
+    def __chunk(rows: List[dict]):
+        # a multi-row VALUES needs the same columns in every row, so rows leaving out different columns are split
+        groups = defaultdict(list)
+        for row in rows:
+            groups[tuple(row.keys())].append(row)
+
+        for group in groups.values():
+            size = max(1, MAX_BIND_PARAMETERS // len(group[0]))
+            for i in range(0, len(group), size):
+                yield group[i:i + size]
+
+    def __to_row(self, entity: T):
+        row = {}
+        for attribute in inspect(self.entity_class).column_attrs:
+            column = attribute.columns[0]
+            value = getattr(entity, attribute.key)
+            if value is None and column.default is not None:
+                value = column.default.arg(None) if column.default.is_callable else column.default.arg
+                setattr(entity, attribute.key, value)
+            if value is None and column.server_default is not None:
+                # leave the column out so the database fills it instead of storing an explicit NULL
+                continue
+            row[column.key] = value
+        return row
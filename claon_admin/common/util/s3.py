@@ -1,46 +1,191 @@
+import asyncio
+import hashlib
 import mimetypes
 import os
 import uuid
 from datetime import datetime
-from tempfile import NamedTemporaryFile
+from typing import List, Dict, BinaryIO, Tuple
 
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 from fastapi import UploadFile
 
-from claon_admin.common.error.exception import InternalServerException, ErrorCode
+from claon_admin.common.error.exception import InternalServerException, ErrorCode, BadRequestException, \
+    NotFoundException
+from claon_admin.common.util.db import db
+from claon_admin.common.util.time import now
+from claon_admin.config.celery import celery
 from claon_admin.config.env import config
 from claon_admin.config.log import logger
 from claon_admin.config.s3 import s3
+from claon_admin.schema.file import FileObjectRepository, FileDeletionRepository
 
 AWS_S3_BUCKET = config.get("aws.s3.bucket")
 AWS_REGION = config.get("aws.region")
 
+S3_CONFIG = config.get_by_key("aws", {}).get_by_key("s3", {})
+UPLOAD_CONCURRENCY = S3_CONFIG.get_by_key("upload-concurrency", 8)
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=S3_CONFIG.get_by_key("multipart-threshold", 8 * 1024 * 1024),
+    multipart_chunksize=S3_CONFIG.get_by_key("multipart-chunksize", 8 * 1024 * 1024),
+    max_concurrency=S3_CONFIG.get_by_key("part-concurrency", 4)
+)
+
+MAX_UPLOAD_SIZE = S3_CONFIG.get_by_key("max-upload-size", 10_000_000)
+PRESIGNED_EXPIRES_IN = S3_CONFIG.get_by_key("presigned-expires-in", 300)
+DELETE_OBJECTS_BATCH_SIZE = 1000
+HASH_CHUNK_SIZE = 1024 * 1024
+
+upload_semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+file_object_repository = FileObjectRepository()
+file_deletion_repository = FileDeletionRepository()
+
+
+def get_url_prefix():
+    return "https://" + AWS_S3_BUCKET + ".s3." + AWS_REGION + ".amazonaws.com"
+
+
+def create_key_name(filename: str, domain: str, purpose: str):
+    file_extension = filename.split('.')[-1]
+    return os.path.join(domain, purpose, str(datetime.now().date()), str(uuid.uuid4()) + '.' + file_extension)
+
+
+def create_presigned_upload(filename: str, domain: str, purpose: str):
+    key_name = create_key_name(filename, domain, purpose)
+    content_type = mimetypes.guess_type(filename)[0]
+
+    try:
+        presigned_post = s3.generate_presigned_post(
+            AWS_S3_BUCKET,
+            key_name,
+            Fields={"Content-Type": content_type, "acl": "public-read"},
+            Conditions=[
+                {"Content-Type": content_type},
+                {"acl": "public-read"},
+                ["content-length-range", 1, MAX_UPLOAD_SIZE]
+            ],
+            ExpiresIn=PRESIGNED_EXPIRES_IN
+        )
+    except Exception as e:
+        raise InternalServerException(ErrorCode.INTERNAL_SERVER_ERROR, "S3 업로드 URL 생성을 실패했습니다.") from e
+
+    return presigned_post["url"], presigned_post["fields"], os.path.join(get_url_prefix(), key_name)
+
+
+async def confirm_upload(url: str, domain: str, purpose: str):
+    key_name = url.replace(get_url_prefix(), "")[1:]
+    if not url.startswith(get_url_prefix() + "/") or not key_name.startswith(os.path.join(domain, purpose) + "/"):
+        raise BadRequestException(
+            ErrorCode.INVALID_FORMAT,
+            "업로드 경로가 올바르지 않습니다."
+        )
+
+    try:
+        head = await asyncio.to_thread(s3.head_object, Bucket=AWS_S3_BUCKET, Key=key_name)
+    except ClientError as e:
+        raise NotFoundException(
+            ErrorCode.DATA_DOES_NOT_EXIST,
+            "업로드된 파일이 존재하지 않습니다."
+        ) from e
+
+    if head["ContentLength"] > MAX_UPLOAD_SIZE or head["ContentType"] != mimetypes.guess_type(key_name)[0]:
+        await delete_file(url)
+        raise BadRequestException(
+            ErrorCode.INVALID_FORMAT,
+            "업로드된 파일의 크기 또는 형식이 올바르지 않습니다."
+        )
+
+    return url
+
+
+def hash_file(file: BinaryIO) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+
+    file.seek(0)
+    while chunk := file.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    file.seek(0)
+
+    return digest.hexdigest(), size
+
 
 async def upload_file(file: UploadFile, domain: str, purpose: str):
-    file_extension = file.filename.split('.')[-1]
-    key_name = os.path.join(domain, purpose, str(datetime.now().date()), str(uuid.uuid4()) + '.' + file_extension)
+    prefix = os.path.join(domain, purpose)
+    file_hash, size = await asyncio.to_thread(hash_file, file.file)
+    async with db.async_session_maker() as session:
+        url = await file_object_repository.acquire(session, prefix, file_hash)
+        await session.commit()
+
+    if url is not None:
+        return url
+
+    url = await put_file(file, domain, purpose)
+    async with db.async_session_maker() as session:
+        stored_url = await file_object_repository.register(session, prefix, file_hash, url, size)
+        if stored_url != url:
+            await file_deletion_repository.add_all(session, [url], now())
+        await session.commit()
+
+    return stored_url
+
+
+async def put_file(file: UploadFile, domain: str, purpose: str):
+    key_name = create_key_name(file.filename, domain, purpose)
 
     try:
-        with NamedTemporaryFile() as temp_file:
-            temp_file.write(await file.read())
-            temp_file.seek(0)
-            s3.upload_fileobj(
-                temp_file,
+        await file.seek(0)
+        async with upload_semaphore:
+            await asyncio.to_thread(
+                s3.upload_fileobj,
+                file.file,
                 AWS_S3_BUCKET,
                 key_name,
-                ExtraArgs={"ContentType": mimetypes.guess_type(f"{file.filename}")[0], "ACL": "public-read"}
+                ExtraArgs={"ContentType": mimetypes.guess_type(f"{file.filename}")[0], "ACL": "public-read"},
+                Config=TRANSFER_CONFIG
             )
 
-            return os.path.join(
-                "https://" + AWS_S3_BUCKET + ".s3." + AWS_REGION + ".amazonaws.com", key_name)
+        return os.path.join(get_url_prefix(), key_name)
     except Exception as e:
         raise InternalServerException(ErrorCode.INTERNAL_SERVER_ERROR, "S3 객체 업로드를 실패했습니다.") from e
 
 
+def delete_object(url: str):
+    key_name = url.replace(get_url_prefix(), "")[1:]
+
+    s3.delete_object(Bucket=AWS_S3_BUCKET, Key=key_name)
+
+
+def delete_objects(urls: List[str]) -> Dict[str, str]:
+    key_names = {url.replace(get_url_prefix(), "")[1:]: url for url in urls}
+
+    errors = {}
+    keys = list(key_names.keys())
+    for i in range(0, len(keys), DELETE_OBJECTS_BATCH_SIZE):
+        batch = keys[i:i + DELETE_OBJECTS_BATCH_SIZE]
+        try:
+            response = s3.delete_objects(
+                Bucket=AWS_S3_BUCKET,
+                Delete={"Objects": [{"Key": key_name} for key_name in batch], "Quiet": True}
+            )
+        except Exception as e:
+            errors.update({key_names[key_name]: repr(e) for key_name in batch})
+            continue
+
+        for error in response.get("Errors", []):
+            errors[key_names[error["Key"]]] = f"{error.get('Code')}: {error.get('Message')}"
+
+    return errors
+
+
 async def delete_file(url: str):
-    prefix = "https://" + AWS_S3_BUCKET + ".s3." + AWS_REGION + ".amazonaws.com"
-    key_name = url.replace(prefix, "")[1:]
+    if celery is not None:
+        celery.send_task("claon_celery.tasks.delete_file", args=[url])
+        return
 
     try:
-        s3.delete_object(Bucket=AWS_S3_BUCKET, Key=key_name)
+        await asyncio.to_thread(delete_object, url)
     except Exception:
         logger.error("S3 객체 삭제를 실패했습니다. url: %s", url)
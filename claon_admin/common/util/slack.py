@@ -7,10 +7,11 @@ from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from claon_admin.common.util.time import now
+from claon_admin.config.celery import celery
 from claon_admin.config.env import config
 
-SLACK_TOKEN = config.get("slack.token")
-SLACK_CHANNEL = "#" + config.get("slack.channel")
+SLACK_TOKEN = config.get_by_key("slack", {}).get_by_key("token")
+SLACK_CHANNEL = "#" + config.get_by_key("slack", {}).get_by_key("channel", "")
 
 
 class SlackClient:
@@ -27,6 +28,13 @@ class SlackClient:
                ">*Request URL*\n" + ">" + request.method + " " + str(request.url) + "\n" + \
                ">*Message*\n" + ">" + message
 
+        if celery is not None:
+            celery.send_task("claon_celery.tasks.send_slack_message", args=[text])
+            return
+
+        self.send_message(text)
+
+    def send_message(self, text: str):
         try:
             self.client.chat_postMessage(channel=SLACK_CHANNEL, text=text)
         except SlackApiError as e:
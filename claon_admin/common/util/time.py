@@ -1,4 +1,4 @@
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 
 from claon_admin.common.consts import TIME_ZONE_KST
 
@@ -35,3 +35,7 @@ def get_relative_time(time: datetime = datetime.now(TIME_ZONE_KST)):
 def get_weekday(day: date):
     days = ["월", "화", "수", "목", "금", "토", "일"]
     return days[day.weekday()]
+
+
+def get_start_of_week(day: date):
+    return day - timedelta(days=day.weekday())
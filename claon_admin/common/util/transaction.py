@@ -1,35 +1,204 @@
-from claon_admin.common.util.db import db
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError, InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, ORMExecuteState
 
-async def __read_only_transactional(self, func, args, kwargs):
-    async with db.async_session_maker() as session:
-        try:
-            result = await func(self, session, *args, **kwargs)
-            return result
-        finally:
-            await session.close()
+from claon_admin.common.util.db import db, Replica
+from claon_admin.config.config import Config
+
+READ_ONLY_EXECUTION_OPTIONS = {
+    "postgresql_readonly": True,
+    "postgresql_deferrable": Config.DATABASE_CONFIG.READ_ONLY_DEFERRABLE
+}
+if Config.DATABASE_CONFIG.READ_ONLY_ISOLATION_LEVEL is not None:
+    READ_ONLY_EXECUTION_OPTIONS["isolation_level"] = Config.DATABASE_CONFIG.READ_ONLY_ISOLATION_LEVEL
+READ_ONLY = "read_only"
+
+
+@event.listens_for(Session, "before_flush")
+def refuse_read_only_flush(session: Session, flush_context, instances):
+    if session.info.get(READ_ONLY):
+        raise InvalidRequestError("Cannot flush changes in a read-only transaction")
+
+
+@event.listens_for(Session, "do_orm_execute")
+def refuse_read_only_statement(orm_execute_state: ORMExecuteState):
+    if orm_execute_state.session.info.get(READ_ONLY) and \
+            (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        raise InvalidRequestError("Cannot execute a write statement in a read-only transaction")
+
+
+class TransactionContext:
+    def __init__(self):
+        self._session: AsyncSession | None = None
+        self._replica: Replica | None = None
+        self._replica_session: AsyncSession | None = None
+        self.active_session: AsyncSession | None = None
+        self.written = False
+        self.after_commit_callbacks = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = db.async_session_maker()
+        return self._session
+
+    @property
+    def read_session(self) -> AsyncSession:
+        if self.written:
+            return self.session
+
+        if self._replica_session is None:
+            self._replica = db.next_replica()
+            if self._replica is None:
+                return self.session
+            self._replica_session = self._replica.async_session_maker()
+
+        return self._replica_session
+
+    def is_replica(self, session: AsyncSession | None) -> bool:
+        return session is not None and session is self._replica_session
+
+    async def eject_replica(self):
+        db.eject(self._replica)
+        await self._replica_session.close()
+        self._replica = None
+        self._replica_session = None
+
+    async def close(self):
+        if self._replica_session is not None:
+            await self._replica_session.close()
+        if self._session is not None:
+            await self._session.close()
+
+
+transaction_context: ContextVar[TransactionContext | None] = ContextVar("transaction_context", default=None)
+
+
+def after_commit(callback):
+    context = transaction_context.get()
+    if context is None or context.active_session is None:
+        callback()
+        return
 
+    context.after_commit_callbacks.append(callback)
+
+
+def __run_after_commit(context: TransactionContext):
+    callbacks, context.after_commit_callbacks = context.after_commit_callbacks, []
+    for callback in callbacks:
+        callback()
+
+
+async def get_session():
+    context = transaction_context.get()
+    if context is not None:
+        yield context.session
+        return
+
+    context = TransactionContext()
+    token = transaction_context.set(context)
+    try:
+        yield context.session
+    finally:
+        await context.close()
+        transaction_context.reset(token)
+
+
+@asynccontextmanager
+async def current_session():
+    context = transaction_context.get()
+    if context is not None:
+        yield context.session
+        return
 
-async def __transactional(self, func, args, kwargs):
     async with db.async_session_maker() as session:
+        yield session
+
+
+async def __begin_read_only(context: TransactionContext) -> AsyncSession:
+    while True:
+        session = context.read_session
         try:
-            result = await func(self, session, *args, **kwargs)
-            await session.commit()
-            return result
-        except Exception as e:
-            await session.rollback()
-            raise e
-        finally:
-            await session.close()
+            if session.bind.dialect.name != "postgresql":
+                await session.connection()
+                return session
+
+            if session.in_transaction():
+                await session.commit()
+
+            await session.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS)
+            return session
+        except (DBAPIError, OSError) as e:
+            if not context.is_replica(session):
+                raise e
+            await context.eject_replica()
+
+
+async def __read_only_transactional(self, context: TransactionContext, func, args, kwargs):
+    session = await __begin_read_only(context)
+    context.active_session = session
+    session.info[READ_ONLY] = True
+    try:
+        result = await func(self, session, *args, **kwargs)
+        await session.commit()
+        __run_after_commit(context)
+        return result
+    except Exception as e:
+        context.after_commit_callbacks.clear()
+        await session.rollback()
+        if isinstance(e, DBAPIError) and e.connection_invalidated and context.is_replica(session):
+            await context.eject_replica()
+        raise e
+    finally:
+        session.info.pop(READ_ONLY, None)
+
+
+async def __transactional(self, context: TransactionContext, func, args, kwargs):
+    context.written = True
+    context.active_session = context.session
+    try:
+        result = await func(self, context.session, *args, **kwargs)
+        await context.session.commit()
+        __run_after_commit(context)
+        return result
+    except Exception as e:
+        context.after_commit_callbacks.clear()
+        await context.session.rollback()
+        raise e
+
+
+async def __join_or_begin(self, context: TransactionContext, read_only: bool, func, args, kwargs):
+    active_session = context.active_session
+    if active_session is not None and (read_only or not context.is_replica(active_session)):
+        return await func(self, active_session, *args, **kwargs)
+
+    try:
+        if read_only:
+            return await __read_only_transactional(self, context, func, args, kwargs)
+        else:
+            return await __transactional(self, context, func, args, kwargs)
+    finally:
+        context.active_session = active_session
 
 
 def transactional(read_only: bool = False):
     def decorator(func):
         async def wrapper(self, *args, **kwargs):
-            if read_only:
-                return await __read_only_transactional(self, func, args, kwargs)
-            else:
-                return await __transactional(self, func, args, kwargs)
+            context = transaction_context.get()
+            if context is not None:
+                return await __join_or_begin(self, context, read_only, func, args, kwargs)
+
+            context = TransactionContext()
+            token = transaction_context.set(context)
+            try:
+                return await __join_or_begin(self, context, read_only, func, args, kwargs)
+            finally:
+                await context.close()
+                transaction_context.reset(token)
 
         return wrapper
 
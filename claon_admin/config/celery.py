@@ -0,0 +1,8 @@
+from claon_admin.config.env import config
+from claon_celery.celery import celery_client
+
+CELERY_ENABLE = config.get_by_key("celery", {}).get_by_key("enable", False)
+
+celery = None
+if CELERY_ENABLE:
+    celery = celery_client
@@ -1,23 +1,50 @@
 from os import path
 from urllib.parse import quote
 
-from claon_admin.config.env import config
+from claon_admin.config.env import config, YamlParser
+
+
+def build_database_url(database_config: YamlParser) -> str:
+    return "{driver}://{connect_info}/{db_name}".format(
+        driver=database_config.get_by_key("driver"),
+        connect_info="{user_name}:{password}@{host}:{port}".format(
+            user_name=database_config.get_by_key("user"),
+            password=quote(database_config.get_by_key("password")),
+            host=database_config.get_by_key("host"),
+            port=database_config.get_by_key("port")
+        ) if database_config.get_by_key("host") is not None else "",
+        db_name=database_config.get_by_key("name")
+    )
 
 
 class DatabaseConfig:
     def __init__(self):
-        self.DDL_AUTO = config.get_by_key("sqlalchemy", {}).get_by_key("ddl-auto", "none")
+        sqlalchemy_config = config.get_by_key("sqlalchemy", {})
+        self.DDL_AUTO = sqlalchemy_config.get_by_key("ddl-auto", "none")
+        read_only_config = sqlalchemy_config.get_by_key("read-only", {})
+        self.READ_ONLY_ISOLATION_LEVEL = read_only_config.get_by_key("isolation-level")
+        self.READ_ONLY_DEFERRABLE = read_only_config.get_by_key("deferrable", False)
         database_config = config.get_by_key("database", {})
-        self.URL = "{driver}://{connect_info}/{db_name}".format(
-            driver=database_config.get_by_key("driver"),
-            connect_info="{user_name}:{password}@{host}:{port}".format(
-                user_name=database_config.get_by_key("user"),
-                password=quote(database_config.get_by_key("password")),
-                host=database_config.get_by_key("host"),
-                port=database_config.get_by_key("port")
-            ) if database_config.get_by_key("host") is not None else "",
-            db_name=database_config.get_by_key("name")
-        ) if database_config else ""
+        self.URL = build_database_url(database_config) if database_config else ""
+        self.REPLICA_URLS = [
+            build_database_url(YamlParser({**config.get("database"), **replica_config}))
+            for replica_config in database_config.get_by_key("replicas", [])
+        ] if database_config else []
+        self.REPLICA_EJECT_SECONDS = database_config.get_by_key("replica-eject-seconds", 30) \
+            if database_config else 30
+        self.ENGINE_OPTIONS = {
+            key: value for key, value in {
+                "pool_size": sqlalchemy_config.get_by_key("pool-size"),
+                "max_overflow": sqlalchemy_config.get_by_key("max-overflow"),
+                "pool_recycle": sqlalchemy_config.get_by_key("pool-recycle"),
+                "pool_timeout": sqlalchemy_config.get_by_key("pool-timeout"),
+                "query_cache_size": sqlalchemy_config.get_by_key("query-cache-size")
+            }.items() if value is not None
+        }
+        self.POOL_PRE_PING = sqlalchemy_config.get_by_key("pool-pre-ping", True)
+        self.ECHO = sqlalchemy_config.get_by_key("echo", False)
+        self.ECHO_SAMPLE_RATE = sqlalchemy_config.get_by_key("echo-sample-rate", 1.0)
+        self.PREPARED_STATEMENT_CACHE_SIZE = sqlalchemy_config.get_by_key("prepared-statement-cache-size")
 
 
 class Config:
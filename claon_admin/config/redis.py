@@ -1,27 +1,83 @@
-import redis as redis_client
+from contextlib import asynccontextmanager
+from time import perf_counter
+
+import redis.asyncio as redis_client
 
 from claon_admin.config.env import config
 
 REDIS_ENABLE = config.get("redis.enable")
 REDIS_HOST = config.get("redis.host")
 REDIS_PORT = config.get("redis.port")
+REDIS_MAX_CONNECTIONS = config.get_by_key("redis", {}).get_by_key("max-connections", 50)
+REDIS_POOL_TIMEOUT = config.get_by_key("redis", {}).get_by_key("pool-timeout", 5)
+
+
+class RedisLatency:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+    def stats(self):
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count * 1000 if self.count > 0 else 0.0,
+            "max_ms": self.max * 1000
+        }
 
 
 class RedisClient:
-    def __init__(self, host, port):
+    def __init__(self, host=None, port=None, max_connections: int = 50, pool_timeout: float = None,
+                 connection_pool: redis_client.ConnectionPool = None):
         self.host = host
         self.port = port
-
-    def get_connection(self):
-        return redis_client.StrictRedis(
-            host=self.host,
-            port=self.port,
+        self.pool = connection_pool or redis_client.BlockingConnectionPool(
+            host=host,
+            port=port,
             db=0,
-            charset="utf-8",
+            encoding="utf-8",
             decode_responses=True,
+            max_connections=max_connections,
+            timeout=pool_timeout
         )
+        self.latency: dict[str, RedisLatency] = {}
+
+    def get_connection(self) -> redis_client.Redis:
+        return redis_client.Redis(connection_pool=self.pool)
+
+    @asynccontextmanager
+    async def measure(self, operation: str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.latency.setdefault(operation, RedisLatency()).record(perf_counter() - start)
+
+    async def close(self):
+        await self.pool.disconnect()
+
+    def stats(self):
+        return {
+            "pool": {
+                "max_connections": self.pool.max_connections,
+                "timeout": getattr(self.pool, "timeout", None),
+                "created_connections": len(getattr(self.pool, "_connections", [])),
+                "in_use_connections": self.pool.max_connections - self.pool.pool.qsize()
+            },
+            "latency": {operation: latency.stats() for operation, latency in self.latency.items()}
+        }
 
 
 redis = None
 if REDIS_ENABLE:
-    redis = RedisClient(host=REDIS_HOST, port=REDIS_PORT)
+    redis = RedisClient(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        pool_timeout=REDIS_POOL_TIMEOUT
+    )
@@ -1,4 +1,5 @@
 import boto3
+from botocore.config import Config
 
 from claon_admin.config.env import config
 
@@ -6,15 +7,17 @@ AWS_ENABLE = config.get("aws.enable")
 AWS_ACCESS_KEY = config.get("aws.access-key")
 AWS_SECRET_KEY = config.get("aws.secret-key")
 AWS_REGION = config.get("aws.region")
+AWS_MAX_ATTEMPTS = config.get_by_key("aws", {}).get_by_key("max-attempts", 5)
 
 
 class S3Client:
-    def __init__(self, aws_access_key_id, aws_secret_access_key, region_name):
+    def __init__(self, aws_access_key_id, aws_secret_access_key, region_name, max_attempts: int = 5):
         self.client = boto3.client(
             "s3",
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name,
+            config=Config(retries={"max_attempts": max_attempts, "mode": "standard"})
         )
 
 
@@ -24,4 +27,5 @@ if AWS_ENABLE:
         aws_access_key_id=AWS_ACCESS_KEY,
         aws_secret_access_key=AWS_SECRET_KEY,
         region_name=AWS_REGION,
+        max_attempts=AWS_MAX_ATTEMPTS
     ).client
@@ -5,7 +5,10 @@ from claon_admin.common import util
 from claon_admin.schema.center import CenterRepository, CenterApprovedFileRepository, CenterHoldRepository, \
     CenterWallRepository, CenterFeeRepository, ReviewRepository, ReviewAnswerRepository, CenterScheduleRepository, \
     CenterScheduleMemberRepository
-from claon_admin.schema.post import PostRepository, PostCountHistoryRepository
+from claon_admin.schema.file import FileDeletionRepository, FileObjectRepository, ImageVariantRepository
+from claon_admin.schema.job import JobRunRepository
+from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostCountTotalRepository, \
+    PostCountRollupRepository
 from claon_admin.schema.user import UserRepository, LectorRepository, LectorApprovedFileRepository
 from claon_admin.service.admin import AdminService
 from claon_admin.service.center import CenterService
@@ -30,10 +33,16 @@ class Container(containers.DeclarativeContainer):
     center_wall_repository = providers.Singleton(CenterWallRepository)
     post_repository = providers.Singleton(PostRepository)
     post_count_history_repository = providers.Singleton(PostCountHistoryRepository)
+    post_count_total_repository = providers.Singleton(PostCountTotalRepository)
+    post_count_rollup_repository = providers.Singleton(PostCountRollupRepository)
     review_repository = providers.Singleton(ReviewRepository)
     review_answer_repository = providers.Singleton(ReviewAnswerRepository)
     center_schedule_repository = providers.Singleton(CenterScheduleRepository)
     center_schedule_member_repository = providers.Singleton(CenterScheduleMemberRepository)
+    job_run_repository = providers.Singleton(JobRunRepository)
+    file_deletion_repository = providers.Singleton(FileDeletionRepository)
+    file_object_repository = providers.Singleton(FileObjectRepository)
+    image_variant_repository = providers.Singleton(ImageVariantRepository)
 
     """ Service """
     oauth_user_info_provider_supplier = providers.Singleton(OAuthUserInfoProviderSupplier)
@@ -56,7 +65,10 @@ class Container(containers.DeclarativeContainer):
         lector_repository=lector_repository,
         lector_approved_file_repository=lector_approved_file_repository,
         center_repository=center_repository,
-        center_approved_file_repository=center_approved_file_repository
+        center_approved_file_repository=center_approved_file_repository,
+        job_run_repository=job_run_repository,
+        file_deletion_repository=file_deletion_repository,
+        file_object_repository=file_object_repository
     )
 
     center_service = providers.Singleton(
@@ -68,14 +80,18 @@ class Container(containers.DeclarativeContainer):
         center_wall_repository=center_wall_repository,
         center_approved_file_repository=center_approved_file_repository,
         center_schedule_repository=center_schedule_repository,
-        center_schedule_member_repository=center_schedule_member_repository
+        center_schedule_member_repository=center_schedule_member_repository,
+        image_variant_repository=image_variant_repository
     )
 
     post_service = providers.Singleton(
         PostService,
         center_repository=center_repository,
         post_repository=post_repository,
-        post_count_history_repository=post_count_history_repository
+        post_count_history_repository=post_count_history_repository,
+        post_count_total_repository=post_count_total_repository,
+        post_count_rollup_repository=post_count_rollup_repository,
+        image_variant_repository=image_variant_repository
     )
 
     review_service = providers.Singleton(
@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import List
+
+from dependency_injector.wiring import inject, Provide
+
+from claon_admin.common.util.db import db
+from claon_admin.common.util.time import get_start_of_week
+from claon_admin.config.log import logger
+from claon_admin.container import Container
+from claon_admin.job.post import count_post_by_chunk, gather_or_raise, POST_COUNT_CHUNK_SIZE, POST_COUNT_CONCURRENCY
+from claon_admin.schema.center import CenterRepository
+from claon_admin.schema.post import PostCountTotalRepository, PostCountRollupRepository
+
+
+@inject
+async def backfill_post_count(
+        start: date,
+        end: date,
+        concurrency: int = POST_COUNT_CONCURRENCY,
+        center_repository: CenterRepository = Provide[Container.center_repository],
+        post_count_total_repository: PostCountTotalRepository = Provide[Container.post_count_total_repository],
+        post_count_rollup_repository: PostCountRollupRepository = Provide[Container.post_count_rollup_repository]
+):
+    reg_dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    period_dates = sorted({get_start_of_week(e) for e in reg_dates})
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with db.async_session_maker() as session:
+        chunks = [center_ids async for center_ids in
+                  center_repository.stream_ids_by_approved_true(session, POST_COUNT_CHUNK_SIZE)]
+
+    progress = {"done": 0, "total": len(chunks) * len(reg_dates)}
+
+    async def count_chunk(reg_date: date, center_ids: List[str]):
+        async with semaphore:
+            await count_post_by_chunk(reg_date, center_ids, refresh=False)
+
+        progress["done"] += 1
+        logger.info("[BACKFILL] %d/%d counted (%s, %d centers)",
+                    progress["done"], progress["total"], reg_date, len(center_ids))
+
+    async def refresh_chunk(center_ids: List[str]):
+        async with semaphore, db.async_session_maker() as session:
+            for period_date in period_dates:
+                await post_count_rollup_repository.refresh_by_date(session, center_ids, period_date)
+            await post_count_total_repository.rebuild_by_centers(session, center_ids)
+            await session.commit()
+
+        logger.info("[BACKFILL] refreshed rollups and totals of %d centers", len(center_ids))
+
+    await gather_or_raise([asyncio.create_task(count_chunk(reg_date, center_ids))
+                           for center_ids in chunks for reg_date in reg_dates])
+    await gather_or_raise([asyncio.create_task(refresh_chunk(center_ids)) for center_ids in chunks])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recount daily post counts for a date range")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, required=True)
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, required=True)
+    parser.add_argument("--concurrency", type=int, default=POST_COUNT_CONCURRENCY)
+    args = parser.parse_args()
+    if args.start > args.end:
+        parser.error("--from must not be after --to")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    Container().wire(modules=[__name__])
+    asyncio.run(backfill_post_count(args.start, args.end, args.concurrency))
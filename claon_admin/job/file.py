@@ -0,0 +1,59 @@
+import asyncio
+from datetime import timedelta
+
+from apscheduler.triggers.interval import IntervalTrigger
+from dependency_injector.wiring import inject, Provide
+
+from claon_admin.common.enum import FileDeletionStatus
+from claon_admin.common.util.db import db
+from claon_admin.common.util.s3 import delete_objects
+from claon_admin.common.util.time import now
+from claon_admin.config.env import config
+from claon_admin.config.log import logger
+from claon_admin.container import Container
+from claon_admin.job.post import scheduler
+from claon_admin.schema.file import FileDeletionRepository
+
+FILE_DELETION_CONFIG = config.get_by_key("job", {}).get_by_key("file-deletion", {})
+FILE_DELETION_INTERVAL_SECONDS = FILE_DELETION_CONFIG.get_by_key("interval-seconds", 60)
+FILE_DELETION_BATCH_SIZE = FILE_DELETION_CONFIG.get_by_key("batch-size", 1000)
+FILE_DELETION_MAX_ATTEMPTS = FILE_DELETION_CONFIG.get_by_key("max-attempts", 5)
+FILE_DELETION_BACKOFF_SECONDS = FILE_DELETION_CONFIG.get_by_key("backoff-seconds", 60)
+
+
+@inject
+async def delete_pending_files(
+        file_deletion_repository: FileDeletionRepository = Provide[Container.file_deletion_repository]
+):
+    async with db.async_session_maker() as session:
+        file_deletions = await file_deletion_repository.find_all_pending(session, now(), FILE_DELETION_BATCH_SIZE)
+        if len(file_deletions) == 0:
+            return {}
+
+        errors = await asyncio.to_thread(delete_objects, [file_deletion.url for file_deletion in file_deletions])
+
+        deleted_at = now()
+        for file_deletion in file_deletions:
+            file_deletion.attempt += 1
+            if file_deletion.url not in errors:
+                file_deletion.status = FileDeletionStatus.DELETED
+                file_deletion.deleted_at = deleted_at
+                file_deletion.error = None
+            elif file_deletion.attempt >= FILE_DELETION_MAX_ATTEMPTS:
+                file_deletion.status = FileDeletionStatus.FAILED
+                file_deletion.error = errors[file_deletion.url]
+            else:
+                file_deletion.next_attempt_at = deleted_at + timedelta(
+                    seconds=FILE_DELETION_BACKOFF_SECONDS * 2 ** (file_deletion.attempt - 1))
+                file_deletion.error = errors[file_deletion.url]
+
+        await session.commit()
+
+    if len(errors) > 0:
+        logger.error("[FILE] %d of %d S3 objects were not deleted: %s",
+                     len(errors), len(file_deletions), ", ".join(errors.keys()))
+    return errors
+
+
+def add_job():
+    scheduler.add_job(delete_pending_files, IntervalTrigger(seconds=FILE_DELETION_INTERVAL_SECONDS))
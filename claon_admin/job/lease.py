@@ -0,0 +1,130 @@
+import asyncio
+import os
+import socket
+import traceback
+from datetime import datetime, timedelta
+
+from apscheduler.triggers.cron import CronTrigger
+
+from claon_admin.common.consts import TIME_ZONE_KST
+from claon_admin.common.enum import JobRunStatus
+from claon_admin.common.util.db import db
+from claon_admin.common.util.time import now
+from claon_admin.config.env import config
+from claon_admin.config.log import logger
+from claon_admin.schema.job import JobRunRepository
+
+JOB_CONFIG = config.get_by_key("job", {})
+LEASE_SECONDS = JOB_CONFIG.get_by_key("lease-seconds", 3600)
+LEASE_RENEW_SECONDS = JOB_CONFIG.get_by_key("lease-renew-seconds", LEASE_SECONDS / 3)
+CATCH_UP_DAYS = JOB_CONFIG.get_by_key("catch-up-days", 7)
+OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+job_run_repository = JobRunRepository()
+
+
+class LeasedJob:
+    def __init__(self, name: str, func, trigger: CronTrigger):
+        self.name = name
+        self.func = func
+        self.trigger = trigger
+
+    def fire_times(self, after: datetime, until: datetime):
+        until = TIME_ZONE_KST.localize(until)
+        fire_times = []
+        fire_time = self.trigger.get_next_fire_time(None, TIME_ZONE_KST.localize(after) + timedelta(seconds=1))
+        while fire_time is not None and fire_time <= until:
+            fire_times.append(fire_time.astimezone(TIME_ZONE_KST).replace(tzinfo=None))
+            fire_time = self.trigger.get_next_fire_time(fire_time, fire_time + timedelta(seconds=1))
+        return fire_times
+
+    async def run(self, scheduled_at: datetime) -> JobRunStatus | None:
+        async with db.async_session_maker() as session:
+            started_at = now()
+            acquired = await job_run_repository.acquire(
+                session,
+                self.name,
+                scheduled_at,
+                OWNER,
+                started_at,
+                started_at + timedelta(seconds=LEASE_SECONDS)
+            )
+            await session.commit()
+            if not acquired:
+                return None
+
+            task = asyncio.create_task(self.func(scheduled_at))
+            heartbeat = asyncio.create_task(self.keep_lease(scheduled_at, task))
+            status, error = JobRunStatus.SUCCEEDED, None
+            try:
+                await task
+            except asyncio.CancelledError:
+                if not heartbeat.done():
+                    raise
+                return None
+            except Exception:
+                status, error = JobRunStatus.FAILED, traceback.format_exc()
+                logger.error("[JOB] %s scheduled at %s failed\n%s", self.name, scheduled_at, error)
+            finally:
+                heartbeat.cancel()
+
+            await job_run_repository.finish(session, self.name, scheduled_at, OWNER, status, now(), error)
+            await session.commit()
+            return status
+
+    async def keep_lease(self, scheduled_at: datetime, task: asyncio.Task):
+        while True:
+            await asyncio.sleep(LEASE_RENEW_SECONDS)
+            try:
+                async with db.async_session_maker() as session:
+                    renewed = await job_run_repository.renew(
+                        session,
+                        self.name,
+                        scheduled_at,
+                        OWNER,
+                        now() + timedelta(seconds=LEASE_SECONDS)
+                    )
+                    await session.commit()
+            except Exception:
+                logger.error("[JOB] %s scheduled at %s failed to renew its lease\n%s",
+                             self.name, scheduled_at, traceback.format_exc())
+                continue
+
+            if not renewed:
+                logger.error("[JOB] %s scheduled at %s lost its lease, stop running", self.name, scheduled_at)
+                task.cancel()
+                return
+
+    async def run_pending(self):
+        until = now()
+        after = until - timedelta(days=CATCH_UP_DAYS)
+        async with db.async_session_maker() as session:
+            last_scheduled_at = await job_run_repository.find_last_succeeded_scheduled_at(session, self.name)
+            retry_scheduled_at = await job_run_repository.find_all_scheduled_at_by_status(
+                session,
+                self.name,
+                JobRunStatus.FAILED,
+                after
+            )
+
+        if last_scheduled_at is None:
+            fire_times = self.fire_times(after, until)[-1:]
+        else:
+            fire_times = self.fire_times(max(last_scheduled_at, after), until)
+
+        failed = []
+        for scheduled_at in sorted(set(fire_times) | set(retry_scheduled_at)):
+            status = await self.run(scheduled_at)
+            if status is None:
+                logger.info("[JOB] %s scheduled at %s is skipped, another owner holds the lease",
+                            self.name, scheduled_at)
+            elif status == JobRunStatus.FAILED:
+                failed.append(scheduled_at)
+        return failed
+
+    async def catch_up(self):
+        async with db.async_session_maker() as session:
+            last_scheduled_at = await job_run_repository.find_last_succeeded_scheduled_at(session, self.name)
+
+        if last_scheduled_at is not None:
+            await self.run_pending()
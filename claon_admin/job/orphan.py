@@ -0,0 +1,163 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from tempfile import TemporaryDirectory
+from typing import Iterable, List, Set
+from urllib.parse import urlparse, unquote
+
+from sqlalchemy import select
+
+from claon_admin.common.util.db import db
+from claon_admin.common.util import s3 as s3_util
+from claon_admin.common.util.time import now
+from claon_admin.config.env import config
+from claon_admin.config.log import logger
+from claon_admin.schema.center import Center, CenterApprovedFile
+from claon_admin.schema.file import FileObjectRepository, ImageVariant, ImageVariantRepository
+from claon_admin.schema.post import Post
+from claon_admin.schema.user import User, LectorApprovedFile
+
+ORPHAN_FILE_CONFIG = config.get_by_key("job", {}).get_by_key("orphan-file", {})
+ORPHAN_FILE_GRACE_DAYS = ORPHAN_FILE_CONFIG.get_by_key("grace-days", 7)
+ORPHAN_FILE_PREFIXES = ["center/", "lector/", "user/"]
+REFERENCE_CHUNK_SIZE = 1000
+LOOKUP_CHUNK_SIZE = 500
+
+REFERENCE_COLUMNS = [
+    (Center.profile_img, False),
+    (Center.__table__.c["_center_img"], True),
+    (Center.__table__.c["_fee_img"], True),
+    (CenterApprovedFile.url, False),
+    (LectorApprovedFile.url, False),
+    (User.profile_img, False),
+    (Post.__table__.c["_img"], True)
+]
+
+file_object_repository = FileObjectRepository()
+image_variant_repository = ImageVariantRepository()
+
+
+def to_key(url: str) -> str:
+    return unquote(urlparse(url).path).lstrip("/")
+
+
+class ReferenceSet:
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS reference (key TEXT PRIMARY KEY)")
+
+    def add_all(self, urls: Iterable[str]):
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO reference (key) VALUES (?)",
+            [(to_key(url),) for url in urls if url]
+        )
+        self.connection.commit()
+
+    def find_referenced(self, keys: List[str]) -> Set[str]:
+        referenced = set()
+        for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[i:i + LOOKUP_CHUNK_SIZE]
+            rows = self.connection.execute(
+                f"SELECT key FROM reference WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            referenced.update(row[0] for row in rows)
+        return referenced
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM reference").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+
+def to_urls(value: str | None, is_json: bool) -> List[str]:
+    if value is None:
+        return []
+
+    if is_json:
+        return [e["url"] for e in json.loads(value) if e.get("url")]
+
+    return [value]
+
+
+async def collect_references(reference_set: ReferenceSet, acquired_after: datetime):
+    async with db.async_session_maker() as session:
+        for column, is_json in REFERENCE_COLUMNS:
+            result = await session.stream(select(column))
+            async for partition in result.scalars().partitions(REFERENCE_CHUNK_SIZE):
+                reference_set.add_all(url for value in partition for url in to_urls(value, is_json))
+
+        reference_set.add_all(await file_object_repository.find_urls_acquired_after(session, acquired_after))
+
+        result = await session.stream(select(ImageVariant))
+        async for partition in result.scalars().partitions(REFERENCE_CHUNK_SIZE):
+            referenced = reference_set.find_referenced([to_key(e.url) for e in partition])
+            reference_set.add_all(url for e in partition if to_key(e.url) in referenced
+                                  for url in [e.thumbnail_url, e.webp_url])
+
+
+async def collect_orphan_files(grace_days: int = ORPHAN_FILE_GRACE_DAYS, dry_run: bool = False):
+    modified_before = datetime.now(timezone.utc) - timedelta(days=grace_days)
+    acquired_after = now() - timedelta(days=grace_days)
+    stats = {"scanned": 0, "orphaned": 0, "deleted": 0, "failed": 0}
+
+    with TemporaryDirectory() as directory:
+        reference_set = ReferenceSet(os.path.join(directory, "reference.db"))
+        try:
+            await collect_references(reference_set, acquired_after)
+            logger.info("[ORPHAN] %d referenced files", reference_set.count())
+
+            paginator = s3_util.s3.get_paginator("list_objects_v2")
+            for prefix in ORPHAN_FILE_PREFIXES:
+                pages = iter(paginator.paginate(Bucket=s3_util.AWS_S3_BUCKET, Prefix=prefix))
+                while (page := await asyncio.to_thread(next, pages, None)) is not None:
+                    contents = page.get("Contents", [])
+                    stats["scanned"] += len(contents)
+
+                    keys = [e["Key"] for e in contents if e["LastModified"] < modified_before]
+                    referenced = reference_set.find_referenced(keys)
+                    orphans = [s3_util.get_url_prefix() + "/" + key for key in keys if key not in referenced]
+                    stats["orphaned"] += len(orphans)
+                    if dry_run or len(orphans) == 0:
+                        continue
+
+                    # Remove the dedup rows first so that a file acquired after the references were collected
+                    # keeps its row and is left out of the S3 delete below
+                    async with db.async_session_maker() as session:
+                        deletable = await file_object_repository.delete_unacquired_by_urls(session, orphans,
+                                                                                           acquired_after)
+                        await session.commit()
+                    if len(deletable) == 0:
+                        continue
+
+                    errors = await asyncio.to_thread(s3_util.delete_objects, deletable)
+                    async with db.async_session_maker() as session:
+                        deleted = [url for url in deletable if url not in errors]
+                        await image_variant_repository.delete_by_urls(session, deleted)
+                        await session.commit()
+
+                    stats["deleted"] += len(deletable) - len(errors)
+                    stats["failed"] += len(errors)
+                    for url, error in errors.items():
+                        logger.error("[ORPHAN] failed to delete %s: %s", url, error)
+        finally:
+            reference_set.close()
+
+    logger.info("[ORPHAN] scanned %d, orphaned %d, deleted %d, failed %d%s",
+                stats["scanned"], stats["orphaned"], stats["deleted"], stats["failed"], " (dry run)" if dry_run else "")
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete uploaded files no longer referenced by any row")
+    parser.add_argument("--grace-days", type=int, default=ORPHAN_FILE_GRACE_DAYS)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    asyncio.run(collect_orphan_files(args.grace_days, args.dry_run))
@@ -1,39 +1,103 @@
-from datetime import timedelta
+import asyncio
+from datetime import timedelta, datetime, date, time
+from typing import List
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
 from dependency_injector.wiring import inject, Provide
 
+from claon_admin.common.consts import TIME_ZONE_KST
 from claon_admin.common.util.db import db
-from claon_admin.common.util.time import now
+from claon_admin.config.env import config
 from claon_admin.container import Container
+from claon_admin.job.lease import LeasedJob
 from claon_admin.schema.center import CenterRepository
-from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostCountHistory
+from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostCountHistory, \
+    PostCountTotalRepository, PostCountRollupRepository
+
+POST_COUNT_CONFIG = config.get_by_key("job", {}).get_by_key("post-count", {})
+POST_COUNT_CHUNK_SIZE = POST_COUNT_CONFIG.get_by_key("chunk-size", 500)
+POST_COUNT_CONCURRENCY = POST_COUNT_CONFIG.get_by_key("concurrency", 4)
 
 scheduler = AsyncIOScheduler()
 
 
+async def gather_or_raise(tasks: List[asyncio.Task]):
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, Exception):
+            raise result
+
+
 @inject
-async def count_post_by_day(
-        center_repository: CenterRepository = Provide[Container.center_repository],
+async def count_post_by_chunk(
+        reg_date: date,
+        center_ids: List[str],
+        refresh: bool = True,
         post_repository: PostRepository = Provide[Container.post_repository],
-        post_count_history_repository: PostCountHistoryRepository = Provide[Container.post_count_history_repository]
+        post_count_history_repository: PostCountHistoryRepository = Provide[Container.post_count_history_repository],
+        post_count_total_repository: PostCountTotalRepository = Provide[Container.post_count_total_repository],
+        post_count_rollup_repository: PostCountRollupRepository = Provide[Container.post_count_rollup_repository]
 ):
     async with db.async_session_maker() as session:
-        center_ids = await center_repository.find_all_ids_by_approved_true(session)
+        post_count_by_center = await post_repository.count_by_center_and_date(
+            session,
+            center_ids,
+            reg_date,
+            reg_date + timedelta(days=1)
+        )
 
-        end_date = now().date()
-        start_date = end_date - timedelta(days=1)
-        post_count_by_center = await post_repository.count_by_center_and_date(session, center_ids, start_date, end_date)
-
-        await post_count_history_repository.save_all(session, [PostCountHistory(
+        await post_count_history_repository.upsert_all(session, [PostCountHistory(
             center_id=center_id,
             count=count,
-            reg_date=start_date
-        ) for center_id, count in post_count_by_center])
+            reg_date=datetime.combine(reg_date, time.min)
+        ) for center_id, count in post_count_by_center.items()], ["center_id", "reg_date"])
+        zeroed_center_ids = await post_count_history_repository.delete_by_centers_and_date(
+            session,
+            [center_id for center_id in center_ids if center_id not in post_count_by_center],
+            reg_date
+        )
+
+        if refresh:
+            changed_center_ids = list(post_count_by_center.keys()) + zeroed_center_ids
+            await post_count_total_repository.rebuild_by_centers(session, changed_center_ids)
+            await post_count_rollup_repository.refresh_by_date(session, changed_center_ids, reg_date)
+
+        await session.commit()
+
+
+@inject
+async def count_post_by_date(
+        reg_date: date,
+        center_repository: CenterRepository = Provide[Container.center_repository]
+):
+    semaphore = asyncio.Semaphore(POST_COUNT_CONCURRENCY)
+
+    async def count_chunk(center_ids: List[str]):
+        async with semaphore:
+            await count_post_by_chunk(reg_date, center_ids)
+
+    tasks = []
+    async with db.async_session_maker() as session:
+        async for center_ids in center_repository.stream_ids_by_approved_true(session, POST_COUNT_CHUNK_SIZE):
+            tasks.append(asyncio.create_task(count_chunk(center_ids)))
+
+    await gather_or_raise(tasks)
+
+
+async def count_post_by_day(scheduled_at: datetime):
+    await count_post_by_date(scheduled_at.date() - timedelta(days=1))
+
+
+count_post_by_day_job = LeasedJob(
+    "count_post_by_day",
+    count_post_by_day,
+    CronTrigger(hour=0, minute=0, second=0, timezone=TIME_ZONE_KST)
+)
 
 
 def add_job():
-    scheduler.add_job(count_post_by_day, "cron", hour=0, minute=0, second=0)
+    scheduler.add_job(count_post_by_day_job.run_pending, count_post_by_day_job.trigger)
+    scheduler.add_job(count_post_by_day_job.catch_up)
 
 
 def start():
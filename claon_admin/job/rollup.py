@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import timedelta, datetime, time
+from typing import List
+
+from dependency_injector.wiring import inject, Provide
+
+from claon_admin.common.enum import PostCountPeriod
+from claon_admin.common.util.db import db
+from claon_admin.common.util.time import now, get_start_of_week
+from claon_admin.config.log import logger
+from claon_admin.container import Container
+from claon_admin.schema.center import CenterRepository
+from claon_admin.schema.post import PostRepository, PostCountHistoryRepository, PostCountHistory, \
+    PostCountTotalRepository, PostCountTotal, PostCountRollupRepository, PostCountRollup
+
+
+@inject
+async def rebuild_post_count(
+        center_ids: List[str] | None = None,
+        center_repository: CenterRepository = Provide[Container.center_repository],
+        post_repository: PostRepository = Provide[Container.post_repository],
+        post_count_history_repository: PostCountHistoryRepository = Provide[Container.post_count_history_repository],
+        post_count_total_repository: PostCountTotalRepository = Provide[Container.post_count_total_repository],
+        post_count_rollup_repository: PostCountRollupRepository = Provide[Container.post_count_rollup_repository]
+):
+    end_date = now().date()
+    async with db.async_session_maker() as session:
+        if center_ids is None:
+            center_ids = await center_repository.find_all_ids_by_approved_true(session)
+
+        for center_id in center_ids:
+            count_by_day = await post_repository.count_by_center_per_day(session, center_id, end_date)
+
+            count_by_period = defaultdict(int)
+            for day, count in count_by_day.items():
+                count_by_period[(PostCountPeriod.WEEK, get_start_of_week(day))] += count
+
+            await post_count_history_repository.delete_by_center(session, center_id)
+            await post_count_rollup_repository.delete_by_center(session, center_id)
+            await post_count_total_repository.delete_by_center(session, center_id)
+
+            await post_count_history_repository.insert_all(session, [
+                PostCountHistory(center_id=center_id, count=count, reg_date=datetime.combine(day, time.min))
+                for day, count in sorted(count_by_day.items())
+            ])
+            await post_count_rollup_repository.insert_all(session, [
+                PostCountRollup(center_id=center_id, period=period, reg_date=reg_date, count=count)
+                for (period, reg_date), count in count_by_period.items()
+            ])
+            if count_by_day:
+                await post_count_total_repository.insert_all(session, [PostCountTotal(
+                    center_id=center_id,
+                    count=sum(count_by_day.values()),
+                    first_reg_date=min(count_by_day),
+                    last_reg_date=end_date - timedelta(days=1)
+                )])
+
+            await session.commit()
+            logger.info("[ROLLUP] center: %s, days: %d", center_id, len(count_by_day))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild post count rollups from posts")
+    parser.add_argument("--center-id", action="append", dest="center_ids")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    Container().wire(modules=[__name__])
+    asyncio.run(rebuild_post_count(args.center_ids))
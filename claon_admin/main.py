@@ -2,15 +2,20 @@ import asyncio
 
 import nest_asyncio
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
 from starlette.middleware.sessions import SessionMiddleware
 
 from claon_admin.common.error.handler import add_http_exception_handler
 from claon_admin.common.util.db import db
+from claon_admin.common.util.image import shutdown_executor
+from claon_admin.common.util.transaction import get_session
+from claon_admin.config.celery import celery
 from claon_admin.config.config import Config
+from claon_admin.config.redis import redis
 from claon_admin.container import Container
+from claon_admin.job import file as job_file
 from claon_admin.job import post as job_post
 from claon_admin.middleware.file import LimitUploadSize
 from claon_admin.middleware.log import LoggerMiddleware
@@ -20,7 +25,7 @@ nest_asyncio.apply()
 
 
 def create_app() -> FastAPI:
-    claon_app = FastAPI()
+    claon_app = FastAPI(dependencies=[Depends(get_session)])
 
     """ Define Container """
     container = Container()
@@ -64,12 +69,19 @@ async def startup():
     asyncio.run(db.create_database())
 
     """ Initialize Job """
-    job_post.start()
+    if celery is None:
+        job_file.add_job()
+        job_post.start()
 
 
 @app.on_event("shutdown")
 async def shutdown():
-    job_post.shutdown()
+    if celery is None:
+        job_post.shutdown()
+        shutdown_executor()
+
+    if redis is not None:
+        await redis.close()
 
 if __name__ == "__main__":
     uvicorn.run('main:app', host='0.0.0.0', port=8000, reload=True)
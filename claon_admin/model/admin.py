@@ -1,11 +1,13 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List
 
 from pydantic import BaseModel
 
-from claon_admin.common.enum import WallType, CenterFeeType, PeriodType
+from claon_admin.common.enum import WallType, CenterFeeType, PeriodType, JobRunStatus, FileDeletionStatus
 from claon_admin.model.user import UserProfileResponseDto
 from claon_admin.schema.center import Center, CenterApprovedFile
+from claon_admin.schema.file import FileDeletion
+from claon_admin.schema.job import JobRun
 from claon_admin.schema.user import Lector, LectorApprovedFile
 
 
@@ -144,3 +146,51 @@ class LectorResponseDto(BaseModel):
             ) for e in lector.career],
             proof_list=[e.url for e in approved_files]
         )
+
+
+class JobRunResponseDto(BaseModel):
+    job_run_id: str
+    job_name: str
+    scheduled_at: datetime
+    status: JobRunStatus
+    owner: str
+    attempt: int
+    started_at: datetime
+    finished_at: datetime | None
+    error: str | None
+
+    @classmethod
+    def from_entity(cls, entity: JobRun):
+        return cls(
+            job_run_id=entity.id,
+            job_name=entity.job_name,
+            scheduled_at=entity.scheduled_at,
+            status=entity.status,
+            owner=entity.owner,
+            attempt=entity.attempt,
+            started_at=entity.started_at,
+            finished_at=entity.finished_at,
+            error=entity.error
+        )
+
+
+class FileDeletionResponseDto(BaseModel):
+    file_deletion_id: str
+    url: str
+    status: FileDeletionStatus
+    attempt: int
+    next_attempt_at: datetime
+    deleted_at: datetime | None
+    error: str | None
+
+    @classmethod
+    def from_entity(cls, entity: FileDeletion):
+        return cls(
+            file_deletion_id=entity.id,
+            url=entity.url,
+            status=entity.status,
+            attempt=entity.attempt,
+            next_attempt_at=entity.next_attempt_at,
+            deleted_at=entity.deleted_at,
+            error=entity.error
+        )
@@ -19,6 +19,10 @@ class RequestUser(BaseModel):
         return self.role == Role.ADMIN
 
 
+class RefreshUser(RequestUser):
+    refresh_key: str
+
+
 class OAuthUserInfoDto(BaseModel):
     oauth_id: str
     sns_email: str
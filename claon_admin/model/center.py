@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import List, Dict
 
 from pydantic import BaseModel, validator
 
@@ -115,6 +115,7 @@ class CenterFeeDetailResponseDto(BaseModel):
 
 
 class CenterHoldDto(BaseModel):
+    hold_id: str | None = None
     difficulty: str
     name: str
 
@@ -137,6 +138,7 @@ class CenterHoldInfoDto(BaseModel):
 
 
 class CenterWallDto(BaseModel):
+    wall_id: str | None = None
     wall_type: WallType
     name: str
 
@@ -154,10 +156,11 @@ class CenterNameResponseDto(BaseModel):
     address: str
 
     @classmethod
-    def from_entity(cls, entity: Center):
+    def from_entity(cls, entity: Center, thumbnails: Dict[str, str] | None = None):
+        thumbnails = thumbnails or {}
         return cls(
             center_id=entity.id,
-            profile_image=entity.profile_img,
+            profile_image=thumbnails.get(entity.profile_img, entity.profile_img),
             name=entity.name,
             address=entity.address
         )
@@ -344,11 +347,12 @@ class CenterResponseDto(BaseModel):
             fee_list=[CenterFeeResponseDto.from_entity(e) for e in fees or []],
             hold_info=CenterHoldInfoDto(
                 is_color=holds[0].is_color,
-                hold_list=[CenterHoldDto(difficulty=e.difficulty, name=e.name)
+                hold_list=[CenterHoldDto(hold_id=e.id, difficulty=e.difficulty, name=e.name)
                            for e in holds or []]
             ) if holds else None,
             wall_list=[
                 CenterWallDto(
+                    wall_id=e.id,
                     wall_type=WallType.BOULDERING if e.type == "bouldering" else WallType.ENDURANCE,
                     name=e.name
                 ) for e in walls or []
@@ -371,14 +375,15 @@ class CenterBriefResponseDto(BaseModel):
 
     # TODO: Need to modify matching/member/lector count after plan for matching and member
     @classmethod
-    def from_entity(cls, entity: Center):
+    def from_entity(cls, entity: Center, thumbnails: Dict[str, str] | None = None):
+        thumbnails = thumbnails or {}
         return cls(
             center_id=entity.id,
-            profile_image=entity.profile_img,
+            profile_image=thumbnails.get(entity.profile_img, entity.profile_img),
             name=entity.name,
             address=entity.address,
             detail_address=entity.detail_address,
-            image_list=[e.url for e in entity.center_img],
+            image_list=[thumbnails.get(e.url, e.url) for e in entity.center_img],
             lector_count=0,
             member_count=0,
             matching_count=0,
@@ -1,5 +1,21 @@
+from typing import Dict
+
 from pydantic import BaseModel
 
 
 class UploadFileResponseDto(BaseModel):
     file_url: str
+
+
+class PresignedUploadRequestDto(BaseModel):
+    filename: str
+
+
+class PresignedUploadResponseDto(BaseModel):
+    url: str
+    fields: Dict[str, str]
+    file_url: str
+
+
+class UploadConfirmRequestDto(BaseModel):
+    file_url: str
@@ -1,12 +1,12 @@
 from datetime import timedelta, date
-from typing import List
+from typing import List, Dict
 
-import pandas as pd
 from pydantic import BaseModel, root_validator
 
+from claon_admin.common.util.bucket import group_by_day, sum_by_windows, fill_days, fill_weeks
 from claon_admin.common.util.time import get_relative_time, get_weekday
 from claon_admin.schema.center import Post, Center
-from claon_admin.schema.post import PostCountHistory
+from claon_admin.schema.post import PostCountHistory, PostCountTotal, PostCountRollup
 
 
 class PostBriefResponseDto(BaseModel):
@@ -19,15 +19,16 @@ class PostBriefResponseDto(BaseModel):
     user_profile_image: str
 
     @classmethod
-    def from_entity(cls, entity: Post):
+    def from_entity(cls, entity: Post, thumbnails: Dict[str, str] | None = None):
+        thumbnails = thumbnails or {}
         return cls(
             post_id=entity.id,
             content=entity.content,
-            image=entity.img[0].url,
+            image=thumbnails.get(entity.img[0].url, entity.img[0].url),
             created_at=get_relative_time(entity.created_at),
             user_id=entity.user.id,
             user_nickname=entity.user.nickname,
-            user_profile_image=entity.user.profile_img
+            user_profile_image=thumbnails.get(entity.user.profile_img, entity.user.profile_img)
         )
 
 
@@ -49,74 +50,42 @@ class PostSummaryResponseDto(BaseModel):
     @classmethod
     def from_entity(cls,
                     center: Center,
+                    first_reg_date: date | None,
                     end_date: date,
-                    count_total: int,
-                    count_history_by_year: List[PostCountHistory]):
-        if not count_history_by_year:
+                    count_total: PostCountTotal | None,
+                    count_history_by_month: List[PostCountHistory],
+                    count_rollup_by_week: List[PostCountRollup]):
+        if first_reg_date is None:
             return cls(
                 center_id=center.id,
                 center_name=center.name,
                 count_today=0,
                 count_week=0,
                 count_month=0,
-                count_total=count_total,
+                count_total=0 if count_total is None else count_total.count,
                 count_per_day=[],
                 count_per_week=[]
             )
 
-        count_by_month, count_by_week, count_by_day = cls.__count_history(end_date, count_history_by_year)
-        data_per_day, data_per_week = cls.__get_data_per_period(end_date, count_history_by_year)
+        count_per_day = group_by_day((history.reg_date, history.count) for history in count_history_by_month)
+        count_per_week = group_by_day((rollup.reg_date, rollup.count) for rollup in count_rollup_by_week)
+        count_today, count_week, count_month = sum_by_windows(count_per_day, end_date, [1, 7, 4 * 7])
+
+        data_per_day = fill_days(count_per_day, max(first_reg_date, end_date - timedelta(days=7)), end_date)
+        data_per_week = fill_weeks(count_per_week, first_reg_date, end_date)
 
         return cls(
             center_id=center.id,
             center_name=center.name,
-            count_today=sum([history.count for history in count_by_day]),
-            count_week=sum([history.count for history in count_by_week]),
-            count_month=sum([history.count for history in count_by_month]),
-            count_total=count_total,
-            count_per_day=[PostCount(unit=get_weekday(day), count=data_per_day[day])
-                           for day in data_per_day],
-            count_per_week=[PostCount(unit=week.strftime("%Y-%m-%d"), count=data_per_week[week])
-                            for week in data_per_week]
+            count_today=count_today,
+            count_week=count_week,
+            count_month=count_month,
+            count_total=0 if count_total is None else count_total.count,
+            count_per_day=[PostCount(unit=get_weekday(day), count=count) for day, count in data_per_day.items()],
+            count_per_week=[PostCount(unit=week.strftime("%Y-%m-%d"), count=count)
+                            for week, count in data_per_week.items()]
         )
 
-    @classmethod
-    def __count_history(cls, standard_date: date, history_list: List[PostCountHistory]):
-        count_by_month = list(filter(lambda x: standard_date - timedelta(days=4 * 7) <= x.reg_date < standard_date,
-                                     history_list))
-        count_by_week = list(filter(lambda x: standard_date - timedelta(days=7) <= x.reg_date < standard_date,
-                                    count_by_month))
-        count_by_day = list(filter(lambda x: standard_date - timedelta(days=1) <= x.reg_date < standard_date,
-                                   count_by_week))
-
-        return count_by_month, count_by_week, count_by_day
-
-    @classmethod
-    def __get_data_per_period(cls, end_date: date, history_list: List[PostCountHistory]):
-        start_date = history_list[0].reg_date
-
-        data = []
-        for history in history_list:
-            data.append({
-                'reg_date': history.reg_date,
-                'count': history.count
-            })
-
-        data_default = pd.DataFrame(pd.date_range(start_date, end_date - timedelta(days=1), freq="D"),
-                                    columns=["reg_date"]).fillna(0)
-        data_per_week = pd.DataFrame(data)
-        data_per_week.reg_date = data_per_week.reg_date.astype("datetime64[ns]")
-        data_per_week = pd.merge(data_default, data_per_week, on="reg_date", how="left").fillna(0).set_index("reg_date")
-        data_per_day = data_per_week.iloc[-7:].T.to_dict("records")[0]
-        data_per_week = data_per_week.resample("W")["count"].sum().to_frame()
-
-        if end_date.weekday() > 0:
-            data_per_week = data_per_week[0:-1]
-
-        data_per_week = data_per_week.T.to_dict("records")[0]
-
-        return data_per_day, data_per_week
-
 
 class PostCommentResponseDto(BaseModel):
     user_id: str
@@ -71,6 +71,7 @@ class JwtResponseDto(BaseModel):
 
 class JwtReissueDto(BaseModel):
     access_token: str
+    refresh_key: str
 
 
 class LectorContestDto(BaseModel):
@@ -2,11 +2,14 @@ from typing import List
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
+from fastapi_pagination import Params
 from fastapi_utils.cbv import cbv
 
 from claon_admin.common.util.auth import AdminUser
+from claon_admin.common.util.pagination import Pagination
 from claon_admin.container import Container
-from claon_admin.model.admin import LectorResponseDto, CenterResponseDto
+from claon_admin.common.enum import FileDeletionStatus
+from claon_admin.model.admin import LectorResponseDto, CenterResponseDto, JobRunResponseDto, FileDeletionResponseDto
 from claon_admin.service.admin import AdminService
 
 router = APIRouter()
@@ -52,3 +55,17 @@ class AdminRouter:
                             subject: AdminUser,
                             center_id: str):
         return await self.admin_service.reject_center(center_id)
+
+    @router.get('/jobs/runs', response_model=Pagination[JobRunResponseDto])
+    async def find_job_runs(self,
+                            subject: AdminUser,
+                            job_name: str | None = None,
+                            params: Params = Depends()):
+        return await self.admin_service.find_job_runs(params, job_name)
+
+    @router.get('/files/deletions', response_model=Pagination[FileDeletionResponseDto])
+    async def find_file_deletions(self,
+                                  subject: AdminUser,
+                                  status: FileDeletionStatus | None = None,
+                                  params: Params = Depends()):
+        return await self.admin_service.find_file_deletions(params, status)
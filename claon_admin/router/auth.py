@@ -37,6 +37,11 @@ class AuthRouter:
                             subject: CurrentRefreshUser):
         return await self.user_service.reissue_token(subject)
 
+    @router.post('/sign-out')
+    async def sign_out(self,
+                       subject: CurrentUser):
+        return await self.user_service.sign_out(subject)
+
     @router.post('/center/sign-up', response_model=CenterResponseDto)
     async def center_sign_up(self,
                              subject: CurrentUser,
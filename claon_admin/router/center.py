@@ -6,13 +6,14 @@ from fastapi_pagination import Params
 from fastapi_utils.cbv import cbv
 
 from claon_admin.common.util.auth import CenterAdminUser, CurrentUser
-from claon_admin.common.util.pagination import Pagination
+from claon_admin.common.util.pagination import Pagination, PageParams
 from claon_admin.container import Container
 from claon_admin.model.center import CenterNameResponseDto, CenterResponseDto, CenterUpdateRequestDto, \
     CenterBriefResponseDto, CenterCreateRequestDto, CenterFeeDetailResponseDto, CenterFeeDetailRequestDto, \
     CenterMemberFinder
 from claon_admin.common.enum import CenterUploadPurpose, CenterFeeUploadPurpose
-from claon_admin.model.file import UploadFileResponseDto
+from claon_admin.model.file import UploadFileResponseDto, PresignedUploadRequestDto, PresignedUploadResponseDto, \
+    UploadConfirmRequestDto
 from claon_admin.model.membership import CenterMemberSummaryResponseDto, CenterMemberBriefResponseDto, \
     CenterMemberDetailResponseDto, MembershipSummaryResponseDto, MembershipResponseDto, MembershipFinder
 from claon_admin.model.post import PostResponseDto, PostSummaryResponseDto, PostCommentResponseDto, \
@@ -56,6 +57,20 @@ class CenterRouter:
                      file: UploadFile = File(...)):
         return await self.center_service.upload_file(purpose, file)
 
+    @router.post('/{purpose}/file/presigned', response_model=PresignedUploadResponseDto)
+    async def create_upload_url(self,
+                                subject: CurrentUser,
+                                purpose: CenterUploadPurpose,
+                                req: PresignedUploadRequestDto):
+        return await self.center_service.create_upload_url(purpose, req.filename)
+
+    @router.post('/{purpose}/file/confirm', response_model=UploadFileResponseDto)
+    async def confirm_upload(self,
+                             subject: CurrentUser,
+                             purpose: CenterUploadPurpose,
+                             req: UploadConfirmRequestDto):
+        return await self.center_service.confirm_upload(purpose, req.file_url)
+
     @router.get('/', response_model=Pagination[CenterBriefResponseDto])
     async def find_centers(self,
                            subject: CenterAdminUser,
@@ -97,16 +112,16 @@ class CenterRouter:
     async def find_posts_by_center(self,
                                    subject: CenterAdminUser,
                                    center_id: str,
-                                   finder: PostFinder = Depends(),
-                                   params: Params = Depends()):
+                                   params: PageParams,
+                                   finder: PostFinder = Depends()):
         return await self.post_service.find_posts_by_center(subject, params, center_id, finder)
 
     @router.get('/{center_id}/reviews', response_model=Pagination[ReviewBriefResponseDto])
     async def find_reviews_by_center(self,
                                      subject: CenterAdminUser,
                                      center_id: str,
-                                     finder: ReviewFinder = Depends(),
-                                     params: Params = Depends()):
+                                     params: PageParams,
+                                     finder: ReviewFinder = Depends()):
         return await self.review_service.find_reviews_by_center(subject, params, center_id, finder)
 
     @router.get('/{center_id}/posts/summary', response_model=PostSummaryResponseDto)
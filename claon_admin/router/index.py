@@ -4,7 +4,10 @@ from os import environ
 from fastapi import APIRouter, WebSocket, Request
 from starlette.templating import Jinja2Templates
 
+from claon_admin.common.util.cache import user_cache
+from claon_admin.common.util.db import db
 from claon_admin.config.config import Config
+from claon_admin.config.redis import redis
 
 router = APIRouter()
 
@@ -55,3 +58,19 @@ async def get(request: Request):
         "domain": request.client.host
     }
     return templates.TemplateResponse("log.html", {"request": request, "context": context})
+
+
+@router.get("/metrics")
+async def get_metrics():
+    return {
+        "user_cache": user_cache.stats(),
+        "redis": redis.stats() if redis is not None else None
+    }
+
+
+@router.get("/health")
+async def get_health():
+    return {
+        "status": "ok",
+        "database": db.stats()
+    }
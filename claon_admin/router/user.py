@@ -2,15 +2,15 @@ from typing import List
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, UploadFile, File
-from fastapi_pagination import Params
 from fastapi_utils.cbv import cbv
 
 from claon_admin.common.enum import LectorUploadPurpose
 from claon_admin.common.util.auth import CurrentUser
-from claon_admin.common.util.pagination import Pagination
+from claon_admin.common.util.pagination import Pagination, PageParams
 from claon_admin.container import Container
 from claon_admin.model.auth import RequestUser
-from claon_admin.model.file import UploadFileResponseDto
+from claon_admin.model.file import UploadFileResponseDto, PresignedUploadRequestDto, PresignedUploadResponseDto, \
+    UploadConfirmRequestDto
 from claon_admin.model.user import CenterNameResponseDto, UserNameResponseDto
 from claon_admin.service.user import UserService
 
@@ -36,6 +36,18 @@ class UserRouter:
                              file: UploadFile = File(...)):
         return await self.user_service.upload_profile(file)
 
+    @router.post('/profile/presigned', response_model=PresignedUploadResponseDto)
+    async def create_profile_upload_url(self,
+                                        subject: CurrentUser,
+                                        req: PresignedUploadRequestDto):
+        return await self.user_service.create_profile_upload_url(req.filename)
+
+    @router.post('/profile/confirm', response_model=UploadFileResponseDto)
+    async def confirm_profile_upload(self,
+                                     subject: CurrentUser,
+                                     req: UploadConfirmRequestDto):
+        return await self.user_service.confirm_profile_upload(req.file_url)
+
     @router.post('/{purpose}/file', response_model=UploadFileResponseDto)
     async def upload(self,
                      subject: RequestUser,
@@ -43,8 +55,22 @@ class UserRouter:
                      file: UploadFile = File(...)):
         return await self.user_service.upload_file(purpose, file)
 
+    @router.post('/{purpose}/file/presigned', response_model=PresignedUploadResponseDto)
+    async def create_upload_url(self,
+                                subject: RequestUser,
+                                purpose: LectorUploadPurpose,
+                                req: PresignedUploadRequestDto):
+        return await self.user_service.create_upload_url(purpose, req.filename)
+
+    @router.post('/{purpose}/file/confirm', response_model=UploadFileResponseDto)
+    async def confirm_upload(self,
+                             subject: RequestUser,
+                             purpose: LectorUploadPurpose,
+                             req: UploadConfirmRequestDto):
+        return await self.user_service.confirm_upload(purpose, req.file_url)
+
     @router.get('/nickname/{nickname}', response_model=Pagination[UserNameResponseDto])
     async def find_all_by_nickname(self,
                                    nickname: str,
-                                   params: Params = Depends()):
+                                   params: PageParams):
         return await self.user_service.find_all_by_nickname(params, nickname)
@@ -1,18 +1,19 @@
 import json
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, time
 from typing import List
 from uuid import uuid4
 
 from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import String, Column, ForeignKey, Boolean, select, exists, Integer, Enum, delete, and_, desc, func, \
-    null, DateTime
+    null, DateTime, Index
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship, selectinload, backref
 from sqlalchemy.dialects.postgresql import TEXT
 
 from claon_admin.common.enum import PeriodType, CenterFeeType
 from claon_admin.common.util.db import Base
+from claon_admin.common.util.pagination import CursorParams, paginate_by_cursor
 from claon_admin.common.util.repository import Repository
 from claon_admin.schema.post import Post
 
@@ -45,6 +46,10 @@ class ReviewTag:
 
 
 class Center(Base):
+    __table_args__ = (
+        Index("ix_tb_center_user_id_created_at", "user_id", "created_at"),
+    )
+
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     name = Column(String(length=30), nullable=False)
     profile_img = Column(TEXT, nullable=False)
@@ -54,7 +59,7 @@ class Center(Base):
     web_url = Column(String(length=500))
     instagram_name = Column(String(length=20))
     youtube_url = Column(String(length=500))
-    approved = Column(Boolean, default=False, nullable=False)
+    approved = Column(Boolean, default=False, nullable=False, index=True)
 
     _center_img = Column(TEXT)
     _operating_time = Column(TEXT)
@@ -184,7 +189,7 @@ class CenterFee(Base):
     period_type = Column(Enum(PeriodType), nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
 
-    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False)
+    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False, index=True)
     center = relationship("Center", back_populates="fees")
 
     @staticmethod
@@ -219,7 +224,7 @@ class CenterHold(Base):
     difficulty = Column(String(length=10))
     is_color = Column(Boolean, default=False, nullable=False)
 
-    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False)
+    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False, index=True)
     center = relationship("Center", back_populates="holds")
 
 
@@ -228,7 +233,7 @@ class CenterWall(Base):
     name = Column(String(length=20))
     type = Column(String(length=20))
 
-    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False)
+    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False, index=True)
     center = relationship("Center", back_populates="walls")
 
 
@@ -236,23 +241,27 @@ class CenterApprovedFile(Base):
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     url = Column(String(length=255))
 
-    user_id = Column(String(length=255), ForeignKey('tb_user.id', ondelete="CASCADE"), nullable=False)
+    user_id = Column(String(length=255), ForeignKey('tb_user.id', ondelete="CASCADE"), nullable=False, index=True)
     user = relationship("User", backref=backref("CenterApprovedFile", passive_deletes=True))
-    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False)
+    center_id = Column(String(length=255), ForeignKey('tb_center.id', ondelete="CASCADE"), nullable=False, index=True)
     center = relationship("Center", backref=backref("CenterApprovedFile", cascade="all,delete"))
 
 
 class Review(Base):
+    __table_args__ = (
+        Index("ix_tb_review_center_id_created_at", "center_id", "created_at"),
+    )
+
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     content = Column(String(length=500), nullable=False)
     _tag = Column(TEXT, nullable=False)
 
-    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False, index=True)
     user = relationship("User", backref=backref("Review"))
     center_id = Column(String(length=255), ForeignKey("tb_center.id", ondelete="CASCADE"), nullable=False)
     center = relationship("Center", backref=backref("Review"))
 
-    answer_id = Column(String(length=255), ForeignKey("tb_review_answer.id", ondelete="CASCADE"))
+    answer_id = Column(String(length=255), ForeignKey("tb_review_answer.id", ondelete="CASCADE"), index=True)
     answer = relationship("ReviewAnswer", back_populates="review")
 
     @property
@@ -281,14 +290,19 @@ class ReviewAnswer(Base):
 class CenterScheduleMember(Base):
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
 
-    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False, index=True)
     user = relationship("User", backref=backref("CenterScheduleMember"))
 
-    schedule_id = Column(String(length=255), ForeignKey("tb_center_schedule.id", ondelete="CASCADE"), nullable=False)
+    schedule_id = Column(String(length=255), ForeignKey("tb_center_schedule.id", ondelete="CASCADE"),
+                         nullable=False, index=True)
     schedule = relationship("CenterSchedule", back_populates="members")
 
 
 class CenterSchedule(Base):
+    __table_args__ = (
+        Index("ix_tb_center_schedule_center_id_start_time", "center_id", "start_time"),
+    )
+
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     title = Column(String(length=20), nullable=False)
     start_time = Column(DateTime, nullable=False)
@@ -350,6 +364,11 @@ class CenterRepository(Repository[Center]):
         result = await session.execute(select(Center.id).where(Center.approved.is_(True)))
         return result.scalars().all()
 
+    async def stream_ids_by_approved_true(self, session: AsyncSession, size: int):
+        result = await session.stream(select(Center.id).where(Center.approved.is_(True)))
+        async for partition in result.scalars().partitions(size):
+            yield partition
+
 
 class CenterApprovedFileRepository(Repository[CenterApprovedFile]):
     async def find_all_by_center_id(self, session: AsyncSession, center_id: str):
@@ -359,6 +378,10 @@ class CenterApprovedFileRepository(Repository[CenterApprovedFile]):
     async def delete_all_by_center_id(self, session: AsyncSession, center_id: str):
         await session.execute(delete(CenterApprovedFile).where(CenterApprovedFile.center_id == center_id))
 
+    async def find_referenced_urls(self, session: AsyncSession, urls: List[str]):
+        result = await session.execute(select(CenterApprovedFile.url).where(CenterApprovedFile.url.in_(urls)))
+        return set(result.scalars().all())
+
 
 class CenterHoldRepository(Repository[CenterHold]):
     async def find_all_by_center_id(self, session: AsyncSession, center_id: str):
@@ -368,6 +391,9 @@ class CenterHoldRepository(Repository[CenterHold]):
     async def delete_by_center_id(self, session: AsyncSession, center_id: str):
         await session.execute(delete(CenterHold).where(CenterHold.center_id == center_id))
 
+    async def delete_by_center_id_and_ids(self, session: AsyncSession, center_id: str, ids: List[str]):
+        await session.execute(delete(CenterHold).where(and_(CenterHold.center_id == center_id, CenterHold.id.in_(ids))))
+
 
 class CenterWallRepository(Repository[CenterWall]):
     async def find_all_by_center_id(self, session: AsyncSession, center_id: str):
@@ -377,6 +403,9 @@ class CenterWallRepository(Repository[CenterWall]):
     async def delete_by_center_id(self, session: AsyncSession, center_id: str):
         await session.execute(delete(CenterWall).where(CenterWall.center_id == center_id))
 
+    async def delete_by_center_id_and_ids(self, session: AsyncSession, center_id: str, ids: List[str]):
+        await session.execute(delete(CenterWall).where(and_(CenterWall.center_id == center_id, CenterWall.id.in_(ids))))
+
 
 class CenterFeeRepository(Repository[CenterFee]):
     async def find_all_by_center_id(self, session: AsyncSession, center_id: str):
@@ -387,7 +416,7 @@ class CenterFeeRepository(Repository[CenterFee]):
 class ReviewRepository(Repository[Review]):
     async def find_reviews_by_center(self,
                                      session: AsyncSession,
-                                     params: Params,
+                                     params: Params | CursorParams,
                                      center_id: str,
                                      start: date,
                                      end: date,
@@ -400,7 +429,6 @@ class ReviewRepository(Repository[Review]):
                         Review.created_at >= start,
                         Review.created_at < end)) \
             .group_by(Review.id) \
-            .order_by(desc(Review.created_at)) \
             .options(selectinload(Review.user)) \
             .options(selectinload(Review.center)) \
             .options(selectinload(Review.answer))
@@ -414,7 +442,10 @@ class ReviewRepository(Repository[Review]):
             else:
                 query = query.where(Review.answer != null())
 
-        return await paginate(query=query, conn=session, params=params)
+        if isinstance(params, CursorParams):
+            return await paginate_by_cursor(session, query, params, Review.created_at, Review.id)
+
+        return await paginate(query=query.order_by(desc(Review.created_at)), conn=session, params=params)
 
     async def find_by_id_and_center_id(self, session: AsyncSession, review_id: str, center_id: str):
         result = await session.execute(select(Review)
@@ -441,6 +472,11 @@ class CenterScheduleMemberRepository(Repository[CenterScheduleMember]):
     async def delete_by_schedule_id(self, session: AsyncSession, schedule_id: str):
         await session.execute(delete(CenterScheduleMember).where(CenterScheduleMember.schedule_id == schedule_id))
 
+    async def delete_by_schedule_id_and_user_ids(self, session: AsyncSession, schedule_id: str, user_ids: List[str]):
+        await session.execute(delete(CenterScheduleMember)
+                              .where(and_(CenterScheduleMember.schedule_id == schedule_id,
+                                          CenterScheduleMember.user_id.in_(user_ids))))
+
 
 class CenterScheduleRepository(Repository[CenterSchedule]):
     async def find_by_id_and_center_id(self, session: AsyncSession, schedule_id: str, center_id: str):
@@ -452,9 +488,10 @@ class CenterScheduleRepository(Repository[CenterSchedule]):
         return result.scalars().one_or_none()
 
     async def find_by_center_id_and_date_from(self, session: AsyncSession, center_id: str, date_from: date):
+        start = datetime.combine(date_from, time.min)
         result = await session.execute(select(CenterSchedule)
                                        .where(and_(CenterSchedule.center_id == center_id,
-                                                   func.date(CenterSchedule.start_time)
-                                                   .between(date_from, date_from + timedelta(days=42))))
+                                                   CenterSchedule.start_time >= start,
+                                                   CenterSchedule.start_time < start + timedelta(days=43)))
                                        .order_by(CenterSchedule.start_time.asc(), CenterSchedule.end_time.desc()))
         return result.scalars().all()
@@ -0,0 +1,154 @@
+from datetime import datetime
+from typing import List, Dict
+from uuid import uuid4
+
+from fastapi_pagination import Params
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import Column, String, DateTime, Enum, Integer, TEXT, Index, select, and_, desc, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import FileDeletionStatus
+from claon_admin.common.util.db import Base
+from claon_admin.common.util.time import now
+from claon_admin.common.util.repository import Repository, insert_on_conflict
+
+
+class FileDeletion(Base):
+    __table_args__ = (
+        Index("ix_tb_file_deletion_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
+    url = Column(String(length=255), nullable=False)
+    status = Column(Enum(FileDeletionStatus), nullable=False, default=FileDeletionStatus.PENDING)
+    attempt = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)
+    deleted_at = Column(DateTime)
+    error = Column(TEXT)
+
+
+class FileObject(Base):
+    prefix = Column(String(length=255), primary_key=True)
+    hash = Column(String(length=64), primary_key=True)
+    url = Column(String(length=255), nullable=False, unique=True)
+    size = Column(Integer, nullable=False)
+    last_acquired_at = Column(DateTime, nullable=False, index=True)
+
+
+class ImageVariant(Base):
+    url = Column(String(length=255), primary_key=True)
+    thumbnail_url = Column(String(length=255), nullable=False)
+    webp_url = Column(String(length=255), nullable=False)
+
+
+class FileObjectRepository(Repository[FileObject]):
+    async def acquire(self, session: AsyncSession, prefix: str, file_hash: str):
+        result = await session.execute(update(FileObject)
+                                       .where(and_(FileObject.prefix == prefix, FileObject.hash == file_hash))
+                                       .values(last_acquired_at=now())
+                                       .execution_options(synchronize_session=False))
+        if result.rowcount == 0:
+            return None
+
+        return await self.__find_url(session, prefix, file_hash)
+
+    async def register(self, session: AsyncSession, prefix: str, file_hash: str, url: str, size: int):
+        acquired_at = now()
+        statement = insert_on_conflict(session, FileObject).values(
+            prefix=prefix,
+            hash=file_hash,
+            url=url,
+            size=size,
+            last_acquired_at=acquired_at,
+            created_at=acquired_at
+        )
+        await session.execute(statement.on_conflict_do_update(
+            index_elements=["prefix", "hash"],
+            set_={"last_acquired_at": acquired_at}
+        ))
+
+        return await self.__find_url(session, prefix, file_hash)
+
+    async def find_urls_acquired_after(self, session: AsyncSession, acquired_after: datetime):
+        result = await session.execute(select(FileObject.url).where(FileObject.last_acquired_at >= acquired_after))
+        return result.scalars().all()
+
+    async def delete_unacquired_by_urls(self, session: AsyncSession, urls: List[str], acquired_after: datetime):
+        if len(urls) == 0:
+            return []
+
+        await session.execute(delete(FileObject).where(and_(FileObject.url.in_(urls),
+                                                            FileObject.last_acquired_at < acquired_after)))
+        result = await session.execute(select(FileObject.url).where(FileObject.url.in_(urls)))
+        acquired_urls = set(result.scalars().all())
+        return [url for url in urls if url not in acquired_urls]
+
+    @staticmethod
+    async def __find_url(session: AsyncSession, prefix: str, file_hash: str):
+        result = await session.execute(select(FileObject.url)
+                                       .where(and_(FileObject.prefix == prefix, FileObject.hash == file_hash)))
+        return result.scalar_one()
+
+    async def delete_by_urls(self, session: AsyncSession, urls: List[str]):
+        await session.execute(delete(FileObject).where(FileObject.url.in_(urls)))
+
+
+class ImageVariantRepository(Repository[ImageVariant]):
+    async def register(self, session: AsyncSession, url: str, thumbnail_url: str, webp_url: str):
+        statement = insert_on_conflict(session, ImageVariant).values(
+            url=url,
+            thumbnail_url=thumbnail_url,
+            webp_url=webp_url,
+            created_at=now()
+        )
+        await session.execute(statement.on_conflict_do_update(
+            index_elements=["url"],
+            set_={"thumbnail_url": thumbnail_url, "webp_url": webp_url}
+        ))
+
+    async def find_thumbnails(self, session: AsyncSession, urls: List[str]) -> Dict[str, str]:
+        urls = list({url for url in urls if url})
+        if len(urls) == 0:
+            return {}
+
+        result = await session.execute(select(ImageVariant.url, ImageVariant.thumbnail_url)
+                                       .where(ImageVariant.url.in_(urls)))
+        return dict(result.all())
+
+    async def delete_by_urls(self, session: AsyncSession, urls: List[str]):
+        await session.execute(delete(ImageVariant).where(ImageVariant.url.in_(urls)))
+
+
+class FileDeletionRepository(Repository[FileDeletion]):
+    async def add_all(self, session: AsyncSession, urls: List[str], next_attempt_at: datetime):
+        if len(urls) > 0:
+            result = await session.execute(select(ImageVariant.thumbnail_url, ImageVariant.webp_url)
+                                           .where(ImageVariant.url.in_(urls)))
+            variant_urls = [url for row in result.all() for url in row]
+            if len(variant_urls) > 0:
+                await session.execute(delete(ImageVariant).where(ImageVariant.url.in_(urls)))
+                urls = urls + variant_urls
+
+        return await self.insert_all(session, [FileDeletion(
+            id=str(uuid4()),
+            url=url,
+            status=FileDeletionStatus.PENDING,
+            attempt=0,
+            next_attempt_at=next_attempt_at
+        ) for url in urls])
+
+    async def find_all_pending(self, session: AsyncSession, until: datetime, limit: int):
+        result = await session.execute(select(FileDeletion)
+                                       .where(and_(FileDeletion.status == FileDeletionStatus.PENDING,
+                                                   FileDeletion.next_attempt_at <= until))
+                                       .order_by(FileDeletion.next_attempt_at)
+                                       .limit(limit)
+                                       .with_for_update(skip_locked=True))
+        return result.scalars().all()
+
+    async def find_all_by_status(self, session: AsyncSession, params: Params, status: FileDeletionStatus | None):
+        query = select(FileDeletion)
+        if status is not None:
+            query = query.where(FileDeletion.status == status)
+
+        return await paginate(query=query.order_by(desc(FileDeletion.next_attempt_at)), conn=session, params=params)
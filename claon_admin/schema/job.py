@@ -0,0 +1,119 @@
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi_pagination import Params
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import Column, String, DateTime, Enum, Integer, TEXT, UniqueConstraint, select, and_, or_, desc, \
+    func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import JobRunStatus
+from claon_admin.common.util.db import Base
+from claon_admin.common.util.repository import Repository, insert_on_conflict
+
+
+class JobRun(Base):
+    __table_args__ = (
+        UniqueConstraint("job_name", "scheduled_at"),
+    )
+
+    id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
+    job_name = Column(String(length=100), nullable=False)
+    scheduled_at = Column(DateTime, nullable=False)
+    status = Column(Enum(JobRunStatus), nullable=False)
+    owner = Column(String(length=255), nullable=False)
+    attempt = Column(Integer, nullable=False, default=1)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime)
+    lease_until = Column(DateTime, nullable=False)
+    error = Column(TEXT)
+
+
+class JobRunRepository(Repository[JobRun]):
+    async def acquire(self,
+                      session: AsyncSession,
+                      job_name: str,
+                      scheduled_at: datetime,
+                      owner: str,
+                      started_at: datetime,
+                      lease_until: datetime):
+        statement = insert_on_conflict(session, JobRun).values(
+            id=str(uuid4()),
+            job_name=job_name,
+            scheduled_at=scheduled_at,
+            status=JobRunStatus.RUNNING,
+            owner=owner,
+            attempt=1,
+            started_at=started_at,
+            lease_until=lease_until
+        )
+        result = await session.execute(statement.on_conflict_do_update(
+            index_elements=["job_name", "scheduled_at"],
+            set_={
+                "status": JobRunStatus.RUNNING,
+                "owner": owner,
+                "attempt": JobRun.attempt + 1,
+                "started_at": started_at,
+                "finished_at": None,
+                "lease_until": lease_until,
+                "error": None
+            },
+            where=or_(JobRun.status == JobRunStatus.FAILED,
+                      and_(JobRun.status == JobRunStatus.RUNNING, JobRun.lease_until < started_at))
+        ))
+        return result.rowcount == 1
+
+    async def renew(self,
+                    session: AsyncSession,
+                    job_name: str,
+                    scheduled_at: datetime,
+                    owner: str,
+                    lease_until: datetime):
+        result = await session.execute(update(JobRun)
+                                       .where(and_(JobRun.job_name == job_name,
+                                                   JobRun.scheduled_at == scheduled_at,
+                                                   JobRun.owner == owner,
+                                                   JobRun.status == JobRunStatus.RUNNING))
+                                       .values(lease_until=lease_until)
+                                       .execution_options(synchronize_session=False))
+        return result.rowcount == 1
+
+    async def finish(self,
+                     session: AsyncSession,
+                     job_name: str,
+                     scheduled_at: datetime,
+                     owner: str,
+                     status: JobRunStatus,
+                     finished_at: datetime,
+                     error: str | None = None):
+        await session.execute(update(JobRun)
+                              .where(and_(JobRun.job_name == job_name,
+                                          JobRun.scheduled_at == scheduled_at,
+                                          JobRun.owner == owner,
+                                          JobRun.status == JobRunStatus.RUNNING))
+                              .values(status=status, finished_at=finished_at, error=error)
+                              .execution_options(synchronize_session=False))
+
+    async def find_last_succeeded_scheduled_at(self, session: AsyncSession, job_name: str):
+        result = await session.execute(select(func.max(JobRun.scheduled_at))
+                                       .where(and_(JobRun.job_name == job_name,
+                                                   JobRun.status == JobRunStatus.SUCCEEDED)))
+        return result.scalar()
+
+    async def find_all_scheduled_at_by_status(self,
+                                              session: AsyncSession,
+                                              job_name: str,
+                                              status: JobRunStatus,
+                                              after: datetime):
+        result = await session.execute(select(JobRun.scheduled_at)
+                                       .where(and_(JobRun.job_name == job_name,
+                                                   JobRun.scheduled_at > after,
+                                                   JobRun.status == status)))
+        return result.scalars().all()
+
+    async def find_all_by_job_name(self, session: AsyncSession, params: Params, job_name: str | None):
+        query = select(JobRun)
+        if job_name is not None:
+            query = query.where(JobRun.job_name == job_name)
+
+        return await paginate(query=query.order_by(desc(JobRun.scheduled_at)), conn=session, params=params)
@@ -11,7 +11,8 @@ class Membership(Base):
     start_time = Column(DateTime, nullable=False)
     expire_time = Column(DateTime, nullable=False)
 
-    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False, index=True)
     user = relationship("User", backref=backref("MembershipMember"), uselist=False)
-    center_fee_id = Column(String(length=255), ForeignKey("tb_center_fee.id", ondelete="CASCADE"), nullable=False)
+    center_fee_id = Column(String(length=255), ForeignKey("tb_center_fee.id", ondelete="CASCADE"),
+                           nullable=False, index=True)
     center_fee = relationship("CenterFee", backref=backref("MembershipMember"), uselist=False)
@@ -1,17 +1,21 @@
 import json
-from datetime import date
+from datetime import date, datetime, time, timedelta
 from typing import List
 from uuid import uuid4
 
 from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import Column, String, DateTime, TEXT, ForeignKey, Integer, Enum, and_, select, desc, func, asc
+from sqlalchemy import Column, String, DateTime, TEXT, ForeignKey, Integer, Enum, and_, select, desc, func, asc, \
+    Index, Date, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import relationship, backref, selectinload
 
-from claon_admin.common.enum import WallType
+from claon_admin.common.enum import WallType, PostCountPeriod
+from claon_admin.common.util.bucket import to_date
 from claon_admin.common.util.db import Base
+from claon_admin.common.util.pagination import CursorParams, paginate_by_cursor
 from claon_admin.common.util.repository import Repository
+from claon_admin.common.util.time import get_start_of_week
 
 
 class PostImage:
@@ -20,12 +24,16 @@ class PostImage:
 
 
 class Post(Base):
+    __table_args__ = (
+        Index("ix_tb_post_center_id_created_at", "center_id", "created_at"),
+    )
+
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     content = Column(String(length=500), nullable=False)
     _img = Column(TEXT, nullable=False)
     histories = relationship("ClimbingHistory", back_populates="post", cascade="all, delete-orphan")
 
-    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(String(length=255), ForeignKey("tb_user.id", ondelete="CASCADE"), nullable=False, index=True)
     user = relationship("User", backref=backref("Post"))
     center_id = Column(String(length=255), ForeignKey("tb_center.id", ondelete="CASCADE"), nullable=False)
     center = relationship("Center", backref=backref("Post"))
@@ -45,27 +53,46 @@ class Post(Base):
 
 class ClimbingHistory(Base):
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
-    hold_id = Column(String(length=255), nullable=False)
+    hold_id = Column(String(length=255), nullable=False, index=True)
     difficulty = Column(String(length=10), nullable=False)
     challenge_count = Column(Integer, nullable=False)
     wall_name = Column(String(length=20), nullable=False)
     wall_type = Column(Enum(WallType), nullable=False)
 
-    post_id = Column(String(length=255), ForeignKey("tb_post.id", ondelete="CASCADE"), nullable=False)
+    post_id = Column(String(length=255), ForeignKey("tb_post.id", ondelete="CASCADE"), nullable=False, index=True)
     post = relationship("Post", back_populates="histories")
 
 
 class PostCountHistory(Base):
+    __table_args__ = (
+        Index("ux_tb_post_count_history_center_id_reg_date", "center_id", "reg_date", unique=True),
+        {"info": {"obsolete_indexes": ["ix_tb_post_count_history_center_id_reg_date"]}}
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     center_id = Column(String(length=255), nullable=False)
     reg_date = Column(DateTime, nullable=False)
     count = Column(Integer, nullable=False)
 
 
+class PostCountTotal(Base):
+    center_id = Column(String(length=255), primary_key=True)
+    count = Column(Integer, nullable=False)
+    first_reg_date = Column(Date, nullable=False)
+    last_reg_date = Column(Date, nullable=False)
+
+
+class PostCountRollup(Base):
+    center_id = Column(String(length=255), primary_key=True)
+    period = Column(Enum(PostCountPeriod), primary_key=True)
+    reg_date = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False)
+
+
 class PostRepository(Repository[Post]):
     async def find_posts_by_center(self,
                                    session: AsyncSession,
-                                   params: Params,
+                                   params: Params | CursorParams,
                                    center_id: str,
                                    hold_id: str | None,
                                    start: date,
@@ -79,9 +106,12 @@ class PostRepository(Repository[Post]):
                 .join(ClimbingHistory) \
                 .where(ClimbingHistory.hold_id == hold_id)
 
-        query = query.order_by(desc(Post.created_at)).options(selectinload(Post.user))
+        query = query.options(selectinload(Post.user))
 
-        return await paginate(query=query, conn=session, params=params)
+        if isinstance(params, CursorParams):
+            return await paginate_by_cursor(session, query, params, Post.created_at, Post.id)
+
+        return await paginate(query=query.order_by(desc(Post.created_at)), conn=session, params=params)
 
     async def count_by_center_and_date(self, session: AsyncSession, center_ids: List[str], start: date, end: date):
         query_result = await session.execute(select(Post.center_id, func.count(Post.id))
@@ -91,18 +121,18 @@ class PostRepository(Repository[Post]):
                                              .group_by(Post.center_id))
         return {center_id: count for center_id, count in query_result.fetchall()}
 
+    async def count_by_center_per_day(self, session: AsyncSession, center_id: str, end: date):
+        query_result = await session.execute(select(func.date(Post.created_at), func.count(Post.id))
+                                             .where(and_(Post.center_id == center_id, Post.created_at < end))
+                                             .group_by(func.date(Post.created_at)))
+        return {date.fromisoformat(str(day)): count for day, count in query_result.fetchall()}
+
 
 class ClimbingHistoryRepository(Repository[ClimbingHistory]):
     pass
 
 
 class PostCountHistoryRepository(Repository[PostCountHistory]):
-    async def sum_count_by_center(self, session: AsyncSession, center_id: str):
-        result = await session.execute(select(func.sum(PostCountHistory.count))
-                                       .where(PostCountHistory.center_id == center_id)
-                                       .order_by(desc(PostCountHistory.reg_date)))
-        return result.scalars().first() or 0
-
     async def find_by_center_and_date(self, session: AsyncSession, center_id: str, start: date, end: date):
         result = await session.execute(select(PostCountHistory)
                                        .where(and_(PostCountHistory.center_id == center_id,
@@ -110,3 +140,96 @@ class PostCountHistoryRepository(Repository[PostCountHistory]):
                                                    PostCountHistory.reg_date < end))
                                        .order_by(asc(PostCountHistory.reg_date)))
         return result.scalars().all()
+
+    async def find_first_reg_date_by_center_and_date(self,
+                                                     session: AsyncSession,
+                                                     center_id: str,
+                                                     start: date,
+                                                     end: date):
+        result = await session.execute(select(func.min(PostCountHistory.reg_date))
+                                       .where(and_(PostCountHistory.center_id == center_id,
+                                                   PostCountHistory.reg_date >= start,
+                                                   PostCountHistory.reg_date < end)))
+        first_reg_date = result.scalar()
+        return None if first_reg_date is None else to_date(first_reg_date)
+
+    async def delete_by_center(self, session: AsyncSession, center_id: str):
+        await session.execute(delete(PostCountHistory).where(PostCountHistory.center_id == center_id))
+
+    async def delete_by_centers_and_date(self, session: AsyncSession, center_ids: List[str], reg_date: date):
+        condition = and_(PostCountHistory.center_id.in_(center_ids),
+                         PostCountHistory.reg_date == datetime.combine(reg_date, time.min))
+        result = await session.execute(select(PostCountHistory.center_id).where(condition))
+        deleted_center_ids = result.scalars().all()
+        if deleted_center_ids:
+            await session.execute(delete(PostCountHistory).where(condition))
+        return deleted_center_ids
+
+
+class PostCountTotalRepository(Repository[PostCountTotal]):
+    async def delete_by_center(self, session: AsyncSession, center_id: str):
+        await session.execute(delete(PostCountTotal).where(PostCountTotal.center_id == center_id))
+
+    async def rebuild_by_centers(self, session: AsyncSession, center_ids: List[str]):
+        if len(center_ids) == 0:
+            return
+
+        result = await session.execute(select(PostCountHistory.center_id,
+                                              func.sum(PostCountHistory.count),
+                                              func.min(PostCountHistory.reg_date),
+                                              func.max(PostCountHistory.reg_date))
+                                       .where(PostCountHistory.center_id.in_(center_ids))
+                                       .group_by(PostCountHistory.center_id))
+        totals = await self.upsert_all(session, [PostCountTotal(
+            center_id=center_id,
+            count=count,
+            first_reg_date=to_date(first_reg_date),
+            last_reg_date=to_date(last_reg_date)
+        ) for center_id, count, first_reg_date, last_reg_date in result.fetchall()], ["center_id"])
+
+        empty_center_ids = set(center_ids) - {e.center_id for e in totals}
+        if empty_center_ids:
+            await session.execute(delete(PostCountTotal).where(PostCountTotal.center_id.in_(empty_center_ids)))
+
+
+class PostCountRollupRepository(Repository[PostCountRollup]):
+    async def refresh_by_date(self, session: AsyncSession, center_ids: List[str], reg_date: date):
+        if len(center_ids) == 0:
+            return
+
+        start = get_start_of_week(reg_date)
+        end = start + timedelta(days=7)
+        result = await session.execute(select(PostCountHistory.center_id, func.sum(PostCountHistory.count))
+                                       .where(and_(PostCountHistory.center_id.in_(center_ids),
+                                                   PostCountHistory.reg_date >= datetime.combine(start, time.min),
+                                                   PostCountHistory.reg_date < datetime.combine(end, time.min)))
+                                       .group_by(PostCountHistory.center_id))
+        rollups = await self.upsert_all(
+            session,
+            [PostCountRollup(center_id=center_id, period=PostCountPeriod.WEEK, reg_date=start, count=count)
+             for center_id, count in result.fetchall()],
+            ["center_id", "period", "reg_date"]
+        )
+
+        empty_center_ids = set(center_ids) - {e.center_id for e in rollups}
+        if empty_center_ids:
+            await session.execute(delete(PostCountRollup).where(and_(PostCountRollup.center_id.in_(empty_center_ids),
+                                                                     PostCountRollup.period == PostCountPeriod.WEEK,
+                                                                     PostCountRollup.reg_date == start)))
+
+    async def find_by_center_and_period(self,
+                                        session: AsyncSession,
+                                        center_id: str,
+                                        period: PostCountPeriod,
+                                        start: date,
+                                        end: date):
+        result = await session.execute(select(PostCountRollup)
+                                       .where(and_(PostCountRollup.center_id == center_id,
+                                                   PostCountRollup.period == period,
+                                                   PostCountRollup.reg_date >= start,
+                                                   PostCountRollup.reg_date < end))
+                                       .order_by(asc(PostCountRollup.reg_date)))
+        return result.scalars().all()
+
+    async def delete_by_center(self, session: AsyncSession, center_id: str):
+        await session.execute(delete(PostCountRollup).where(PostCountRollup.center_id == center_id))
@@ -13,6 +13,7 @@ from sqlalchemy.dialects.postgresql import TEXT
 
 from claon_admin.common.enum import Role
 from claon_admin.common.util.db import Base
+from claon_admin.common.util.pagination import CursorParams, paginate_by_cursor
 from claon_admin.common.util.repository import Repository
 
 
@@ -76,7 +77,7 @@ class User(Base):
 class Lector(Base):
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     is_setter = Column(Boolean, default=False, nullable=False)
-    approved = Column(Boolean, default=False, nullable=False)
+    approved = Column(Boolean, default=False, nullable=False, index=True)
 
     _contest = Column(TEXT)
     _certificate = Column(TEXT)
@@ -141,7 +142,7 @@ class LectorApprovedFile(Base):
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
     url = Column(String(length=255))
 
-    lector_id = Column(String(length=255), ForeignKey('tb_lector.id', ondelete="CASCADE"), nullable=False)
+    lector_id = Column(String(length=255), ForeignKey('tb_lector.id', ondelete="CASCADE"), nullable=False, index=True)
     lector = relationship("Lector", backref=backref("LectorApprovedFile", cascade="all,delete"))
 
 
@@ -162,9 +163,14 @@ class UserRepository(Repository[User]):
         result = await session.execute(select(User).where(User.oauth_id == oauth_id))
         return result.scalars().one_or_none()
 
-    async def find_all_by_nickname(self, session: AsyncSession, nickname: str, params: Params):
-        query = select(User).where(User.nickname.contains(nickname)).limit(5)
-        return await paginate(query=query, conn=session, params=params)
+    async def find_all_by_nickname(self, session: AsyncSession, nickname: str, params: Params | CursorParams):
+        query = select(User).where(User.nickname.contains(nickname))
+
+        if isinstance(params, CursorParams):
+            params = params.copy(update={"size": min(params.size, 5)})
+            return await paginate_by_cursor(session, query, params, User.created_at, User.id)
+
+        return await paginate(query=query.limit(5), conn=session, params=params)
 
     async def find_by_ids(self, session: AsyncSession, ids: List[str]):
         result = await session.execute(select(User).where(User.id.in_(ids)))
@@ -193,3 +199,7 @@ class LectorApprovedFileRepository(Repository[LectorApprovedFile]):
 
     async def delete_all_by_lector_id(self, session: AsyncSession, lector_id: str):
         await session.execute(delete(LectorApprovedFile).where(LectorApprovedFile.lector_id == lector_id))
+
+    async def find_referenced_urls(self, session: AsyncSession, urls: List[str]):
+        result = await session.execute(select(LectorApprovedFile.url).where(LectorApprovedFile.url.in_(urls)))
+        return set(result.scalars().all())
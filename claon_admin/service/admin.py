@@ -1,11 +1,21 @@
+from datetime import timedelta
+from typing import List
+
+from fastapi_pagination import Params
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.error.exception import BadRequestException, ErrorCode, NotFoundException
-from claon_admin.common.util.s3 import delete_file
-from claon_admin.common.util.transaction import transactional
-from claon_admin.model.admin import CenterResponseDto, LectorResponseDto
-from claon_admin.common.enum import Role
+from claon_admin.common.util.cache import user_cache
+from claon_admin.common.util.pagination import paginate
+from claon_admin.common.util.time import now
+from claon_admin.common.util.transaction import transactional, after_commit
+from claon_admin.job.orphan import ORPHAN_FILE_GRACE_DAYS
+from claon_admin.model.admin import CenterResponseDto, LectorResponseDto, JobRunResponseDto, \
+    FileDeletionResponseDto
+from claon_admin.common.enum import Role, FileDeletionStatus
 from claon_admin.schema.center import CenterRepository, CenterApprovedFileRepository
+from claon_admin.schema.file import FileDeletionRepository, FileObjectRepository
+from claon_admin.schema.job import JobRunRepository
 from claon_admin.schema.user import LectorRepository, LectorApprovedFileRepository, UserRepository
 
 
@@ -15,12 +25,18 @@ class AdminService:
                  lector_repository: LectorRepository,
                  lector_approved_file_repository: LectorApprovedFileRepository,
                  center_repository: CenterRepository,
-                 center_approved_file_repository: CenterApprovedFileRepository):
+                 center_approved_file_repository: CenterApprovedFileRepository,
+                 job_run_repository: JobRunRepository,
+                 file_deletion_repository: FileDeletionRepository,
+                 file_object_repository: FileObjectRepository):
         self.user_repository = user_repository
         self.lector_repository = lector_repository
         self.lector_approved_file_repository = lector_approved_file_repository
         self.center_repository = center_repository
         self.center_approved_file_repository = center_approved_file_repository
+        self.job_run_repository = job_run_repository
+        self.file_deletion_repository = file_deletion_repository
+        self.file_object_repository = file_object_repository
 
     @transactional()
     async def approve_lector(self, session: AsyncSession, lector_id: str):
@@ -33,11 +49,11 @@ class AdminService:
 
         lector.approve()
         lector.user.update_role(Role.LECTOR)
+        after_commit(lambda: user_cache.evict(lector.user.id))
 
         approved_files = await self.lector_approved_file_repository.find_all_by_lector_id(session, lector_id)
         await self.lector_approved_file_repository.delete_all_by_lector_id(session, lector_id)
-        for file in approved_files:
-            await delete_file(file.url)
+        await self.__delete_files(session, [file.url for file in approved_files], self.lector_approved_file_repository)
 
         return LectorResponseDto.from_entity(lector, approved_files)
 
@@ -51,8 +67,8 @@ class AdminService:
             )
 
         approved_files = await self.lector_approved_file_repository.find_all_by_lector_id(session, lector_id)
-        for file in approved_files:
-            await delete_file(file.url)
+        await self.lector_approved_file_repository.delete_all_by_lector_id(session, lector_id)
+        await self.__delete_files(session, [file.url for file in approved_files], self.lector_approved_file_repository)
 
         return await self.lector_repository.delete(session, lector)
 
@@ -73,11 +89,11 @@ class AdminService:
 
         center.approve()
         center.user.update_role(Role.CENTER_ADMIN)
+        after_commit(lambda: user_cache.evict(center.user.id))
 
         approved_files = await self.center_approved_file_repository.find_all_by_center_id(session, center_id)
         await self.center_approved_file_repository.delete_all_by_center_id(session, center_id)
-        for file in approved_files:
-            await delete_file(file.url)
+        await self.__delete_files(session, [file.url for file in approved_files], self.center_approved_file_repository)
 
         return CenterResponseDto.from_entity(center, approved_files)
 
@@ -91,8 +107,8 @@ class AdminService:
             )
 
         approved_files = await self.center_approved_file_repository.find_all_by_center_id(session, center_id)
-        for file in approved_files:
-            await delete_file(file.url)
+        await self.center_approved_file_repository.delete_all_by_center_id(session, center_id)
+        await self.__delete_files(session, [file.url for file in approved_files], self.center_approved_file_repository)
 
         await self.center_repository.delete(session, center)
 
@@ -109,3 +125,26 @@ class AdminService:
             center,
             await self.center_approved_file_repository.find_all_by_center_id(session, center.id)
         ) for center in await self.center_repository.find_all_by_approved_false(session)]
+
+    @transactional(read_only=True)
+    async def find_job_runs(self, session: AsyncSession, params: Params, job_name: str | None):
+        pages = await self.job_run_repository.find_all_by_job_name(session, params, job_name)
+        return await paginate(JobRunResponseDto, pages)
+
+    @transactional(read_only=True)
+    async def find_file_deletions(self, session: AsyncSession, params: Params, status: FileDeletionStatus | None):
+        pages = await self.file_deletion_repository.find_all_by_status(session, params, status)
+        return await paginate(FileDeletionResponseDto, pages)
+
+    async def __delete_files(self,
+                             session: AsyncSession,
+                             urls: List[str],
+                             approved_file_repository: LectorApprovedFileRepository | CenterApprovedFileRepository):
+        referenced_urls = await approved_file_repository.find_referenced_urls(session, urls)
+        unreferenced_urls = list(dict.fromkeys(url for url in urls if url not in referenced_urls))
+        deletable_urls = await self.file_object_repository.delete_unacquired_by_urls(
+            session,
+            unreferenced_urls,
+            now() - timedelta(days=ORPHAN_FILE_GRACE_DAYS)
+        )
+        await self.file_deletion_repository.add_all(session, deletable_urls, now())
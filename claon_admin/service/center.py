@@ -1,20 +1,25 @@
+from typing import List
+
 from fastapi import UploadFile
 from fastapi_pagination import Params
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from claon_admin.common.enum import CenterUploadPurpose
 from claon_admin.common.error.exception import BadRequestException, ErrorCode, UnauthorizedException, NotFoundException
+from claon_admin.common.util.image import request_image_variants
 from claon_admin.common.util.pagination import paginate
-from claon_admin.common.util.s3 import upload_file
+from claon_admin.common.util.s3 import upload_file, create_presigned_upload, confirm_upload
 from claon_admin.common.util.transaction import transactional
 from claon_admin.model.auth import RequestUser
-from claon_admin.model.file import UploadFileResponseDto
+from claon_admin.model.file import UploadFileResponseDto, PresignedUploadResponseDto
 from claon_admin.model.center import CenterNameResponseDto, CenterBriefResponseDto, CenterResponseDto, \
     CenterCreateRequestDto, CenterUpdateRequestDto, CenterFeeDetailResponseDto, CenterFeeDetailRequestDto
 from claon_admin.model.schedule import ScheduleRequestDto, ScheduleResponseDto, ScheduleBriefResponseDto, ScheduleFinder
 from claon_admin.schema.center import CenterRepository, CenterHoldRepository, CenterWallRepository, \
     CenterFeeRepository, CenterHold, CenterWall, CenterFee, CenterApprovedFileRepository, Center, CenterApprovedFile, \
     CenterSchedule, CenterScheduleRepository, CenterScheduleMemberRepository, CenterScheduleMember
+from claon_admin.schema.file import ImageVariantRepository
 from claon_admin.schema.user import UserRepository
 
 
@@ -27,7 +32,8 @@ class CenterService:
                  center_fee_repository: CenterFeeRepository,
                  center_approved_file_repository: CenterApprovedFileRepository,
                  center_schedule_repository: CenterScheduleRepository,
-                 center_schedule_member_repository: CenterScheduleMemberRepository):
+                 center_schedule_member_repository: CenterScheduleMemberRepository,
+                 image_variant_repository: ImageVariantRepository):
         self.user_repository = user_repository
         self.center_repository = center_repository
         self.center_hold_repository = center_hold_repository
@@ -36,6 +42,7 @@ class CenterService:
         self.center_approved_file_repository = center_approved_file_repository
         self.center_schedule_repository = center_schedule_repository
         self.center_schedule_member_repository = center_schedule_member_repository
+        self.image_variant_repository = image_variant_repository
 
     @transactional()
     async def create(self,
@@ -47,18 +54,18 @@ class CenterService:
         holds = []
         if req.hold_info is not None:
             hold_is_color = req.hold_info.is_color
-            holds = await self.center_hold_repository.save_all(
+            holds = await self.center_hold_repository.insert_all(
                 session,
-                [CenterHold(center=center, name=e.name, difficulty=e.difficulty, is_color=hold_is_color)
+                [CenterHold(center_id=center.id, name=e.name, difficulty=e.difficulty, is_color=hold_is_color)
                  for e in req.hold_info.hold_list]
             )
-        walls = await self.center_wall_repository.save_all(
+        walls = await self.center_wall_repository.insert_all(
             session,
-            [CenterWall(center=center, name=e.name, type=e.wall_type.value)
+            [CenterWall(center_id=center.id, name=e.name, type=e.wall_type.value)
              for e in req.wall_list]
         )
 
-        await self.center_approved_file_repository.save_all(
+        await self.center_approved_file_repository.insert_all(
             session,
             [CenterApprovedFile(user_id=subject.id, center_id=center.id, url=url) for url in req.proof_list]
         )
@@ -73,6 +80,30 @@ class CenterService:
             )
 
         url = await upload_file(file, "center", purpose.value)
+        if purpose.has_variants():
+            await request_image_variants(url)
+        return UploadFileResponseDto(file_url=url)
+
+    async def create_upload_url(self, purpose: CenterUploadPurpose, filename: str):
+        if not purpose.is_valid_extension(filename.split('.')[-1]):
+            raise BadRequestException(
+                ErrorCode.INVALID_FORMAT,
+                "지원하지 않는 포맷입니다."
+            )
+
+        url, fields, file_url = create_presigned_upload(filename, "center", purpose.value)
+        return PresignedUploadResponseDto(url=url, fields=fields, file_url=file_url)
+
+    async def confirm_upload(self, purpose: CenterUploadPurpose, file_url: str):
+        if not purpose.is_valid_extension(file_url.split('.')[-1]):
+            raise BadRequestException(
+                ErrorCode.INVALID_FORMAT,
+                "지원하지 않는 포맷입니다."
+            )
+
+        url = await confirm_upload(file_url, "center", purpose.value)
+        if purpose.has_variants():
+            await request_image_variants(url)
         return UploadFileResponseDto(file_url=url)
 
     @transactional(read_only=True)
@@ -80,7 +111,11 @@ class CenterService:
                                    session: AsyncSession,
                                    name: str):
         centers = await self.center_repository.find_by_name(session, name)
-        return [CenterNameResponseDto.from_entity(center) for center in centers]
+        thumbnails = await self.image_variant_repository.find_thumbnails(
+            session,
+            [center.profile_img for center in centers]
+        )
+        return [CenterNameResponseDto.from_entity(center, thumbnails) for center in centers]
 
     @transactional(read_only=True)
     async def find_centers(self,
@@ -95,7 +130,11 @@ class CenterService:
                 "{name} 관리자님\n먼저 암장을 등록해주세요.".format(name=subject.nickname)
             )
 
-        return await paginate(CenterBriefResponseDto, pages)
+        thumbnails = await self.image_variant_repository.find_thumbnails(
+            session,
+            [url for center in pages.items for url in [center.profile_img] + [e.url for e in center.center_img]]
+        )
+        return await paginate(CenterBriefResponseDto, pages, thumbnails=thumbnails)
 
     @transactional(read_only=True)
     async def find_by_id(self,
@@ -166,23 +205,67 @@ class CenterService:
 
         center.update(**req.center.dict())
 
-        holds = []
-        await self.center_hold_repository.delete_by_center_id(session, center.id)
-        if req.hold_info is not None:
-            hold_is_color = req.hold_info.is_color
-            holds = await self.center_hold_repository.save_all(
-                session,
-                [CenterHold(center=center, name=e.name, difficulty=e.difficulty, is_color=hold_is_color)
-                 for e in req.hold_info.hold_list or []])
-
-        await self.center_wall_repository.delete_by_center_id(session, center.id)
-        walls = await self.center_wall_repository.save_all(
+        hold_is_color = req.hold_info.is_color if req.hold_info is not None else False
+        hold_list = req.hold_info.hold_list or [] if req.hold_info is not None else []
+        holds = await self.__sync_by_identity(
             session,
-            [CenterWall(center=center, name=e.name, type=e.wall_type.value)
-             for e in req.wall_list or []])
+            self.center_hold_repository,
+            center,
+            "holds",
+            [(e.hold_id, CenterHold(center_id=center.id, name=e.name, difficulty=e.difficulty, is_color=hold_is_color))
+             for e in hold_list],
+            ["name", "difficulty", "is_color"]
+        )
+        walls = await self.__sync_by_identity(
+            session,
+            self.center_wall_repository,
+            center,
+            "walls",
+            [(e.wall_id, CenterWall(center_id=center.id, name=e.name, type=e.wall_type.value))
+             for e in req.wall_list or []],
+            ["name", "type"]
+        )
 
         return CenterResponseDto.from_entity(center, holds, walls)
 
+    async def __sync_by_identity(self,
+                                 session: AsyncSession,
+                                 repository: CenterHoldRepository | CenterWallRepository,
+                                 center: Center,
+                                 collection: str,
+                                 requested: List[tuple],
+                                 fields: List[str]):
+        existing = list(getattr(center, collection))
+        existing_by_id = {e.id: e for e in existing}
+        existing_by_name = {e.name: e for e in existing}
+
+        result, changed, created, kept_ids = [], [], [], set()
+        for entity_id, entity in requested:
+            current = existing_by_id.get(entity_id) or existing_by_name.get(entity.name)
+            if current is None or current.id in kept_ids:
+                created.append(entity)
+                result.append(entity)
+                continue
+
+            kept_ids.add(current.id)
+            if any(getattr(current, field) != getattr(entity, field) for field in fields):
+                entity.id = current.id
+                changed.append(entity)
+                for field in fields:
+                    set_committed_value(current, field, getattr(entity, field))
+            result.append(current)
+
+        removed_ids = [e.id for e in existing if e.id not in kept_ids]
+        if removed_ids:
+            await repository.delete_by_center_id_and_ids(session, center.id, removed_ids)
+        if changed:
+            await repository.upsert_all(session, changed, ["id"])
+        if created:
+            await repository.insert_all(session, created)
+
+        set_committed_value(center, collection, result)
+        return result
+
     @transactional(read_only=True)
     async def find_center_fees(self,
                                session: AsyncSession,
@@ -272,11 +355,7 @@ class CenterService:
             )
         )
 
-        users = await self.user_repository.find_by_ids(session, req.member_list)
-        await self.center_schedule_member_repository.save_all(
-            session,
-            [CenterScheduleMember(user=user, schedule=schedule) for user in users]
-        )
+        users = await self.__sync_schedule_members(session, schedule, [], req.member_list)
 
         return ScheduleResponseDto.from_entity(schedule, users)
 
@@ -363,26 +442,42 @@ class CenterService:
                 "해당 스케줄이 존재하지 않습니다."
             )
 
-        await self.center_schedule_member_repository.delete_by_schedule_id(session, schedule_id)
+        updated_members = await self.__sync_schedule_members(session, schedule, schedule.members, req.member_list)
+
+        schedule.update(**req.schedule_info.dict())
+        return ScheduleResponseDto.from_entity(schedule, updated_members)
+
+    async def __sync_schedule_members(self,
+                                      session: AsyncSession,
+                                      schedule: CenterSchedule,
+                                      members: List[CenterScheduleMember],
+                                      member_ids: List[str]):
+        member_ids = list(dict.fromkeys(member_ids))
+        users = {user.id: user for user in await self.user_repository.find_by_ids(session, member_ids)}
 
-        updated_members = []
-        for member_id in req.member_list:
-            user = await self.user_repository.find_by_id(session, member_id)
-            if user is None:
-                raise NotFoundException(
-                    ErrorCode.DATA_DOES_NOT_EXIST,
-                    "존재하지 않는 사용자가 포함되어 있습니다."
-                )
+        missing_ids = [member_id for member_id in member_ids if member_id not in users]
+        if len(missing_ids) > 0:
+            raise NotFoundException(
+                ErrorCode.DATA_DOES_NOT_EXIST,
+                f"존재하지 않는 사용자가 포함되어 있습니다. ({', '.join(missing_ids)})"
+            )
 
-            await self.center_schedule_member_repository.save(
+        existing_ids = {member.user_id for member in members}
+        removed_ids = [user_id for user_id in existing_ids if user_id not in users]
+        if len(removed_ids) > 0:
+            await self.center_schedule_member_repository.delete_by_schedule_id_and_user_ids(
                 session,
-                CenterScheduleMember(user=user, schedule=schedule)
+                schedule.id,
+                removed_ids
             )
 
-            updated_members.append(user)
+        await self.center_schedule_member_repository.insert_all(
+            session,
+            [CenterScheduleMember(user_id=member_id, schedule_id=schedule.id)
+             for member_id in member_ids if member_id not in existing_ids]
+        )
 
-        schedule.update(**req.schedule_info.dict())
-        return ScheduleResponseDto.from_entity(schedule, updated_members)
+        return [users[member_id] for member_id in member_ids]
 
     @transactional(read_only=True)
     async def find_schedules_by_center(self,
@@ -3,24 +3,33 @@ from datetime import timedelta
 from fastapi_pagination import Params
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from claon_admin.common.enum import PostCountPeriod
 from claon_admin.common.error.exception import NotFoundException, ErrorCode, UnauthorizedException
-from claon_admin.common.util.pagination import paginate
+from claon_admin.common.util.pagination import paginate, CursorParams
 from claon_admin.common.util.time import now
 from claon_admin.common.util.transaction import transactional
 from claon_admin.model.auth import RequestUser
 from claon_admin.model.post import PostSummaryResponseDto, PostBriefResponseDto, PostFinder
 from claon_admin.schema.center import CenterRepository
-from claon_admin.schema.post import PostCountHistoryRepository, PostRepository
+from claon_admin.schema.file import ImageVariantRepository
+from claon_admin.schema.post import PostCountHistoryRepository, PostRepository, PostCountTotalRepository, \
+    PostCountRollupRepository
 
 
 class PostService:
     def __init__(self,
                  center_repository: CenterRepository,
                  post_repository: PostRepository,
-                 post_count_history_repository: PostCountHistoryRepository):
+                 post_count_history_repository: PostCountHistoryRepository,
+                 post_count_total_repository: PostCountTotalRepository,
+                 post_count_rollup_repository: PostCountRollupRepository,
+                 image_variant_repository: ImageVariantRepository):
         self.center_repository = center_repository
         self.post_repository = post_repository
         self.post_count_history_repository = post_count_history_repository
+        self.post_count_total_repository = post_count_total_repository
+        self.post_count_rollup_repository = post_count_rollup_repository
+        self.image_variant_repository = image_variant_repository
 
     @transactional(read_only=True)
     async def find_posts_summary_by_center(self,
@@ -40,24 +49,44 @@ class PostService:
                 "암장 관리자가 아닙니다."
             )
 
-        total_count = await self.post_count_history_repository.sum_count_by_center(session, center.id)
+        count_total = await self.post_count_total_repository.find_by_id(session, center.id)
 
         end_date = now().date()
         start_date = end_date - timedelta(days=52 * 7 + end_date.weekday())
-        count_history_by_year = await self.post_count_history_repository.find_by_center_and_date(
+        first_reg_date = await self.post_count_history_repository.find_first_reg_date_by_center_and_date(
             session,
             center.id,
             start_date,
             end_date
         )
+        count_history_by_month = await self.post_count_history_repository.find_by_center_and_date(
+            session,
+            center.id,
+            end_date - timedelta(weeks=4),
+            end_date
+        )
+        count_rollup_by_week = await self.post_count_rollup_repository.find_by_center_and_period(
+            session,
+            center.id,
+            PostCountPeriod.WEEK,
+            start_date,
+            end_date
+        )
 
-        return PostSummaryResponseDto.from_entity(center, end_date, total_count, count_history_by_year)
+        return PostSummaryResponseDto.from_entity(
+            center,
+            first_reg_date,
+            end_date,
+            count_total,
+            count_history_by_month,
+            count_rollup_by_week
+        )
 
     @transactional(read_only=True)
     async def find_posts_by_center(self,
                                    session: AsyncSession,
                                    subject: RequestUser,
-                                   params: Params,
+                                   params: Params | CursorParams,
                                    center_id: str,
                                    finder: PostFinder):
         center = await self.center_repository.find_by_id_with_details(session, center_id)
@@ -88,4 +117,8 @@ class PostService:
             finder.end_date
         )
 
-        return await paginate(PostBriefResponseDto, pages)
+        thumbnails = await self.image_variant_repository.find_thumbnails(
+            session,
+            [url for post in pages.items for url in [post.img[0].url, post.user.profile_img]]
+        )
+        return await paginate(PostBriefResponseDto, pages, thumbnails=thumbnails)
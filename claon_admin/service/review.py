@@ -4,7 +4,7 @@ from fastapi_pagination import Params
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.error.exception import NotFoundException, ErrorCode, UnauthorizedException
-from claon_admin.common.util.pagination import paginate
+from claon_admin.common.util.pagination import paginate, CursorParams
 from claon_admin.common.util.transaction import transactional
 from claon_admin.model.auth import RequestUser
 from claon_admin.model.review import ReviewBriefResponseDto, ReviewAnswerRequestDto, ReviewAnswerResponseDto, \
@@ -25,7 +25,7 @@ class ReviewService:
     async def find_reviews_by_center(self,
                                      session: AsyncSession,
                                      subject: RequestUser,
-                                     params: Params,
+                                     params: Params | CursorParams,
                                      center_id: str,
                                      finder: ReviewFinder):
         center = await self.center_repository.find_by_id(session, center_id)
@@ -3,16 +3,19 @@ from fastapi_pagination import Params
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.error.exception import BadRequestException, ErrorCode, NotFoundException
+from claon_admin.common.util.cache import user_cache
+from claon_admin.common.util.image import request_image_variants
 from claon_admin.common.util.jwt import create_access_token, create_refresh_key
-from claon_admin.common.util.pagination import paginate
-from claon_admin.common.util.transaction import transactional
+from claon_admin.common.util.pagination import paginate, CursorParams
+from claon_admin.common.util.redis import revoke_refresh_keys_by_user_id
+from claon_admin.common.util.transaction import transactional, after_commit
 from claon_admin.service.oauth import OAuthUserInfoProviderSupplier
-from claon_admin.common.util.s3 import upload_file
+from claon_admin.common.util.s3 import upload_file, create_presigned_upload, confirm_upload
 from claon_admin.model.auth import OAuthUserInfoDto
-from claon_admin.model.auth import RequestUser
+from claon_admin.model.auth import RequestUser, RefreshUser
 from claon_admin.model.center import CenterAuthRequestDto, CenterResponseDto
 from claon_admin.common.enum import OAuthProvider, Role, LectorUploadPurpose, UserUploadPurpose
-from claon_admin.model.file import UploadFileResponseDto
+from claon_admin.model.file import UploadFileResponseDto, PresignedUploadResponseDto
 from claon_admin.model.user import IsDuplicatedNicknameResponseDto, LectorRequestDto, LectorResponseDto, \
     UserProfileResponseDto, JwtReissueDto, CenterNameResponseDto, UserNameResponseDto
 from claon_admin.model.user import SignInRequestDto, JwtResponseDto
@@ -63,26 +66,27 @@ class UserService:
         user = await self.user_repository.find_by_id(session, subject.id)
 
         user.sign_up(**req.profile.dict())
+        after_commit(lambda: user_cache.evict(user.id))
         center = await self.center_repository.save(session, Center.of(subject.id, **req.center.dict()))
 
         holds = []
         if req.hold_info is not None:
             hold_is_color = req.hold_info.is_color
-            holds = await self.center_hold_repository.save_all(
+            holds = await self.center_hold_repository.insert_all(
                 session,
-                [CenterHold(center=center, name=e.name, difficulty=e.difficulty, is_color=hold_is_color)
+                [CenterHold(center_id=center.id, name=e.name, difficulty=e.difficulty, is_color=hold_is_color)
                  for e in req.hold_info.hold_list]
             )
 
-        walls = await self.center_wall_repository.save_all(
+        walls = await self.center_wall_repository.insert_all(
             session,
-            [CenterWall(center=center, name=e.name, type=e.wall_type.value)
+            [CenterWall(center_id=center.id, name=e.name, type=e.wall_type.value)
              for e in req.wall_list]
         )
 
-        await self.center_approved_file_repository.save_all(
+        await self.center_approved_file_repository.insert_all(
             session,
-            [CenterApprovedFile(user_id=subject.id, center=center, url=e)
+            [CenterApprovedFile(user_id=subject.id, center_id=center.id, url=e)
              for e in req.proof_list]
         )
 
@@ -105,6 +109,7 @@ class UserService:
         user = await self.user_repository.find_by_id(session, subject.id)
 
         user.sign_up(**req.profile.dict())
+        after_commit(lambda: user_cache.evict(user.id))
         lector = await self.lector_repository.save(session, Lector.of(subject.id, **req.lector.dict()))
 
         await self.lector_approved_file_repository.save_all(
@@ -125,13 +130,16 @@ class UserService:
 
         return JwtResponseDto(
             access_token=create_access_token(user.id),
-            refresh_key=create_refresh_key(user.id),
+            refresh_key=await create_refresh_key(user.id),
             is_signed_up=user.is_signed_up(),
             profile=UserProfileResponseDto.from_entity(user)
         )
 
-    async def reissue_token(self, subject: RequestUser):
-        return JwtReissueDto(access_token=create_access_token(subject.id))
+    async def reissue_token(self, subject: RefreshUser):
+        return JwtReissueDto(access_token=create_access_token(subject.id), refresh_key=subject.refresh_key)
+
+    async def sign_out(self, subject: RequestUser):
+        await revoke_refresh_keys_by_user_id(subject.id)
 
     async def upload_profile(self, file: UploadFile):
         purpose = UserUploadPurpose.PROFILE
@@ -142,6 +150,30 @@ class UserService:
             )
 
         url = await upload_file(file, "user", purpose.value)
+        await request_image_variants(url)
+        return UploadFileResponseDto(file_url=url)
+
+    async def create_profile_upload_url(self, filename: str):
+        purpose = UserUploadPurpose.PROFILE
+        if not purpose.is_valid_extension(filename.split('.')[-1]):
+            raise BadRequestException(
+                ErrorCode.INVALID_FORMAT,
+                "지원하지 않는 포맷입니다."
+            )
+
+        url, fields, file_url = create_presigned_upload(filename, "user", purpose.value)
+        return PresignedUploadResponseDto(url=url, fields=fields, file_url=file_url)
+
+    async def confirm_profile_upload(self, file_url: str):
+        purpose = UserUploadPurpose.PROFILE
+        if not purpose.is_valid_extension(file_url.split('.')[-1]):
+            raise BadRequestException(
+                ErrorCode.INVALID_FORMAT,
+                "지원하지 않는 포맷입니다."
+            )
+
+        url = await confirm_upload(file_url, "user", purpose.value)
+        await request_image_variants(url)
         return UploadFileResponseDto(file_url=url)
 
     async def upload_file(self, purpose: LectorUploadPurpose, file: UploadFile):
@@ -154,6 +186,26 @@ class UserService:
         url = await upload_file(file, "lector", purpose.value)
         return UploadFileResponseDto(file_url=url)
 
+    async def create_upload_url(self, purpose: LectorUploadPurpose, filename: str):
+        if not purpose.is_valid_extension(filename.split('.')[-1]):
+            raise BadRequestException(
+                ErrorCode.INVALID_FORMAT,
+                "지원하지 않는 포맷입니다."
+            )
+
+        url, fields, file_url = create_presigned_upload(filename, "lector", purpose.value)
+        return PresignedUploadResponseDto(url=url, fields=fields, file_url=file_url)
+
+    async def confirm_upload(self, purpose: LectorUploadPurpose, file_url: str):
+        if not purpose.is_valid_extension(file_url.split('.')[-1]):
+            raise BadRequestException(
+                ErrorCode.INVALID_FORMAT,
+                "지원하지 않는 포맷입니다."
+            )
+
+        url = await confirm_upload(file_url, "lector", purpose.value)
+        return UploadFileResponseDto(file_url=url)
+
     @transactional(read_only=True)
     async def find_centers(self, session: AsyncSession, subject: RequestUser):
         centers = await self.center_repository.find_by_user_id(session, subject.id)
@@ -167,7 +219,7 @@ class UserService:
         return [CenterNameResponseDto.from_entity(center) for center in centers]
 
     @transactional(read_only=True)
-    async def find_all_by_nickname(self, session: AsyncSession, params: Params, nickname: str):
+    async def find_all_by_nickname(self, session: AsyncSession, params: Params | CursorParams, nickname: str):
         pages = await self.user_repository.find_all_by_nickname(session, nickname, params)
 
         return await paginate(UserNameResponseDto, pages)
@@ -185,7 +237,7 @@ class UserService:
 
         return JwtResponseDto(
             access_token=create_access_token(user.id),
-            refresh_key=create_refresh_key(user.id),
+            refresh_key=await create_refresh_key(user.id),
             is_signed_up=is_signed_up,
             profile=UserProfileResponseDto.from_entity(user)
         )
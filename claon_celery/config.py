@@ -1,9 +1,52 @@
+from celery.schedules import crontab
+from kombu import Queue
+
 from claon_celery.env import config
 
+celery_config = config.get_by_key("celery", {})
 
-broker_url = "amqp://{user_name}:{password}@{ip}:{port}".format(
+broker_url = celery_config.get_by_key("broker-url") or "amqp://{user_name}:{password}@{ip}:{port}".format(
     user_name=config.get("celery.user"),
     password=config.get("celery.password"),
     ip=config.get("celery.host"),
     port=config.get("celery.port")
 )
+
+timezone = "Asia/Seoul"
+
+task_always_eager = celery_config.get_by_key("always-eager", False)
+task_acks_late = True
+worker_prefetch_multiplier = 1
+
+task_default_queue = "default"
+task_queues = (
+    Queue("default"),
+    Queue("job"),
+    Queue("storage"),
+    Queue("image"),
+    Queue("notification")
+)
+task_routes = {
+    "claon_celery.tasks.count_post_by_day": {"queue": "job"},
+    "claon_celery.tasks.backfill_post_count": {"queue": "job"},
+    "claon_celery.tasks.delete_file": {"queue": "storage"},
+    "claon_celery.tasks.delete_pending_files": {"queue": "storage"},
+    "claon_celery.tasks.collect_orphan_files": {"queue": "storage"},
+    "claon_celery.tasks.create_image_variants": {"queue": "image"},
+    "claon_celery.tasks.send_slack_message": {"queue": "notification"}
+}
+
+beat_schedule = {
+    "count-post-by-day": {
+        "task": "claon_celery.tasks.count_post_by_day",
+        "schedule": crontab(hour=0, minute=0)
+    },
+    "delete-pending-files": {
+        "task": "claon_celery.tasks.delete_pending_files",
+        "schedule": config.get_by_key("job", {}).get_by_key("file-deletion", {}).get_by_key("interval-seconds", 60)
+    },
+    "collect-orphan-files": {
+        "task": "claon_celery.tasks.collect_orphan_files",
+        "schedule": crontab(hour=4, minute=0, day_of_week="sun")
+    }
+}
@@ -1,6 +1,77 @@
+import asyncio
+from datetime import date
+
+from PIL import UnidentifiedImageError
+from slack_sdk.errors import SlackApiError
+
+from claon_admin.common.util.db import db
+from claon_admin.common.util.image import create_image_variants as create_image_variants_job
+from claon_admin.common.util.s3 import delete_object
+from claon_admin.common.util.slack import slack
+from claon_admin.container import Container
+from claon_admin.job.backfill import backfill_post_count as backfill_post_count_job
+from claon_admin.job.file import delete_pending_files as delete_pending_files_job
+from claon_admin.job.orphan import collect_orphan_files as collect_orphan_files_job
+from claon_admin.job.post import count_post_by_day_job, POST_COUNT_CONCURRENCY
 from claon_celery.celery import celery_client
 
+RETRY_OPTIONS = {
+    "retry_backoff": True,
+    "retry_backoff_max": 600,
+    "retry_jitter": True,
+    "max_retries": 5
+}
+
+container = Container()
+
+
+def run(coroutine):
+    async def run_and_dispose():
+        try:
+            return await coroutine
+        finally:
+            await db.dispose()
+
+    return asyncio.run(run_and_dispose())
+
 
 @celery_client.task()
 def test_task():
     pass
+
+
+@celery_client.task(autoretry_for=(Exception,), **RETRY_OPTIONS)
+def count_post_by_day():
+    failed = run(count_post_by_day_job.run_pending())
+    if len(failed) > 0:
+        raise RuntimeError(f"count_post_by_day failed for {failed}")
+
+
+@celery_client.task(autoretry_for=(Exception,), **RETRY_OPTIONS)
+def backfill_post_count(start: str, end: str, concurrency: int = POST_COUNT_CONCURRENCY):
+    run(backfill_post_count_job(date.fromisoformat(start), date.fromisoformat(end), concurrency))
+
+
+@celery_client.task(autoretry_for=(Exception,), **RETRY_OPTIONS)
+def delete_file(url: str):
+    delete_object(url)
+
+
+@celery_client.task()
+def delete_pending_files():
+    run(delete_pending_files_job())
+
+
+@celery_client.task()
+def collect_orphan_files(dry_run: bool = False):
+    return run(collect_orphan_files_job(dry_run=dry_run))
+
+
+@celery_client.task(autoretry_for=(Exception,), dont_autoretry_for=(UnidentifiedImageError,), **RETRY_OPTIONS)
+def create_image_variants(url: str):
+    run(create_image_variants_job(url))
+
+
+@celery_client.task(autoretry_for=(SlackApiError,), **RETRY_OPTIONS)
+def send_slack_message(text: str):
+    slack.send_message(text)
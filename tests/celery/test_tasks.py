@@ -0,0 +1,121 @@
+from datetime import date, datetime
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import pytest
+from PIL import UnidentifiedImageError
+from slack_sdk.errors import SlackApiError
+
+from claon_celery import tasks
+from claon_celery.celery import celery_client
+
+
+@pytest.mark.describe("Test case for celery tasks")
+class TestCeleryTasks(object):
+    @pytest.mark.it("Tasks are routed to their own queue")
+    def test_route(self):
+        # given
+        router = celery_client.amqp.router
+
+        # when
+        routes = {name: router.route({}, name)["queue"].name for name in [
+            "claon_celery.tasks.count_post_by_day",
+            "claon_celery.tasks.backfill_post_count",
+            "claon_celery.tasks.delete_file",
+            "claon_celery.tasks.create_image_variants",
+            "claon_celery.tasks.send_slack_message",
+            "claon_celery.tasks.test_task"
+        ]}
+
+        # then
+        assert routes == {
+            "claon_celery.tasks.count_post_by_day": "job",
+            "claon_celery.tasks.backfill_post_count": "job",
+            "claon_celery.tasks.delete_file": "storage",
+            "claon_celery.tasks.create_image_variants": "image",
+            "claon_celery.tasks.send_slack_message": "notification",
+            "claon_celery.tasks.test_task": "default"
+        }
+
+    @pytest.mark.it("Daily aggregation is scheduled by beat")
+    def test_beat_schedule(self):
+        # then
+        assert celery_client.conf.beat_schedule["count-post-by-day"]["task"] == "claon_celery.tasks.count_post_by_day"
+
+    @pytest.mark.it("Success case for count post by day")
+    def test_count_post_by_day(self):
+        # given
+        with patch.object(tasks.count_post_by_day_job, "run_pending", AsyncMock(return_value=[])) as run_pending:
+            # when
+            tasks.count_post_by_day.delay().get()
+
+        # then
+        run_pending.assert_awaited_once()
+
+    @pytest.mark.it("Retry count post by day while a firing fails")
+    def test_count_post_by_day_with_retry(self):
+        # given
+        with patch.object(tasks.count_post_by_day_job, "run_pending", AsyncMock(side_effect=[
+            [datetime(2023, 6, 1)],
+            []
+        ])) as run_pending:
+            # when
+            tasks.count_post_by_day.delay().get()
+
+        # then
+        assert run_pending.await_count == 2
+
+    @pytest.mark.it("Success case for backfill post count")
+    def test_backfill_post_count(self):
+        # given
+        with patch.object(tasks, "backfill_post_count_job", AsyncMock()) as backfill_post_count:
+            # when
+            tasks.backfill_post_count.delay("2023-06-01", "2023-06-07", 2).get()
+
+        # then
+        backfill_post_count.assert_awaited_once_with(date(2023, 6, 1), date(2023, 6, 7), 2)
+
+    @pytest.mark.it("Success case for delete file")
+    def test_delete_file(self):
+        # given
+        with patch.object(tasks, "delete_object", MagicMock(side_effect=[Exception(), None])) as delete_object:
+            # when
+            tasks.delete_file.delay("https://bucket.s3.region.amazonaws.com/center/img.png").get()
+
+        # then
+        assert delete_object.call_count == 2
+
+    @pytest.mark.it("Success case for create image variants")
+    def test_create_image_variants(self):
+        # given
+        url = "https://bucket.s3.region.amazonaws.com/center/image/img.png"
+        with patch.object(tasks, "create_image_variants_job", AsyncMock()) as create_image_variants:
+            # when
+            tasks.create_image_variants.delay(url).get()
+
+        # then
+        create_image_variants.assert_awaited_once_with(url)
+
+    @pytest.mark.it("Fail case for create image variants without retry on undecodable image")
+    def test_create_image_variants_with_undecodable_image(self):
+        # given
+        url = "https://bucket.s3.region.amazonaws.com/center/image/img.png"
+        error = UnidentifiedImageError("cannot identify image file")
+        with patch.object(tasks, "create_image_variants_job", AsyncMock(side_effect=error)) as create_image_variants:
+            # when
+            result = tasks.create_image_variants.delay(url)
+
+        # then
+        assert result.failed()
+        create_image_variants.assert_awaited_once_with(url)
+
+    @pytest.mark.it("Fail case for send slack message after max retries")
+    def test_send_slack_message_with_max_retries(self):
+        # given
+        error = SlackApiError("error", MagicMock())
+        with patch.object(tasks.slack, "send_message", MagicMock(side_effect=error)) as send_message:
+            # when
+            result = tasks.send_slack_message.delay("message")
+
+        # then
+        assert result.failed()
+        assert send_message.call_count == tasks.RETRY_OPTIONS["max_retries"] + 1
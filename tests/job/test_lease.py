@@ -0,0 +1,122 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+from fastapi_pagination import Params
+from sqlalchemy import update
+
+from claon_admin.common.consts import TIME_ZONE_KST
+from claon_admin.common.enum import JobRunStatus
+from claon_admin.common.util.db import Database
+from claon_admin.job import lease
+from claon_admin.job.lease import LeasedJob, job_run_repository
+from claon_admin.schema.job import JobRun
+
+JOB_NAME = "test_job"
+SCHEDULED_AT = datetime(2023, 6, 1)
+
+
+@pytest.fixture
+async def database(tmp_path, monkeypatch):
+    database = Database(f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'job.db')}")
+    await database.create_database()
+    monkeypatch.setattr(lease, "db", database)
+    monkeypatch.setattr(lease, "LEASE_SECONDS", 0.2)
+    monkeypatch.setattr(lease, "LEASE_RENEW_SECONDS", 0.05)
+    yield database
+    await database.dispose()
+
+
+async def find_job_run(database: Database):
+    async with database.async_session_maker() as session:
+        pages = await job_run_repository.find_all_by_job_name(session, Params(page=1, size=10), JOB_NAME)
+        return pages.items[0]
+
+
+@pytest.mark.describe("Test case for leased job")
+class TestLeasedJob(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Renew the lease while a run takes longer than the lease")
+    async def test_renew_lease(self, database: Database):
+        # given
+        acquired_by_other = []
+
+        async def func(scheduled_at: datetime):
+            await asyncio.sleep(0.5)
+            async with database.async_session_maker() as session:
+                acquired_by_other.append(await job_run_repository.acquire(
+                    session,
+                    JOB_NAME,
+                    scheduled_at,
+                    "other",
+                    lease.now(),
+                    lease.now()
+                ))
+
+        job = LeasedJob(JOB_NAME, func, CronTrigger(hour=0))
+
+        # when
+        status = await job.run(SCHEDULED_AT)
+
+        # then
+        assert status == JobRunStatus.SUCCEEDED
+        assert acquired_by_other == [False]
+        assert (await find_job_run(database)).status == JobRunStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Stop a run that lost its lease without finishing it")
+    async def test_lost_lease(self, database: Database):
+        # given
+        finished = []
+
+        async def func(scheduled_at: datetime):
+            async with database.async_session_maker() as session:
+                await session.execute(update(JobRun)
+                                      .where(JobRun.job_name == JOB_NAME)
+                                      .values(owner="other"))
+                await session.commit()
+            await asyncio.sleep(1)
+            finished.append(scheduled_at)
+
+        job = LeasedJob(JOB_NAME, func, CronTrigger(hour=0))
+
+        # when
+        status = await job.run(SCHEDULED_AT)
+
+        # then
+        assert status is None
+        assert finished == []
+        job_run = await find_job_run(database)
+        assert job_run.owner == "other"
+        assert job_run.status == JobRunStatus.RUNNING
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Report only failed firings, not the ones leased by another owner")
+    async def test_run_pending_skips_leased(self, database: Database):
+        # given
+        async def func(scheduled_at: datetime):
+            raise RuntimeError()
+
+        job = LeasedJob(JOB_NAME, func, CronTrigger(hour=0, minute=0, second=0, timezone=TIME_ZONE_KST))
+        leased_at = job.fire_times(lease.now() - timedelta(days=1), lease.now())[-1]
+        failed_at = leased_at - timedelta(days=1)
+        async with database.async_session_maker() as session:
+            await job_run_repository.acquire(session, JOB_NAME, failed_at, "other", lease.now(), lease.now())
+            await job_run_repository.finish(session, JOB_NAME, failed_at, "other", JobRunStatus.FAILED, lease.now())
+            await job_run_repository.acquire(
+                session,
+                JOB_NAME,
+                leased_at,
+                "other",
+                lease.now(),
+                lease.now() + timedelta(hours=1)
+            )
+            await session.commit()
+
+        # when
+        failed = await job.run_pending()
+
+        # then
+        assert failed == [failed_at]
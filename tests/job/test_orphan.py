@@ -0,0 +1,154 @@
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch, AsyncMock
+
+import boto3
+import pytest
+from moto import mock_aws
+from sqlalchemy import update
+
+import claon_admin.container  # noqa: F401, registers every table on Base.metadata
+from claon_admin.common.util import s3 as s3_util
+from claon_admin.common.util.db import Database
+from claon_admin.common.util.time import now
+from claon_admin.job import orphan
+from claon_admin.job.orphan import ReferenceSet, collect_orphan_files, collect_references, to_urls, to_key
+from claon_admin.schema.file import FileObject, FileObjectRepository, ImageVariantRepository
+
+BUCKET = "claon-test"
+REGION = "us-east-1"
+KEYS = [
+    "center/image/2023-06-01/referenced.png",
+    "center/image/2023-06-01/orphan.png",
+    "lector/proof/2023-06-01/orphan.pdf",
+    "post/2023-06-01/not-managed.png"
+]
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    with mock_aws():
+        client = boto3.client("s3", region_name=REGION)
+        client.create_bucket(Bucket=BUCKET)
+        for key in KEYS:
+            client.put_object(Bucket=BUCKET, Key=key, Body=b"file")
+        monkeypatch.setattr(s3_util, "s3", client)
+        monkeypatch.setattr(s3_util, "AWS_S3_BUCKET", BUCKET)
+        monkeypatch.setattr(s3_util, "AWS_REGION", REGION)
+        yield client
+
+
+async def add_referenced(reference_set: ReferenceSet, acquired_after: datetime):
+    reference_set.add_all(to_urls(
+        '[{"url": "https://claon-test.s3.us-east-1.amazonaws.com/center/image/2023-06-01/referenced.png"}]',
+        True
+    ))
+
+
+@pytest.fixture
+async def database(tmp_path, monkeypatch):
+    database = Database(f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'orphan.db')}")
+    await database.create_database()
+    monkeypatch.setattr(orphan, "db", database)
+    yield database
+    await database.dispose()
+
+
+@pytest.mark.describe("Test case for orphan file collector")
+class TestCollectOrphanFiles(object):
+    @pytest.mark.it("Reference set finds keys of stored urls")
+    def test_reference_set(self, tmp_path):
+        # given
+        reference_set = ReferenceSet(os.path.join(tmp_path, "reference.db"))
+        reference_set.add_all(["https://bucket.s3.region.amazonaws.com/user/profile/2023-06-01/a.png", ""])
+
+        # when
+        result = reference_set.find_referenced(["user/profile/2023-06-01/a.png", "user/profile/2023-06-01/b.png"])
+
+        # then
+        assert result == {"user/profile/2023-06-01/a.png"}
+        assert reference_set.count() == 1
+        reference_set.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Delete unreferenced files under managed prefixes")
+    @patch("claon_admin.job.orphan.collect_references", add_referenced)
+    @patch("claon_admin.job.orphan.file_object_repository", AsyncMock(spec=FileObjectRepository))
+    @patch("claon_admin.job.orphan.image_variant_repository", AsyncMock(spec=ImageVariantRepository))
+    async def test_collect_orphan_files(self, s3_client):
+        # given
+        orphan.file_object_repository.delete_unacquired_by_urls.side_effect = \
+            lambda session, urls, acquired_after: urls
+
+        # when
+        result = await collect_orphan_files(grace_days=-1)
+
+        # then
+        remaining = [e["Key"] for e in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]]
+        assert sorted(remaining) == ["center/image/2023-06-01/referenced.png", "post/2023-06-01/not-managed.png"]
+        assert result == {"scanned": 3, "orphaned": 2, "deleted": 2, "failed": 0}
+        assert orphan.file_object_repository.delete_unacquired_by_urls.await_count == 2
+        assert orphan.image_variant_repository.delete_by_urls.await_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Keep files acquired after the references were collected")
+    @patch("claon_admin.job.orphan.collect_references", add_referenced)
+    async def test_collect_orphan_files_with_acquired_file(self, s3_client, database: Database):
+        # given
+        url = "https://claon-test.s3.us-east-1.amazonaws.com/center/image/2023-06-01/orphan.png"
+        async with database.async_session_maker() as session:
+            await FileObjectRepository().register(session, "center/image", "a" * 64, url, 4)
+            # acquired while the listing is running, i.e. after the grace period boundary of this run
+            await session.execute(update(FileObject)
+                                  .where(FileObject.url == url)
+                                  .values(last_acquired_at=now() + timedelta(days=2)))
+            await session.commit()
+
+        # when
+        result = await collect_orphan_files(grace_days=-1)
+
+        # then
+        remaining = [e["Key"] for e in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]]
+        assert sorted(remaining) == [
+            "center/image/2023-06-01/orphan.png",
+            "center/image/2023-06-01/referenced.png",
+            "post/2023-06-01/not-managed.png"
+        ]
+        assert result == {"scanned": 3, "orphaned": 2, "deleted": 1, "failed": 0}
+        async with database.async_session_maker() as session:
+            assert await FileObjectRepository().acquire(session, "center/image", "a" * 64) == url
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Keep files within the grace period or on dry run")
+    @patch("claon_admin.job.orphan.collect_references", add_referenced)
+    async def test_collect_orphan_files_with_grace_period(self, s3_client):
+        # when
+        within_grace = await collect_orphan_files(grace_days=7)
+        dry_run = await collect_orphan_files(grace_days=-1, dry_run=True)
+
+        # then
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == len(KEYS)
+        assert within_grace["orphaned"] == 0
+        assert dry_run["orphaned"] == 2
+        assert dry_run["deleted"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Recently acquired deduplicated files count as referenced")
+    async def test_collect_references_with_acquired_file(self, tmp_path, database: Database):
+        # given
+        url = "https://claon-test.s3.us-east-1.amazonaws.com/center/image/2023-06-01/acquired.png"
+        async with database.async_session_maker() as session:
+            await FileObjectRepository().register(session, "center/image", "a" * 64, url, 4)
+            await session.commit()
+        recent = ReferenceSet(os.path.join(tmp_path, "recent.db"))
+        stale = ReferenceSet(os.path.join(tmp_path, "stale.db"))
+
+        # when
+        await collect_references(recent, now() - timedelta(days=1))
+        await collect_references(stale, now() + timedelta(days=1))
+
+        # then
+        assert recent.find_referenced([to_key(url)]) == {to_key(url)}
+        assert stale.find_referenced([to_key(url)]) == set()
+        recent.close()
+        stale.close()
@@ -179,6 +179,18 @@ class TestCenterRepository(object):
         # then
         assert await center_repository.find_all_ids_by_approved_true(session) == [center_fixture.id]
 
+    @pytest.mark.asyncio
+    async def test_stream_ids_by_approved_true(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # when
+        partitions = [partition async for partition in center_repository.stream_ids_by_approved_true(session, 10)]
+
+        # then
+        assert partitions == [[center_fixture.id]]
+
     @pytest.mark.asyncio
     async def test_find_by_user_id(
             self,
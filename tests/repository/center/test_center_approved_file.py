@@ -61,3 +61,18 @@ class TestCenterApprovedFileRepository(object):
 
         # then
         assert await center_approved_file_repository.find_all_by_center_id(session, center_fixture.id) == []
+
+    @pytest.mark.asyncio
+    async def test_find_referenced_urls(
+            self,
+            session: AsyncSession,
+            center_approved_file_fixture: CenterApprovedFile
+    ):
+        # when
+        result = await center_approved_file_repository.find_referenced_urls(
+            session,
+            [center_approved_file_fixture.url, "https://example.com/other.jpg"]
+        )
+
+        # then
+        assert result == {center_approved_file_fixture.url}
@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from claon_admin.common.util import repository
 from claon_admin.schema.center import Center, CenterHold
 from tests.repository.center.conftest import center_hold_repository
 
@@ -32,6 +33,70 @@ class TestCenterHoldRepository(object):
         # then
         assert center_holds == [center_holds_fixture]
 
+    @pytest.mark.asyncio
+    async def test_insert_all_center_holds(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # given
+        holds = [
+            CenterHold(center_id=center_fixture.id, name="hold_1", difficulty="easy"),
+            CenterHold(center_id=center_fixture.id, name="hold_2", difficulty="hard")
+        ]
+
+        # when
+        center_holds = await center_hold_repository.insert_all(session, holds)
+
+        # then
+        assert center_holds == holds
+        assert all(hold.id is not None for hold in center_holds)
+        assert all(hold.is_color is False for hold in center_holds)
+        assert await center_hold_repository.find_by_id(session, holds[0].id) is holds[0]
+
+    @pytest.mark.asyncio
+    async def test_insert_all_center_holds_in_chunks(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            monkeypatch
+    ):
+        # given
+        monkeypatch.setattr(repository, "MAX_BIND_PARAMETERS", 20)
+        holds = [CenterHold(center_id=center_fixture.id, name=f"hold_{i}", difficulty="easy") for i in range(7)]
+
+        # when
+        await center_hold_repository.insert_all(session, holds)
+
+        # then
+        assert len(await center_hold_repository.find_all_by_center_id(session, center_fixture.id)) == 7
+
+    @pytest.mark.asyncio
+    async def test_upsert_all_center_holds(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            center_holds_fixture: CenterHold
+    ):
+        # given
+        new_hold = CenterHold(center_id=center_fixture.id, name="hold_new", difficulty="easy")
+        updated_hold = CenterHold(
+            id=center_holds_fixture.id,
+            center_id=center_fixture.id,
+            name="hold_updated",
+            difficulty="easy"
+        )
+
+        # when
+        result = await center_hold_repository.upsert_all(session, [new_hold, updated_hold], ["id"])
+
+        # then
+        assert sorted(hold.name for hold in result) == ["hold_new", "hold_updated"]
+        assert all(hold.id is not None for hold in result)
+        assert center_holds_fixture in result
+        assert center_holds_fixture.name == "hold_updated"
+        assert len(await center_hold_repository.find_all_by_center_id(session, center_fixture.id)) == 2
+
     @pytest.mark.asyncio
     async def test_find_all_center_holds_by_center_id(
             self,
@@ -44,3 +109,22 @@ class TestCenterHoldRepository(object):
 
         # then
         assert center_holds == [center_holds_fixture]
+
+    @pytest.mark.asyncio
+    async def test_delete_center_holds_by_center_id_and_ids(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            center_holds_fixture: CenterHold
+    ):
+        # given
+        kept_hold = await center_hold_repository.save(
+            session,
+            CenterHold(center=center_fixture, name="hold_kept", difficulty="easy")
+        )
+
+        # when
+        await center_hold_repository.delete_by_center_id_and_ids(session, center_fixture.id, [center_holds_fixture.id])
+
+        # then
+        assert await center_hold_repository.find_all_by_center_id(session, center_fixture.id) == [kept_hold]
@@ -51,3 +51,27 @@ class TestCenterScheduleRepository(object):
 
         # then
         assert schedules == [schedule_fixture]
+
+    @pytest.mark.asyncio
+    async def test_find_by_center_id_and_date_from_boundary(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # given
+        date_from = datetime.strptime("2023-07-30", "%Y-%m-%d").date()
+        schedules = await center_schedule_repository.insert_all(session, [
+            CenterSchedule(center_id=center_fixture.id, title=title, start_time=start_time, end_time=start_time)
+            for title, start_time in [
+                ("before", datetime(2023, 7, 29, 23, 59)),
+                ("first", datetime(2023, 7, 30, 0, 0)),
+                ("last", datetime(2023, 9, 10, 23, 59)),
+                ("after", datetime(2023, 9, 11, 0, 0))
+            ]
+        ])
+
+        # when
+        result = await center_schedule_repository.find_by_center_id_and_date_from(session, center_fixture.id, date_from)
+
+        # then
+        assert result == schedules[1:3]
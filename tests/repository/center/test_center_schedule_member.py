@@ -32,3 +32,29 @@ class TestCenterScheduleMemberRepository(object):
 
         # then
         assert await center_schedule_member_repository.find_by_id(session, schedule_member_fixture.id) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_schedule_member_by_schedule_id_and_user_ids(
+            self,
+            session: AsyncSession,
+            user_fixture: User,
+            review_user_fixture: User,
+            schedule_fixture: CenterSchedule,
+            schedule_member_fixture: CenterScheduleMember
+    ):
+        # given
+        other_member = (await center_schedule_member_repository.insert_all(
+            session,
+            [CenterScheduleMember(user_id=review_user_fixture.id, schedule_id=schedule_fixture.id)]
+        ))[0]
+
+        # when
+        await center_schedule_member_repository.delete_by_schedule_id_and_user_ids(
+            session,
+            schedule_fixture.id,
+            [user_fixture.id]
+        )
+
+        # then
+        assert await center_schedule_member_repository.find_by_id(session, schedule_member_fixture.id) is None
+        assert await center_schedule_member_repository.find_by_id(session, other_member.id) == other_member
@@ -44,3 +44,22 @@ class TestCenterWallRepository(object):
 
         # then
         assert center_walls == [center_walls_fixture]
+
+    @pytest.mark.asyncio
+    async def test_delete_center_walls_by_center_id_and_ids(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            center_walls_fixture: CenterWall
+    ):
+        # given
+        kept_wall = await center_wall_repository.save(
+            session,
+            CenterWall(center=center_fixture, name="wall_kept", type=WallType.BOULDERING.value)
+        )
+
+        # when
+        await center_wall_repository.delete_by_center_id_and_ids(session, center_fixture.id, [center_walls_fixture.id])
+
+        # then
+        assert await center_wall_repository.find_all_by_center_id(session, center_fixture.id) == [kept_wall]
@@ -0,0 +1,180 @@
+import re
+from datetime import datetime, date
+
+import pytest
+from fastapi_pagination import Params
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import PostCountPeriod
+from claon_admin.common.util.pagination import CursorParams
+from claon_admin.schema.center import Center, Review, CenterSchedule, CenterScheduleMember
+from claon_admin.schema.post import Post, PostCountHistoryRepository, PostCountTotalRepository, \
+    PostCountRollupRepository
+from tests.repository.center.conftest import center_repository, center_hold_repository, center_wall_repository, \
+    center_fee_repository, center_approved_file_repository, review_repository, post_repository, \
+    center_schedule_repository, center_schedule_member_repository
+
+post_count_history_repository = PostCountHistoryRepository()
+post_count_total_repository = PostCountTotalRepository()
+post_count_rollup_repository = PostCountRollupRepository()
+
+LARGE_TABLES = {
+    "tb_post",
+    "tb_climbing_history",
+    "tb_post_count_history",
+    "tb_post_count_rollup",
+    "tb_review",
+    "tb_center_schedule",
+    "tb_center_schedule_member",
+    "tb_center_hold",
+    "tb_center_wall",
+    "tb_center_fee",
+    "tb_center_approved_file"
+}
+
+
+@pytest.fixture
+def statements(db):
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            captured.append((statement, parameters))
+
+    event.listen(db._engine.sync_engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(db._engine.sync_engine, "before_cursor_execute", capture)
+
+
+async def find_full_scans(session: AsyncSession, statements: list):
+    connection = await session.connection()
+    full_scans = []
+    for statement, parameters in list(statements):
+        result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        for row in result.fetchall():
+            detail = row[-1]
+            matched = re.match(r"SCAN (?:TABLE )?(\w+)", detail)
+            if matched is None or "USING" in detail:
+                continue
+            if re.sub(r"_\d+$", "", matched.group(1)) in LARGE_TABLES:
+                full_scans.append((detail, statement))
+    return full_scans
+
+
+@pytest.mark.describe("Test case for query plans of repositories")
+class TestQueryPlan(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Center queries use indexes")
+    async def test_center_queries_use_indexes(
+            self,
+            session: AsyncSession,
+            statements: list,
+            center_fixture: Center
+    ):
+        # when
+        await center_repository.find_by_id_with_details(session, center_fixture.id)
+        await center_repository.find_all_by_approved_false(session)
+        await center_repository.find_all_ids_by_approved_true(session)
+        await center_repository.find_by_user_id(session, center_fixture.user_id)
+        await center_repository.find_details_by_user_id(session, center_fixture.user_id, Params(page=1, size=10))
+        await center_hold_repository.find_all_by_center_id(session, center_fixture.id)
+        await center_wall_repository.find_all_by_center_id(session, center_fixture.id)
+        await center_fee_repository.find_all_by_center_id(session, center_fixture.id)
+        await center_approved_file_repository.find_all_by_center_id(session, center_fixture.id)
+
+        # then
+        assert len(statements) > 0
+        assert await find_full_scans(session, statements) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Post queries use indexes")
+    async def test_post_queries_use_indexes(
+            self,
+            session: AsyncSession,
+            statements: list,
+            center_fixture: Center,
+            post_fixture: Post
+    ):
+        # when
+        for params in [Params(page=1, size=10), CursorParams(size=10)]:
+            for hold_id in [None, "hold_id"]:
+                await post_repository.find_posts_by_center(
+                    session,
+                    params,
+                    center_fixture.id,
+                    hold_id,
+                    datetime(2022, 1, 1),
+                    datetime(2024, 1, 1)
+                )
+        await post_repository.count_by_center_and_date(session, [center_fixture.id], date(2022, 1, 1), date(2024, 1, 1))
+        await post_count_total_repository.find_by_id(session, center_fixture.id)
+        await post_count_rollup_repository.find_by_center_and_period(
+            session,
+            center_fixture.id,
+            PostCountPeriod.WEEK,
+            date(2022, 1, 1),
+            date(2024, 1, 1)
+        )
+        await post_count_history_repository.find_by_center_and_date(
+            session,
+            center_fixture.id,
+            date(2022, 1, 1),
+            date(2024, 1, 1)
+        )
+        await post_count_history_repository.find_first_reg_date_by_center_and_date(
+            session,
+            center_fixture.id,
+            date(2022, 1, 1),
+            date(2024, 1, 1)
+        )
+
+        # then
+        assert len(statements) > 0
+        assert await find_full_scans(session, statements) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Review queries use indexes")
+    async def test_review_queries_use_indexes(
+            self,
+            session: AsyncSession,
+            statements: list,
+            center_fixture: Center,
+            review_fixture: Review
+    ):
+        # when
+        for params in [Params(page=1, size=10), CursorParams(size=10)]:
+            await review_repository.find_reviews_by_center(
+                session,
+                params,
+                center_fixture.id,
+                datetime(2022, 1, 1),
+                datetime(2024, 1, 1),
+                None,
+                None
+            )
+        await review_repository.find_by_id_and_center_id(session, review_fixture.id, center_fixture.id)
+        await review_repository.find_all_by_center(session, center_fixture.id)
+
+        # then
+        assert len(statements) > 0
+        assert await find_full_scans(session, statements) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Schedule queries use indexes")
+    async def test_schedule_queries_use_indexes(
+            self,
+            session: AsyncSession,
+            statements: list,
+            center_fixture: Center,
+            schedule_fixture: CenterSchedule,
+            schedule_member_fixture: CenterScheduleMember
+    ):
+        # when
+        await center_schedule_repository.find_by_id_and_center_id(session, schedule_fixture.id, center_fixture.id)
+        await center_schedule_repository.find_by_center_id_and_date_from(session, center_fixture.id, date(2023, 1, 1))
+        await center_schedule_member_repository.delete_by_schedule_id(session, schedule_fixture.id)
+
+        # then
+        assert len(statements) > 0
+        assert await find_full_scans(session, statements) == []
@@ -4,6 +4,7 @@ import pytest
 from fastapi_pagination import Params, Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from claon_admin.common.util.pagination import CursorParams
 from claon_admin.schema.center import Center, Review, ReviewAnswer, Post
 from claon_admin.schema.user import User
 from tests.repository.center.conftest import review_repository, review_answer_repository
@@ -48,6 +49,34 @@ class TestReviewRepository(object):
             is_answered=None
         ) == Page.create(items=[(review_fixture, 1)], params=params, total=1)
 
+    @pytest.mark.asyncio
+    async def test_find_reviews_by_center_with_cursor(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review,
+            post_fixture: Post,
+            review_answer_fixture: ReviewAnswer
+    ):
+        # given
+        params = CursorParams(size=10)
+
+        # when
+        pages = await review_repository.find_reviews_by_center(
+            session=session,
+            params=params,
+            center_id=center_fixture.id,
+            start=datetime(2022, 3, 1),
+            end=datetime(2023, 2, 28),
+            tag=None,
+            is_answered=None
+        )
+
+        # then
+        assert pages.items == [(review_fixture, 1)]
+        assert pages.next_cursor is None
+        assert pages.previous_cursor is None
+
     @pytest.mark.asyncio
     async def test_find_reviews_by_center_with_tag(
             self,
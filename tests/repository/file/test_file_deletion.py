@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi_pagination import Params
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import FileDeletionStatus
+from claon_admin.schema.file import FileDeletionRepository, FileDeletion, ImageVariantRepository
+
+file_deletion_repository = FileDeletionRepository()
+image_variant_repository = ImageVariantRepository()
+
+NOW = datetime(2023, 6, 1)
+
+
+@pytest.fixture
+async def file_deletions_fixture(session: AsyncSession):
+    file_deletions = await file_deletion_repository.add_all(
+        session,
+        ["https://test.com/first.pdf", "https://test.com/second.pdf"],
+        NOW
+    )
+    yield file_deletions
+    await session.rollback()
+
+
+@pytest.mark.describe("Test case for file deletion repository")
+class TestFileDeletionRepository(object):
+    @pytest.mark.asyncio
+    async def test_add_all(
+            self,
+            session: AsyncSession,
+            file_deletions_fixture: list[FileDeletion]
+    ):
+        # when
+        result = await file_deletion_repository.find_by_id(session, file_deletions_fixture[0].id)
+
+        # then
+        assert result.url == "https://test.com/first.pdf"
+        assert result.status == FileDeletionStatus.PENDING
+        assert result.attempt == 0
+
+    @pytest.mark.asyncio
+    async def test_find_all_pending(
+            self,
+            session: AsyncSession,
+            file_deletions_fixture: list[FileDeletion]
+    ):
+        # given
+        file_deletions_fixture[0].next_attempt_at = NOW + timedelta(minutes=1)
+        file_deletions_fixture[1].status = FileDeletionStatus.DELETED
+        await session.flush()
+
+        # when
+        result = await file_deletion_repository.find_all_pending(session, NOW + timedelta(minutes=1), 10)
+        not_yet = await file_deletion_repository.find_all_pending(session, NOW, 10)
+
+        # then
+        assert [file_deletion.id for file_deletion in result] == [file_deletions_fixture[0].id]
+        assert not_yet == []
+
+    @pytest.mark.asyncio
+    async def test_find_all_by_status(
+            self,
+            session: AsyncSession,
+            file_deletions_fixture: list[FileDeletion]
+    ):
+        # given
+        file_deletions_fixture[1].status = FileDeletionStatus.FAILED
+        await session.flush()
+
+        # when
+        pages = await file_deletion_repository.find_all_by_status(
+            session,
+            Params(page=1, size=10),
+            FileDeletionStatus.FAILED
+        )
+
+        # then
+        assert pages.total == 1
+        assert pages.items[0].id == file_deletions_fixture[1].id
+
+    @pytest.mark.asyncio
+    async def test_add_all_with_image_variants(self, session: AsyncSession):
+        # given
+        url = "https://test.com/center/image/2023-06-01/first.png"
+        await image_variant_repository.register(
+            session,
+            url,
+            "https://test.com/center/image/2023-06-01/first.thumbnail.webp",
+            "https://test.com/center/image/2023-06-01/first.webp"
+        )
+
+        # when
+        file_deletions = await file_deletion_repository.add_all(session, [url], NOW)
+
+        # then
+        assert [file_deletion.url for file_deletion in file_deletions] == [
+            url,
+            "https://test.com/center/image/2023-06-01/first.thumbnail.webp",
+            "https://test.com/center/image/2023-06-01/first.webp"
+        ]
+        assert await image_variant_repository.find_thumbnails(session, [url]) == {}
+        await session.rollback()
@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.time import now
+from claon_admin.schema.file import FileObjectRepository, FileObject
+
+file_object_repository = FileObjectRepository()
+
+PREFIX = "center/image"
+FILE_HASH = "a" * 64
+URL = "https://test.com/center/image/2023-06-01/first.png"
+
+
+@pytest.fixture
+async def file_object_fixture(session: AsyncSession):
+    url = await file_object_repository.register(session, PREFIX, FILE_HASH, URL, 100)
+    yield url
+    await session.rollback()
+
+
+@pytest.mark.describe("Test case for file object repository")
+class TestFileObjectRepository(object):
+    @pytest.mark.asyncio
+    async def test_acquire(
+            self,
+            session: AsyncSession,
+            file_object_fixture: str
+    ):
+        # given
+        acquired_after = now()
+
+        # when
+        result = await file_object_repository.acquire(session, PREFIX, FILE_HASH)
+        not_found = await file_object_repository.acquire(session, PREFIX, "b" * 64)
+
+        # then
+        assert result == URL
+        assert not_found is None
+        assert await file_object_repository.find_urls_acquired_after(session, acquired_after) == [URL]
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_other_prefix(
+            self,
+            session: AsyncSession,
+            file_object_fixture: str
+    ):
+        # when
+        result = await file_object_repository.acquire(session, "lector/proof", FILE_HASH)
+
+        # then
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_register_existing_hash(
+            self,
+            session: AsyncSession,
+            file_object_fixture: str
+    ):
+        # when
+        result = await file_object_repository.register(
+            session,
+            PREFIX,
+            FILE_HASH,
+            "https://test.com/center/image/2023-06-01/second.png",
+            100
+        )
+
+        # then
+        assert result == URL
+
+    @pytest.mark.asyncio
+    async def test_find_urls_acquired_after(
+            self,
+            session: AsyncSession,
+            file_object_fixture: str
+    ):
+        # then
+        assert await file_object_repository.find_urls_acquired_after(session, now() - timedelta(days=1)) == [URL]
+        assert await file_object_repository.find_urls_acquired_after(session, now() + timedelta(days=1)) == []
+
+    @pytest.mark.asyncio
+    async def test_delete_by_urls(
+            self,
+            session: AsyncSession,
+            file_object_fixture: str
+    ):
+        # when
+        await file_object_repository.delete_by_urls(session, [URL])
+
+        # then
+        assert await file_object_repository.acquire(session, PREFIX, FILE_HASH) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_unacquired_by_urls(
+            self,
+            session: AsyncSession,
+            file_object_fixture: str
+    ):
+        # given
+        stale_url = "https://test.com/center/image/2023-06-01/stale.png"
+        untracked_url = "https://test.com/center/image/2023-06-01/untracked.png"
+        await file_object_repository.register(session, PREFIX, "b" * 64, stale_url, 100)
+        await session.execute(update(FileObject)
+                              .where(FileObject.url == stale_url)
+                              .values(last_acquired_at=now() - timedelta(days=30)))
+
+        # when
+        result = await file_object_repository.delete_unacquired_by_urls(
+            session,
+            [URL, stale_url, untracked_url],
+            now() - timedelta(days=7)
+        )
+
+        # then
+        assert result == [stale_url, untracked_url]
+        assert await file_object_repository.acquire(session, PREFIX, FILE_HASH) == URL
+        assert await file_object_repository.acquire(session, PREFIX, "b" * 64) is None
@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.schema.file import ImageVariantRepository
+
+image_variant_repository = ImageVariantRepository()
+
+URL = "https://test.com/center/image/2023-06-01/first.png"
+THUMBNAIL_URL = "https://test.com/center/image/2023-06-01/first.thumbnail.webp"
+WEBP_URL = "https://test.com/center/image/2023-06-01/first.webp"
+
+
+@pytest.fixture
+async def image_variant_fixture(session: AsyncSession):
+    await image_variant_repository.register(session, URL, THUMBNAIL_URL, WEBP_URL)
+    yield URL
+    await session.rollback()
+
+
+@pytest.mark.describe("Test case for image variant repository")
+class TestImageVariantRepository(object):
+    @pytest.mark.asyncio
+    async def test_register_existing_url(
+            self,
+            session: AsyncSession,
+            image_variant_fixture: str
+    ):
+        # when
+        await image_variant_repository.register(session, URL, THUMBNAIL_URL + "?v=2", WEBP_URL)
+
+        # then
+        image_variant = await image_variant_repository.find_by_id(session, URL)
+        await session.refresh(image_variant)
+        assert image_variant.thumbnail_url == THUMBNAIL_URL + "?v=2"
+
+    @pytest.mark.asyncio
+    async def test_find_thumbnails(
+            self,
+            session: AsyncSession,
+            image_variant_fixture: str
+    ):
+        # when
+        result = await image_variant_repository.find_thumbnails(session, [URL, "https://test.com/other.png", None])
+
+        # then
+        assert result == {URL: THUMBNAIL_URL}
+
+    @pytest.mark.asyncio
+    async def test_delete_by_urls(
+            self,
+            session: AsyncSession,
+            image_variant_fixture: str
+    ):
+        # when
+        await image_variant_repository.delete_by_urls(session, [URL])
+
+        # then
+        assert await image_variant_repository.find_thumbnails(session, [URL]) == {}
@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi_pagination import Params
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import JobRunStatus
+from claon_admin.schema.job import JobRunRepository
+
+job_run_repository = JobRunRepository()
+
+JOB_NAME = "test_job"
+SCHEDULED_AT = datetime(2023, 6, 1)
+STARTED_AT = datetime(2023, 6, 1, 0, 0, 1)
+
+
+@pytest.fixture
+async def job_run_fixture(session: AsyncSession):
+    acquired = await job_run_repository.acquire(
+        session,
+        JOB_NAME,
+        SCHEDULED_AT,
+        "owner",
+        STARTED_AT,
+        STARTED_AT + timedelta(hours=1)
+    )
+    yield acquired
+    await session.rollback()
+
+
+@pytest.mark.describe("Test case for job run repository")
+class TestJobRunRepository(object):
+    @pytest.mark.asyncio
+    async def test_acquire(
+            self,
+            session: AsyncSession,
+            job_run_fixture: bool
+    ):
+        # then
+        assert job_run_fixture is True
+        pages = await job_run_repository.find_all_by_job_name(session, Params(page=1, size=10), JOB_NAME)
+        assert pages.total == 1
+        assert pages.items[0].status == JobRunStatus.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_acquire_while_leased(
+            self,
+            session: AsyncSession,
+            job_run_fixture: bool
+    ):
+        # when
+        acquired = await job_run_repository.acquire(
+            session,
+            JOB_NAME,
+            SCHEDULED_AT,
+            "other",
+            STARTED_AT + timedelta(minutes=1),
+            STARTED_AT + timedelta(hours=1, minutes=1)
+        )
+
+        # then
+        assert acquired is False
+
+    @pytest.mark.asyncio
+    async def test_acquire_expired_lease(
+            self,
+            session: AsyncSession,
+            job_run_fixture: bool
+    ):
+        # when
+        acquired = await job_run_repository.acquire(
+            session,
+            JOB_NAME,
+            SCHEDULED_AT,
+            "other",
+            STARTED_AT + timedelta(hours=2),
+            STARTED_AT + timedelta(hours=3)
+        )
+
+        # then
+        assert acquired is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_after_success(
+            self,
+            session: AsyncSession,
+            job_run_fixture: bool
+    ):
+        # given
+        await job_run_repository.finish(session, JOB_NAME, SCHEDULED_AT, "owner", JobRunStatus.SUCCEEDED, STARTED_AT)
+
+        # when
+        acquired = await job_run_repository.acquire(
+            session,
+            JOB_NAME,
+            SCHEDULED_AT,
+            "other",
+            STARTED_AT + timedelta(hours=2),
+            STARTED_AT + timedelta(hours=3)
+        )
+
+        # then
+        assert acquired is False
+        assert await job_run_repository.find_last_succeeded_scheduled_at(session, JOB_NAME) == SCHEDULED_AT
+
+    @pytest.mark.asyncio
+    async def test_acquire_after_failure(
+            self,
+            session: AsyncSession,
+            job_run_fixture: bool
+    ):
+        # given
+        await job_run_repository.finish(session, JOB_NAME, SCHEDULED_AT, "owner", JobRunStatus.FAILED, STARTED_AT)
+        assert await job_run_repository.find_all_scheduled_at_by_status(
+            session,
+            JOB_NAME,
+            JobRunStatus.FAILED,
+            SCHEDULED_AT - timedelta(days=1)
+        ) == [SCHEDULED_AT]
+
+        # when
+        acquired = await job_run_repository.acquire(
+            session,
+            JOB_NAME,
+            SCHEDULED_AT,
+            "other",
+            STARTED_AT + timedelta(minutes=1),
+            STARTED_AT + timedelta(hours=1)
+        )
+
+        # then
+        assert acquired is True
+        assert await job_run_repository.find_last_succeeded_scheduled_at(session, JOB_NAME) is None
+
+    @pytest.mark.asyncio
+    async def test_renew(
+            self,
+            session: AsyncSession,
+            job_run_fixture: bool
+    ):
+        # when
+        renewed = await job_run_repository.renew(session, JOB_NAME, SCHEDULED_AT, "owner", STARTED_AT + timedelta(hours=2))
+
+        # then
+        assert renewed is True
+        assert await job_run_repository.acquire(
+            session,
+            JOB_NAME,
+            SCHEDULED_AT,
+            "other",
+            STARTED_AT + timedelta(hours=1, minutes=30),
+            STARTED_AT + timedelta(hours=2, minutes=30)
+        ) is False
+
+    @pytest.mark.asyncio
+    async def test_renew_by_other_owner(
+            self,
+            session: AsyncSession,
+            job_run_fixture: bool
+    ):
+        # when
+        renewed = await job_run_repository.renew(session, JOB_NAME, SCHEDULED_AT, "other", STARTED_AT + timedelta(hours=2))
+
+        # then
+        assert renewed is False
@@ -8,7 +8,7 @@ from claon_admin.common.util.time import now
 from claon_admin.schema.center import Center, CenterWall, CenterHold, CenterImage, OperatingTime, Utility, \
     CenterFeeImage, CenterRepository, CenterHoldRepository, CenterWallRepository
 from claon_admin.schema.post import Post, PostImage, ClimbingHistory, PostRepository, ClimbingHistoryRepository, \
-    PostCountHistoryRepository, PostCountHistory
+    PostCountHistoryRepository, PostCountHistory, PostCountTotalRepository, PostCountRollupRepository
 from claon_admin.schema.user import User, UserRepository
 
 user_repository = UserRepository()
@@ -17,6 +17,8 @@ center_hold_repository = CenterHoldRepository()
 center_wall_repository = CenterWallRepository()
 post_repository = PostRepository()
 post_count_history_repository = PostCountHistoryRepository()
+post_count_total_repository = PostCountTotalRepository()
+post_count_rollup_repository = PostCountRollupRepository()
 climbing_history_repository = ClimbingHistoryRepository()
 
 
@@ -5,9 +5,11 @@ from fastapi_pagination import Params, Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.enum import WallType
+from claon_admin.common.error.exception import BadRequestException
+from claon_admin.common.util.pagination import CursorParams, Cursor
 from claon_admin.common.util.time import now
 from claon_admin.schema.center import Center
-from claon_admin.schema.post import Post, ClimbingHistory
+from claon_admin.schema.post import Post, ClimbingHistory, PostImage
 from claon_admin.schema.user import User
 from tests.repository.post.conftest import post_repository
 
@@ -45,6 +47,81 @@ class TestPostRepository(object):
             now()
         ) == Page.create(items=[post_fixture], params=params, total=1)
 
+    @pytest.mark.asyncio
+    async def test_find_posts_by_center_with_cursor(
+            self,
+            session: AsyncSession,
+            user_fixture: User,
+            center_fixture: Center,
+            post_fixture: Post
+    ):
+        # given
+        posts = [post_fixture]
+        for i in range(4):
+            posts.append(await post_repository.save(session, Post(
+                user=user_fixture,
+                center=center_fixture,
+                content=f"content_{i}",
+                created_at=now() - timedelta(minutes=i + 1),
+                img=[PostImage(url="url")]
+            )))
+
+        # when
+        first_page = await post_repository.find_posts_by_center(
+            session,
+            CursorParams(size=2, count=True),
+            center_fixture.id,
+            None,
+            now() - timedelta(days=1),
+            now() + timedelta(days=1)
+        )
+        second_page = await post_repository.find_posts_by_center(
+            session,
+            CursorParams(cursor=first_page.next_cursor, size=2),
+            center_fixture.id,
+            None,
+            now() - timedelta(days=1),
+            now() + timedelta(days=1)
+        )
+        previous_page = await post_repository.find_posts_by_center(
+            session,
+            CursorParams(cursor=second_page.previous_cursor, size=2),
+            center_fixture.id,
+            None,
+            now() - timedelta(days=1),
+            now() + timedelta(days=1)
+        )
+
+        # then
+        assert first_page.items == posts[:2]
+        assert first_page.total == 5
+        assert first_page.previous_cursor is None
+        assert second_page.items == posts[2:4]
+        assert second_page.total is None
+        assert previous_page.items == posts[:2]
+        assert previous_page.previous_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_find_posts_by_center_with_invalid_cursor_direction(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_fixture: Post
+    ):
+        # given
+        cursor = Cursor.construct(created_at=post_fixture.created_at, id=post_fixture.id, direction="sideways").encode()
+
+        with pytest.raises(BadRequestException):
+            # when
+            await post_repository.find_posts_by_center(
+                session,
+                CursorParams(cursor=cursor, size=2),
+                center_fixture.id,
+                None,
+                now() - timedelta(days=1),
+                now() + timedelta(days=1)
+            )
+
     @pytest.mark.asyncio
     async def test_find_posts_by_center_not_included_hold(
             self,
@@ -109,6 +186,24 @@ class TestPostRepository(object):
         assert result[center_fixture.id] == 2
         assert result[another_center_fixture.id] == 1
 
+    @pytest.mark.asyncio
+    async def test_count_by_center_per_day(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_fixture: Post,
+            other_post_fixture: Post
+    ):
+        # when
+        result = await post_repository.count_by_center_per_day(
+            session,
+            center_fixture.id,
+            now().date() + timedelta(days=1)
+        )
+
+        # then
+        assert result == {now().date(): 2}
+
     @pytest.mark.asyncio
     async def test_save_climbing_history(
             self,
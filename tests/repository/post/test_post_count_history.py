@@ -25,34 +25,118 @@ class TestPostCountHistoryRepository(object):
         assert post_count_history_fixture.reg_date == now().date()
 
     @pytest.mark.asyncio
-    async def test_sum_count_by_center(
+    async def test_find_by_center_and_date(
             self,
             session: AsyncSession,
             center_fixture: Center,
             post_count_history_list_fixture: List[PostCountHistory]
     ):
+        # when
+        result = await post_count_history_repository.find_by_center_and_date(
+            session,
+            center_fixture.id,
+            now().date() - timedelta(weeks=52),
+            now().date()
+        )
+
         # then
-        assert await post_count_history_repository.sum_count_by_center(session, center_fixture.id) == 30
+        assert len(result) == len(post_count_history_list_fixture)
+
+        for i in range(len(result)):
+            assert result[i].center_id == post_count_history_list_fixture[i].center_id
+            assert result[i].count == post_count_history_list_fixture[i].count
+            assert result[i].reg_date == post_count_history_list_fixture[i].reg_date
 
     @pytest.mark.asyncio
-    async def test_find_by_center_and_date(
+    async def test_find_first_reg_date_by_center_and_date(
             self,
             session: AsyncSession,
             center_fixture: Center,
             post_count_history_list_fixture: List[PostCountHistory]
     ):
         # when
-        result = await post_count_history_repository.find_by_center_and_date(
+        result = await post_count_history_repository.find_first_reg_date_by_center_and_date(
+            session,
+            center_fixture.id,
+            now().date() - timedelta(weeks=8),
+            now().date()
+        )
+        empty_result = await post_count_history_repository.find_first_reg_date_by_center_and_date(
+            session,
+            center_fixture.id,
+            now().date(),
+            now().date() + timedelta(days=1)
+        )
+
+        # then
+        assert result == now().date() - timedelta(weeks=4)
+        assert empty_result is None
+
+    @pytest.mark.asyncio
+    async def test_delete_by_center(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_count_history_list_fixture: List[PostCountHistory]
+    ):
+        # when
+        await post_count_history_repository.delete_by_center(session, center_fixture.id)
+
+        # then
+        assert await post_count_history_repository.find_by_center_and_date(
             session,
             center_fixture.id,
             now().date() - timedelta(weeks=52),
             now().date()
+        ) == []
+
+    @pytest.mark.asyncio
+    async def test_upsert_all_by_center_and_reg_date(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_count_history_fixture: PostCountHistory
+    ):
+        # given
+        history = PostCountHistory(
+            center_id=center_fixture.id,
+            count=20,
+            reg_date=post_count_history_fixture.reg_date
         )
 
+        # when
+        persisted = await post_count_history_repository.upsert_all(session, [history], ["center_id", "reg_date"])
+
         # then
-        assert len(result) == len(post_count_history_list_fixture)
+        assert [(e.id, e.count) for e in persisted] == [(post_count_history_fixture.id, 20)]
+        result = await post_count_history_repository.find_by_center_and_date(
+            session,
+            center_fixture.id,
+            now().date(),
+            now().date() + timedelta(days=1)
+        )
+        await session.refresh(result[0])
+        assert [e.count for e in result] == [20]
 
-        for i in range(len(result)):
-            assert result[i].center_id == post_count_history_list_fixture[i].center_id
-            assert result[i].count == post_count_history_list_fixture[i].count
-            assert result[i].reg_date == post_count_history_list_fixture[i].reg_date
+    @pytest.mark.asyncio
+    async def test_delete_by_centers_and_date(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            post_count_history_fixture: PostCountHistory
+    ):
+        # when
+        result = await post_count_history_repository.delete_by_centers_and_date(
+            session,
+            [center_fixture.id, "other_center_id"],
+            now().date()
+        )
+
+        # then
+        assert result == [center_fixture.id]
+        assert await post_count_history_repository.find_by_center_and_date(
+            session,
+            center_fixture.id,
+            now().date(),
+            now().date() + timedelta(days=1)
+        ) == []
@@ -0,0 +1,114 @@
+from datetime import timedelta, date
+from typing import List
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import PostCountPeriod
+from claon_admin.common.util.time import get_start_of_week
+from claon_admin.schema.center import Center
+from claon_admin.schema.post import PostCountHistory
+from tests.repository.post.conftest import post_count_history_repository, post_count_rollup_repository
+
+
+@pytest.fixture
+async def daily_history_fixture(session: AsyncSession, center_fixture: Center):
+    post_count_history_list = await post_count_history_repository.save_all(session, [
+        PostCountHistory(center_id=center_fixture.id, count=1, reg_date=date(2023, 5, 29)),
+        PostCountHistory(center_id=center_fixture.id, count=2, reg_date=date(2023, 5, 31)),
+        PostCountHistory(center_id=center_fixture.id, count=4, reg_date=date(2023, 6, 1))
+    ])
+    yield post_count_history_list
+    await session.rollback()
+
+
+@pytest.mark.describe('Test case for post count rollup repository')
+class TestPostCountRollupRepository(object):
+    @pytest.mark.asyncio
+    async def test_refresh_by_date(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            daily_history_fixture: List[PostCountHistory]
+    ):
+        # when
+        await post_count_rollup_repository.refresh_by_date(session, [center_fixture.id], date(2023, 6, 1))
+
+        # then
+        weeks = await post_count_rollup_repository.find_by_center_and_period(
+            session,
+            center_fixture.id,
+            PostCountPeriod.WEEK,
+            date(2023, 1, 1),
+            date(2024, 1, 1)
+        )
+        assert [(e.reg_date, e.count) for e in weeks] == [(get_start_of_week(date(2023, 6, 1)), 7)]
+
+    @pytest.mark.asyncio
+    async def test_refresh_by_date_twice(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            daily_history_fixture: List[PostCountHistory]
+    ):
+        # given
+        await post_count_rollup_repository.refresh_by_date(session, [center_fixture.id], date(2023, 5, 31))
+
+        # when
+        await post_count_rollup_repository.refresh_by_date(session, [center_fixture.id], date(2023, 5, 31))
+
+        # then
+        weeks = await post_count_rollup_repository.find_by_center_and_period(
+            session,
+            center_fixture.id,
+            PostCountPeriod.WEEK,
+            date(2023, 5, 29),
+            date(2023, 5, 29) + timedelta(days=1)
+        )
+        assert [(e.reg_date, e.count) for e in weeks] == [(date(2023, 5, 29), 7)]
+
+    @pytest.mark.asyncio
+    async def test_refresh_by_date_without_history(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            daily_history_fixture: List[PostCountHistory]
+    ):
+        # given
+        await post_count_rollup_repository.refresh_by_date(session, [center_fixture.id], date(2023, 6, 1))
+        for history in daily_history_fixture:
+            await post_count_history_repository.delete(session, history)
+
+        # when
+        await post_count_rollup_repository.refresh_by_date(session, [center_fixture.id], date(2023, 6, 1))
+
+        # then
+        assert await post_count_rollup_repository.find_by_center_and_period(
+            session,
+            center_fixture.id,
+            PostCountPeriod.WEEK,
+            date(2023, 1, 1),
+            date(2024, 1, 1)
+        ) == []
+
+    @pytest.mark.asyncio
+    async def test_delete_by_center(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            daily_history_fixture: List[PostCountHistory]
+    ):
+        # given
+        await post_count_rollup_repository.refresh_by_date(session, [center_fixture.id], date(2023, 6, 1))
+
+        # when
+        await post_count_rollup_repository.delete_by_center(session, center_fixture.id)
+
+        # then
+        assert await post_count_rollup_repository.find_by_center_and_period(
+            session,
+            center_fixture.id,
+            PostCountPeriod.WEEK,
+            date(2023, 1, 1),
+            date(2024, 1, 1)
+        ) == []
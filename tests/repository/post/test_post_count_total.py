@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util.time import now
+from claon_admin.schema.center import Center
+from claon_admin.schema.post import PostCountTotal, PostCountHistory
+from tests.repository.post.conftest import post_count_total_repository, post_count_history_repository
+
+
+@pytest.mark.describe('Test case for post count total repository')
+class TestPostCountTotalRepository(object):
+    @pytest.mark.asyncio
+    async def test_delete_by_center(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # given
+        await post_count_total_repository.save(session, PostCountTotal(
+            center_id=center_fixture.id,
+            count=3,
+            first_reg_date=now().date(),
+            last_reg_date=now().date()
+        ))
+
+        # when
+        await post_count_total_repository.delete_by_center(session, center_fixture.id)
+
+        # then
+        session.expunge_all()
+        assert await post_count_total_repository.find_by_id(session, center_fixture.id) is None
+
+    @pytest.mark.asyncio
+    async def test_rebuild_by_centers(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # given
+        yesterday = now().date() - timedelta(days=1)
+        await post_count_total_repository.save(session, PostCountTotal(
+            center_id=center_fixture.id,
+            count=100,
+            first_reg_date=yesterday,
+            last_reg_date=yesterday
+        ))
+        await post_count_history_repository.save_all(session, [
+            PostCountHistory(center_id=center_fixture.id, count=2, reg_date=yesterday - timedelta(days=3)),
+            PostCountHistory(center_id=center_fixture.id, count=5, reg_date=yesterday)
+        ])
+
+        # when
+        await post_count_total_repository.rebuild_by_centers(session, [center_fixture.id])
+
+        # then
+        result = await post_count_total_repository.find_by_id(session, center_fixture.id)
+        await session.refresh(result)
+        assert result.count == 7
+        assert result.first_reg_date == yesterday - timedelta(days=3)
+        assert result.last_reg_date == yesterday
+
+    @pytest.mark.asyncio
+    async def test_rebuild_by_centers_twice(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # given
+        yesterday = now().date() - timedelta(days=1)
+        await post_count_history_repository.save(
+            session,
+            PostCountHistory(center_id=center_fixture.id, count=3, reg_date=yesterday)
+        )
+        await post_count_total_repository.rebuild_by_centers(session, [center_fixture.id])
+
+        # when
+        await post_count_total_repository.rebuild_by_centers(session, [center_fixture.id])
+
+        # then
+        result = await post_count_total_repository.find_by_id(session, center_fixture.id)
+        await session.refresh(result)
+        assert result.count == 3
+
+    @pytest.mark.asyncio
+    async def test_rebuild_by_centers_without_history(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # given
+        await post_count_total_repository.save(session, PostCountTotal(
+            center_id=center_fixture.id,
+            count=3,
+            first_reg_date=now().date(),
+            last_reg_date=now().date()
+        ))
+
+        # when
+        await post_count_total_repository.rebuild_by_centers(session, [center_fixture.id])
+
+        # then
+        session.expunge_all()
+        assert await post_count_total_repository.find_by_id(session, center_fixture.id) is None
@@ -55,3 +55,18 @@ class TestLectorApprovedFileRepository(object):
 
         # then
         assert await lector_approved_file_repository.find_all_by_lector_id(session, lector_fixture.id) == []
+
+    @pytest.mark.asyncio
+    async def test_find_referenced_urls(
+            self,
+            session: AsyncSession,
+            lector_approved_file_fixture: LectorApprovedFile
+    ):
+        # when
+        result = await lector_approved_file_repository.find_referenced_urls(
+            session,
+            [lector_approved_file_fixture.url, "https://test.com/other.pdf"]
+        )
+
+        # then
+        assert result == {lector_approved_file_fixture.url}
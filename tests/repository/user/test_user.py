@@ -3,6 +3,7 @@ from fastapi_pagination import Params, Page
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from claon_admin.common.enum import Role
+from claon_admin.common.util.pagination import CursorParams
 from claon_admin.schema.user import User
 from tests.repository.user.conftest import user_repository
 
@@ -168,6 +169,27 @@ class TestUserRepository(object):
             session, nickname=other_name, params=params
         ) == Page.create(items=[], params=params, total=0)
 
+    @pytest.mark.asyncio
+    async def test_find_all_by_nickname_with_cursor(self, session: AsyncSession, user_fixture: User):
+        # given
+        for i in range(5):
+            await user_repository.save(session, User(
+                oauth_id=f"oauth_id_{i}",
+                nickname=f"nickname_{i}",
+                profile_img="profile_img",
+                sns="sns",
+                email=f"test_{i}@test.com",
+                instagram_name=f"instagram_name_{i}",
+                role=Role.USER
+            ))
+
+        # when
+        page = await user_repository.find_all_by_nickname(session, nickname="name", params=CursorParams(size=10))
+
+        # then
+        assert len(page.items) == 5
+        assert page.next_cursor is not None
+
     @pytest.mark.asyncio
     async def test_find_by_ids(self, session: AsyncSession, user_fixture: User, other_user_fixture: User):
         # given
@@ -5,6 +5,8 @@ from unittest.mock import AsyncMock
 import pytest
 
 from claon_admin.schema.center import CenterRepository, CenterApprovedFileRepository
+from claon_admin.schema.file import FileDeletionRepository, FileObjectRepository
+from claon_admin.schema.job import JobRunRepository
 from claon_admin.schema.user import UserRepository, LectorRepository, LectorApprovedFileRepository
 from claon_admin.service.admin import AdminService
 from claon_admin.common.enum import Role
@@ -19,13 +21,19 @@ def mock_repo():
     lector_approved_file_repository = AsyncMock(spec=LectorApprovedFileRepository)
     center_repository = AsyncMock(spec=CenterRepository)
     center_approved_file_repository = AsyncMock(spec=CenterApprovedFileRepository)
+    job_run_repository = AsyncMock(spec=JobRunRepository)
+    file_deletion_repository = AsyncMock(spec=FileDeletionRepository)
+    file_object_repository = AsyncMock(spec=FileObjectRepository)
 
     return {
         "user": user_repository,
         "lector": lector_repository,
         "lector_approved_file": lector_approved_file_repository,
         "center": center_repository,
-        "center_approved_file": center_approved_file_repository
+        "center_approved_file": center_approved_file_repository,
+        "job_run": job_run_repository,
+        "file_deletion": file_deletion_repository,
+        "file_object": file_object_repository
     }
 
 
@@ -36,7 +44,10 @@ def admin_service(mock_repo: dict):
         mock_repo["lector"],
         mock_repo["lector_approved_file"],
         mock_repo["center"],
-        mock_repo["center_approved_file"]
+        mock_repo["center_approved_file"],
+        mock_repo["job_run"],
+        mock_repo["file_deletion"],
+        mock_repo["file_object"]
     )
 
 
@@ -1,10 +1,14 @@
-from unittest.mock import patch
+from datetime import timedelta
+from typing import List
+from unittest.mock import ANY
 
 import pytest
 
 from claon_admin.common.enum import Role
 from claon_admin.common.error.exception import ErrorCode, BadRequestException, NotFoundException
-from claon_admin.schema.center import Center
+from claon_admin.common.util.time import now
+from claon_admin.job.orphan import ORPHAN_FILE_GRACE_DAYS
+from claon_admin.schema.center import Center, CenterApprovedFile
 from claon_admin.service.admin import AdminService
 
 
@@ -12,21 +16,21 @@ from claon_admin.service.admin import AdminService
 class TestApproveCenter(object):
     @pytest.mark.asyncio
     @pytest.mark.it("Success case")
-    @patch("claon_admin.service.admin.delete_file")
     async def test_success(
             self,
-            mock_delete_file,
             mock_repo: dict,
             admin_service: AdminService,
-            center_fixture: Center
+            center_fixture: Center,
+            center_approved_files_fixture: List[CenterApprovedFile]
     ):
         # given
         center_id = center_fixture.id
 
         mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
         mock_repo["center"].exists_by_name_and_approved.side_effect = [False]
-        mock_repo["center_approved_file"].find_all_by_center_id.side_effect = [[]]
-        mock_delete_file.return_value = None
+        mock_repo["center_approved_file"].find_all_by_center_id.side_effect = [center_approved_files_fixture]
+        mock_repo["center_approved_file"].find_referenced_urls.side_effect = [set()]
+        mock_repo["file_object"].delete_unacquired_by_urls.side_effect = lambda session, urls, acquired_after: urls
 
         # when
         result = await admin_service.approve_center(center_id)
@@ -34,6 +38,64 @@ class TestApproveCenter(object):
         # then
         assert result.approved
         assert result.user_profile.role == Role.CENTER_ADMIN
+        mock_repo["file_object"].delete_unacquired_by_urls.assert_called_once_with(
+            ANY,
+            [file.url for file in center_approved_files_fixture],
+            ANY
+        )
+        mock_repo["file_deletion"].add_all.assert_called_once_with(
+            ANY,
+            [file.url for file in center_approved_files_fixture],
+            ANY
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: keep files still referenced by other uploads")
+    async def test_success_with_shared_files(
+            self,
+            mock_repo: dict,
+            admin_service: AdminService,
+            center_fixture: Center,
+            center_approved_files_fixture: List[CenterApprovedFile]
+    ):
+        # given
+        mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
+        mock_repo["center"].exists_by_name_and_approved.side_effect = [False]
+        mock_repo["center_approved_file"].find_all_by_center_id.side_effect = [center_approved_files_fixture]
+        mock_repo["center_approved_file"].find_referenced_urls.side_effect = [
+            {file.url for file in center_approved_files_fixture}
+        ]
+        mock_repo["file_object"].delete_unacquired_by_urls.side_effect = lambda session, urls, acquired_after: urls
+
+        # when
+        await admin_service.approve_center(center_fixture.id)
+
+        # then
+        mock_repo["file_deletion"].add_all.assert_called_once_with(ANY, [], ANY)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: keep files acquired by an upload within the grace period")
+    async def test_success_with_recently_acquired_files(
+            self,
+            mock_repo: dict,
+            admin_service: AdminService,
+            center_fixture: Center,
+            center_approved_files_fixture: List[CenterApprovedFile]
+    ):
+        # given
+        mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
+        mock_repo["center"].exists_by_name_and_approved.side_effect = [False]
+        mock_repo["center_approved_file"].find_all_by_center_id.side_effect = [center_approved_files_fixture]
+        mock_repo["center_approved_file"].find_referenced_urls.side_effect = [set()]
+        mock_repo["file_object"].delete_unacquired_by_urls.side_effect = [[]]
+
+        # when
+        await admin_service.approve_center(center_fixture.id)
+
+        # then
+        acquired_after = mock_repo["file_object"].delete_unacquired_by_urls.call_args.args[2]
+        assert now() - timedelta(days=ORPHAN_FILE_GRACE_DAYS + 1) < acquired_after < now()
+        mock_repo["file_deletion"].add_all.assert_called_once_with(ANY, [], ANY)
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: center is not found")
@@ -1,10 +1,13 @@
-from unittest.mock import patch
+from typing import List
+from unittest.mock import ANY
 
 import pytest
 
 from claon_admin.common.enum import Role
 from claon_admin.common.error.exception import ErrorCode, BadRequestException
-from claon_admin.schema.user import Lector
+from claon_admin.common.util.cache import user_cache
+from claon_admin.model.auth import RequestUser
+from claon_admin.schema.user import Lector, LectorApprovedFile
 from claon_admin.service.admin import AdminService
 
 
@@ -12,20 +15,20 @@ from claon_admin.service.admin import AdminService
 class TestApproveLector(object):
     @pytest.mark.asyncio
     @pytest.mark.it("Success case")
-    @patch("claon_admin.service.admin.delete_file")
     async def test_approve_lector(
             self,
-            mock_delete_file,
             mock_repo: dict,
             admin_service: AdminService,
-            lector_fixture: Lector
+            lector_fixture: Lector,
+            lector_approved_files_fixture: List[LectorApprovedFile]
     ):
         # given
         lector_id = lector_fixture.id
 
         mock_repo["lector"].find_by_id_with_user.side_effect = [lector_fixture]
-        mock_repo["lector_approved_file"].find_all_by_lector_id.side_effect = [[]]
-        mock_delete_file.return_value = None
+        mock_repo["lector_approved_file"].find_all_by_lector_id.side_effect = [lector_approved_files_fixture]
+        mock_repo["lector_approved_file"].find_referenced_urls.side_effect = [set()]
+        mock_repo["file_object"].delete_unacquired_by_urls.side_effect = lambda session, urls, acquired_after: urls
 
         # when
         result = await admin_service.approve_lector(lector_id)
@@ -33,6 +36,67 @@ class TestApproveLector(object):
         # then
         assert result.approved
         assert result.user_profile.role == Role.LECTOR
+        mock_repo["file_object"].delete_unacquired_by_urls.assert_called_once_with(
+            ANY,
+            [file.url for file in lector_approved_files_fixture],
+            ANY
+        )
+        mock_repo["file_deletion"].add_all.assert_called_once_with(
+            ANY,
+            [file.url for file in lector_approved_files_fixture],
+            ANY
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: evict cached user after commit")
+    async def test_approve_lector_evict_cached_user(
+            self,
+            mock_repo: dict,
+            admin_service: AdminService,
+            lector_fixture: Lector,
+            lector_approved_files_fixture: List[LectorApprovedFile]
+    ):
+        # given
+        cached_user = RequestUser(id=lector_fixture.user.id, sns="test@claon.com", role=Role.PENDING)
+        user_cache.put(lector_fixture.user.id, cached_user)
+
+        mock_repo["lector"].find_by_id_with_user.side_effect = [lector_fixture]
+        mock_repo["lector_approved_file"].find_all_by_lector_id.side_effect = [lector_approved_files_fixture]
+        mock_repo["lector_approved_file"].find_referenced_urls.side_effect = [
+            {file.url for file in lector_approved_files_fixture}
+        ]
+        mock_repo["file_object"].delete_unacquired_by_urls.side_effect = lambda session, urls, acquired_after: urls
+
+        # when
+        await admin_service.approve_lector(lector_fixture.id)
+
+        # then
+        assert user_cache.get(lector_fixture.user.id) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: keep cached user on rollback")
+    async def test_approve_lector_rollback_keep_cached_user(
+            self,
+            mock_repo: dict,
+            admin_service: AdminService,
+            lector_fixture: Lector,
+            lector_approved_files_fixture: List[LectorApprovedFile]
+    ):
+        # given
+        cached_user = RequestUser(id=lector_fixture.user.id, sns="test@claon.com", role=Role.PENDING)
+        user_cache.put(lector_fixture.user.id, cached_user)
+
+        mock_repo["lector"].find_by_id_with_user.side_effect = [lector_fixture]
+        mock_repo["lector_approved_file"].find_all_by_lector_id.side_effect = [lector_approved_files_fixture]
+        mock_repo["lector_approved_file"].find_referenced_urls.side_effect = RuntimeError()
+
+        with pytest.raises(RuntimeError):
+            # when
+            await admin_service.approve_lector(lector_fixture.id)
+
+        # then
+        assert user_cache.get(lector_fixture.user.id) == cached_user
+        user_cache.evict(lector_fixture.user.id)
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: lector is not found")
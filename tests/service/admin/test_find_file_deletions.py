@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import pytest
+from fastapi_pagination import Params, Page
+
+from claon_admin.common.enum import FileDeletionStatus
+from claon_admin.schema.file import FileDeletion
+from claon_admin.service.admin import AdminService
+
+
+@pytest.mark.describe("Test case for find file deletions")
+class TestFindFileDeletions(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    async def test_find_file_deletions(
+            self,
+            mock_repo: dict,
+            admin_service: AdminService
+    ):
+        # given
+        params = Params(page=1, size=10)
+        file_deletion = FileDeletion(
+            id="file_deletion_id",
+            url="https://test.com/test.pdf",
+            status=FileDeletionStatus.FAILED,
+            attempt=5,
+            next_attempt_at=datetime(2023, 6, 1),
+            error="AccessDenied: Access Denied"
+        )
+        mock_repo["file_deletion"].find_all_by_status.side_effect = [
+            Page.create(items=[file_deletion], params=params, total=1)
+        ]
+
+        # when
+        result = await admin_service.find_file_deletions(params, FileDeletionStatus.FAILED)
+
+        # then
+        assert result.total_num == 1
+        assert result.results[0].file_deletion_id == file_deletion.id
+        assert result.results[0].error == "AccessDenied: Access Denied"
+        mock_repo["file_deletion"].find_all_by_status.assert_called_once()
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import pytest
+from fastapi_pagination import Params, Page
+
+from claon_admin.common.enum import JobRunStatus
+from claon_admin.schema.job import JobRun
+from claon_admin.service.admin import AdminService
+
+
+@pytest.mark.describe("Test case for find job runs")
+class TestFindJobRuns(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    async def test_find_job_runs(
+            self,
+            mock_repo: dict,
+            admin_service: AdminService
+    ):
+        # given
+        params = Params(page=1, size=10)
+        job_run = JobRun(
+            id="job_run_id",
+            job_name="count_post_by_day",
+            scheduled_at=datetime(2023, 6, 1),
+            status=JobRunStatus.SUCCEEDED,
+            owner="host:1",
+            attempt=1,
+            started_at=datetime(2023, 6, 1, 0, 0, 1),
+            finished_at=datetime(2023, 6, 1, 0, 0, 2),
+            lease_until=datetime(2023, 6, 1, 1)
+        )
+        mock_repo["job_run"].find_all_by_job_name.side_effect = [
+            Page.create(items=[job_run], params=params, total=1)
+        ]
+
+        # when
+        result = await admin_service.find_job_runs(params, "count_post_by_day")
+
+        # then
+        assert result.total_num == 1
+        assert result.results[0].job_run_id == job_run.id
+        assert result.results[0].status == JobRunStatus.SUCCEEDED
+        mock_repo["job_run"].find_all_by_job_name.assert_called_once()
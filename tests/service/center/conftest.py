@@ -9,6 +9,7 @@ from claon_admin.schema.center import CenterRepository, Center, CenterImage, Ope
     CenterFee, CenterHold, CenterWall, CenterHoldRepository, CenterWallRepository, CenterFeeRepository, \
     CenterApprovedFileRepository, CenterApprovedFile, CenterScheduleMemberRepository, CenterScheduleRepository, \
     CenterSchedule, CenterScheduleMember
+from claon_admin.schema.file import ImageVariantRepository
 from claon_admin.schema.user import User, UserRepository
 from claon_admin.service.center import CenterService
 
@@ -23,6 +24,8 @@ def mock_repo():
     center_approved_file_repository = AsyncMock(spec=CenterApprovedFileRepository)
     center_schedule_repository = AsyncMock(spec=CenterScheduleRepository)
     center_schedule_member_repository = AsyncMock(spec=CenterScheduleMemberRepository)
+    image_variant_repository = AsyncMock(spec=ImageVariantRepository)
+    image_variant_repository.find_thumbnails.return_value = {}
 
     return {
         "user": user_repository,
@@ -32,7 +35,8 @@ def mock_repo():
         "center_wall": center_wall_repository,
         "center_approved_file": center_approved_file_repository,
         "center_schedule": center_schedule_repository,
-        "center_schedule_member": center_schedule_member_repository
+        "center_schedule_member": center_schedule_member_repository,
+        "image_variant": image_variant_repository
     }
 
 
@@ -46,7 +50,8 @@ def center_service(mock_repo: dict):
         center_fee_repository=mock_repo["center_fee"],
         center_approved_file_repository=mock_repo["center_approved_file"],
         center_schedule_repository=mock_repo["center_schedule"],
-        center_schedule_member_repository=mock_repo["center_schedule_member"]
+        center_schedule_member_repository=mock_repo["center_schedule_member"],
+        image_variant_repository=mock_repo["image_variant"]
     )
 
 
@@ -279,17 +284,7 @@ async def schedule_member_fixture(user_fixture: User, schedule_fixture: CenterSc
         CenterScheduleMember(
             id=str(uuid.uuid4()),
             user=user_fixture,
-            schedule=schedule_fixture
-        )
-    ]
-
-
-@pytest.fixture
-async def updated_schedule_member_fixture(client_user_fixture: User, schedule_fixture: CenterSchedule):
-    yield [
-        CenterScheduleMember(
-            id=str(uuid.uuid4()),
-            user=client_user_fixture,
+            user_id=user_fixture.id,
             schedule=schedule_fixture
         )
     ]
@@ -313,6 +308,7 @@ async def new_schedule_member_fixture(user_fixture: User, new_schedule_fixture:
         CenterScheduleMember(
             id=str(uuid.uuid4()),
             user=user_fixture,
+            user_id=user_fixture.id,
             schedule=new_schedule_fixture
         )
     ]
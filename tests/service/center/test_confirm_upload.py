@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.enum import CenterUploadPurpose
+from claon_admin.common.error.exception import BadRequestException, ErrorCode, NotFoundException
+from claon_admin.service.center import CenterService
+
+
+@pytest.mark.describe("Test case for confirm upload")
+class TestConfirmUpload(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    @patch("claon_admin.service.center.request_image_variants")
+    @patch("claon_admin.service.center.confirm_upload")
+    async def test_confirm_upload(
+            self,
+            mock_confirm_upload,
+            mock_request_image_variants,
+            center_service: CenterService
+    ):
+        # given
+        file_url = "https://test_bucket.s3.region.amazonaws.com/center/proof/2023-06-01/uuid.pdf"
+        mock_confirm_upload.return_value = file_url
+
+        # when
+        result = await center_service.confirm_upload(CenterUploadPurpose.PROOF, file_url)
+
+        # then
+        mock_confirm_upload.assert_called_once_with(file_url, "center", "proof")
+        assert result.file_url == file_url
+        mock_request_image_variants.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: request variants of image")
+    @patch("claon_admin.service.center.request_image_variants")
+    @patch("claon_admin.service.center.confirm_upload")
+    async def test_confirm_upload_with_image(
+            self,
+            mock_confirm_upload,
+            mock_request_image_variants,
+            center_service: CenterService
+    ):
+        # given
+        file_url = "https://test_bucket.s3.region.amazonaws.com/center/image/2023-06-01/uuid.png"
+        mock_confirm_upload.return_value = file_url
+
+        # when
+        result = await center_service.confirm_upload(CenterUploadPurpose.IMAGE, file_url)
+
+        # then
+        assert result.file_url == file_url
+        mock_request_image_variants.assert_awaited_once_with(file_url)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: file is not uploaded")
+    @patch("claon_admin.service.center.confirm_upload")
+    async def test_confirm_upload_with_not_uploaded_file(
+            self,
+            mock_confirm_upload,
+            center_service: CenterService
+    ):
+        # given
+        mock_confirm_upload.side_effect = NotFoundException(ErrorCode.DATA_DOES_NOT_EXIST, "")
+
+        with pytest.raises(NotFoundException) as exception:
+            # when
+            await center_service.confirm_upload(
+                CenterUploadPurpose.IMAGE,
+                "https://test_bucket.s3.region.amazonaws.com/center/image/2023-06-01/uuid.png"
+            )
+
+        # then
+        assert exception.value.code == ErrorCode.DATA_DOES_NOT_EXIST
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: invalid file format")
+    async def test_confirm_upload_with_invalid_format(self, center_service: CenterService):
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await center_service.confirm_upload(
+                CenterUploadPurpose.IMAGE,
+                "https://test_bucket.s3.region.amazonaws.com/center/image/2023-06-01/uuid.pdf"
+            )
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
@@ -44,7 +44,7 @@ class TestCreateSchedule(object):
         mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
         mock_repo["center_schedule"].save.side_effect = [new_schedule_fixture]
         mock_repo["user"].find_by_ids.side_effect = [[user_fixture]]
-        mock_repo["center_schedule_member"].save_all.side_effect = [new_schedule_member_fixture]
+        mock_repo["center_schedule_member"].insert_all.side_effect = [new_schedule_member_fixture]
 
         response = ScheduleResponseDto.from_entity(new_schedule_fixture, [user_fixture])
 
@@ -54,6 +54,34 @@ class TestCreateSchedule(object):
         # then
         assert result == response
 
+    @pytest.mark.asyncio
+    @pytest.mark.it('Fail case: exist wrong user in member list')
+    async def test_create_schedule_with_not_found_user_in_member_list(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            user_fixture: User,
+            center_fixture: Center,
+            new_schedule_fixture: CenterSchedule,
+            schedule_create_request_dto: ScheduleRequestDto
+    ):
+        # given
+        request_user = RequestUser(id=user_fixture.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        schedule_create_request_dto.member_list = [user_fixture.id, "wrong_id"]
+
+        mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
+        mock_repo["center_schedule"].save.side_effect = [new_schedule_fixture]
+        mock_repo["user"].find_by_ids.side_effect = [[user_fixture]]
+
+        with pytest.raises(NotFoundException) as exception:
+            # when
+            await center_service.create_schedule(request_user, center_fixture.id, schedule_create_request_dto)
+
+        # then
+        assert exception.value.code == ErrorCode.DATA_DOES_NOT_EXIST
+        assert "wrong_id" in exception.value.message
+        assert user_fixture.id not in exception.value.message
+
     @pytest.mark.asyncio
     @pytest.mark.it('Fail case: center is not exist')
     async def test_create_schedule_with_not_exist_center(
@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.enum import CenterUploadPurpose
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.service.center import CenterService
+
+
+@pytest.mark.describe("Test case for create upload url")
+class TestCreateUploadUrl(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    @patch("claon_admin.service.center.create_presigned_upload")
+    async def test_create_upload_url(
+            self,
+            mock_create_presigned_upload,
+            center_service: CenterService
+    ):
+        # given
+        mock_create_presigned_upload.return_value = (
+            "https://test_bucket.s3.amazonaws.com/",
+            {"key": "center/image/2023-06-01/uuid.png", "Content-Type": "image/png"},
+            "https://test_bucket.s3.region.amazonaws.com/center/image/2023-06-01/uuid.png"
+        )
+
+        # when
+        result = await center_service.create_upload_url(CenterUploadPurpose.IMAGE, "test.png")
+
+        # then
+        mock_create_presigned_upload.assert_called_once_with("test.png", "center", "image")
+        assert result.url == "https://test_bucket.s3.amazonaws.com/"
+        assert result.fields["key"] == "center/image/2023-06-01/uuid.png"
+        assert result.file_url.split('/')[-4] == "center"
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: invalid file format")
+    async def test_create_upload_url_with_invalid_format(self, center_service: CenterService):
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await center_service.create_upload_url(CenterUploadPurpose.IMAGE, "test.pdf")
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
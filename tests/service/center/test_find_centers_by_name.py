@@ -25,3 +25,23 @@ class TestFindCentersByName(object):
         # then
         assert len(result) == 1
         assert response in result
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: return thumbnail of profile image")
+    async def test_find_centers_by_name_with_thumbnail(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        thumbnail_url = "https://test.profile.thumbnail.webp"
+        mock_repo["center"].find_by_name.side_effect = [[center_fixture]]
+        mock_repo["image_variant"].find_thumbnails.return_value = {center_fixture.profile_img: thumbnail_url}
+
+        # when
+        result = await center_service.find_centers_by_name(center_fixture.name)
+
+        # then
+        assert result[0].profile_image == thumbnail_url
+        mock_repo["image_variant"].find_thumbnails.assert_awaited_once()
@@ -49,9 +49,9 @@ class TestSave(object):
         request_user = RequestUser(id=user_fixture.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
 
         mock_repo["center"].save.side_effect = [new_center_fixture]
-        mock_repo["center_hold"].save_all.side_effect = [new_center_holds_fixture]
-        mock_repo["center_wall"].save_all.side_effect = [new_center_walls_fixture]
-        mock_repo["center_approved_file"].save_all.side_effect = [new_approved_file_fixture]
+        mock_repo["center_hold"].insert_all.side_effect = [new_center_holds_fixture]
+        mock_repo["center_wall"].insert_all.side_effect = [new_center_walls_fixture]
+        mock_repo["center_approved_file"].insert_all.side_effect = [new_approved_file_fixture]
 
         response = CenterResponseDto.from_entity(new_center_fixture, new_center_holds_fixture, new_center_walls_fixture)
 
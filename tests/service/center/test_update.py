@@ -51,8 +51,6 @@ class TestUpdate(object):
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.ADMIN)
 
         mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
-        mock_repo["center_hold"].save_all.side_effect = [center_holds_fixture]
-        mock_repo["center_wall"].save_all.side_effect = [center_walls_fixture]
 
         response = CenterResponseDto.from_entity(center_fixture, center_holds_fixture, center_walls_fixture)
 
@@ -60,6 +58,61 @@ class TestUpdate(object):
         result = await center_service.update(request_user, center_fixture.id, center_update_request_dto)
         # then
         assert result == response
+        mock_repo["center_hold"].delete_by_center_id_and_ids.assert_not_called()
+        mock_repo["center_hold"].upsert_all.assert_not_called()
+        mock_repo["center_hold"].insert_all.assert_not_called()
+        mock_repo["center_wall"].delete_by_center_id_and_ids.assert_not_called()
+        mock_repo["center_wall"].upsert_all.assert_not_called()
+        mock_repo["center_wall"].insert_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it('Success case: only changed holds and walls are written')
+    async def test_update_with_changed_holds_and_walls(
+            self,
+            mock_repo: dict,
+            center_service: CenterService,
+            center_fixture: Center,
+            center_holds_fixture: List[CenterHold],
+            center_walls_fixture: List[CenterWall],
+            center_update_request_dto: CenterUpdateRequestDto
+    ):
+        # given
+        center_fixture.holds = center_holds_fixture
+        center_fixture.walls = center_walls_fixture
+        hold_id = center_holds_fixture[0].id
+        wall_id = center_walls_fixture[0].id
+
+        center_update_request_dto.hold_info = CenterHoldInfoDto(
+            is_color=False,
+            hold_list=[
+                CenterHoldDto(hold_id=hold_id, name="renamed", difficulty="hard"),
+                CenterHoldDto(name="new hold", difficulty="easy")
+            ]
+        )
+        center_update_request_dto.wall_list = []
+
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.ADMIN)
+
+        mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
+
+        # when
+        result = await center_service.update(request_user, center_fixture.id, center_update_request_dto)
+
+        # then
+        assert [e.name for e in result.hold_info.hold_list] == ["renamed", "new hold"]
+        assert result.hold_info.hold_list[0].hold_id == hold_id
+        assert result.wall_list == []
+        assert center_holds_fixture[0].name == "renamed"
+
+        mock_repo["center_hold"].delete_by_center_id_and_ids.assert_not_called()
+        upserted = mock_repo["center_hold"].upsert_all.call_args.args[1]
+        assert [(e.id, e.name) for e in upserted] == [(hold_id, "renamed")]
+        inserted = mock_repo["center_hold"].insert_all.call_args.args[1]
+        assert [e.name for e in inserted] == ["new hold"]
+
+        assert mock_repo["center_wall"].delete_by_center_id_and_ids.call_args.args[1:] == (center_fixture.id, [wall_id])
+        mock_repo["center_wall"].upsert_all.assert_not_called()
+        mock_repo["center_wall"].insert_all.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.it('Fail case: center is not found')
@@ -36,7 +36,6 @@ class TestUpdateSchedule(object):
             center_fixture: Center,
             schedule_fixture: CenterSchedule,
             schedule_member_fixture: CenterScheduleMember,
-            updated_schedule_member_fixture: CenterScheduleMember,
             schedule_update_request_dto: ScheduleRequestDto
     ):
         # given
@@ -44,9 +43,7 @@ class TestUpdateSchedule(object):
 
         mock_repo["center"].find_by_id.side_effect = [center_fixture]
         mock_repo["center_schedule"].find_by_id_and_center_id.side_effect = [schedule_fixture]
-        mock_repo["center_schedule_member"].delete_by_schedule_id.side_effect = [schedule_member_fixture]
-        mock_repo["user"].find_by_id.side_effect = [client_user_fixture]
-        mock_repo["center_schedule_member"].save.side_effect = [updated_schedule_member_fixture]
+        mock_repo["user"].find_by_ids.side_effect = [[client_user_fixture]]
 
         schedule_fixture.update(**schedule_update_request_dto.schedule_info.dict())
 
@@ -60,6 +57,44 @@ class TestUpdateSchedule(object):
 
         # then
         assert result == response
+        mock_repo["center_schedule_member"].delete_by_schedule_id_and_user_ids.assert_called_once()
+        assert mock_repo["center_schedule_member"].delete_by_schedule_id_and_user_ids.call_args.args[1:] == \
+               (schedule_fixture.id, [user_fixture.id])
+        assert [member.user_id for member in mock_repo["center_schedule_member"].insert_all.call_args.args[1]] == \
+               [client_user_fixture.id]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: unchanged members are kept")
+    async def test_update_schedule_with_unchanged_members(
+            self,
+            center_service: CenterService,
+            mock_repo: dict,
+            user_fixture: User,
+            client_user_fixture: User,
+            center_fixture: Center,
+            schedule_fixture: CenterSchedule,
+            schedule_member_fixture: CenterScheduleMember,
+            schedule_update_request_dto: ScheduleRequestDto
+    ):
+        # given
+        request_user = RequestUser(id=user_fixture.id, sns="sns@gmail.com", role=Role.CENTER_ADMIN)
+        schedule_update_request_dto.member_list = [user_fixture.id, client_user_fixture.id]
+
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center_schedule"].find_by_id_and_center_id.side_effect = [schedule_fixture]
+        mock_repo["user"].find_by_ids.side_effect = [[client_user_fixture, user_fixture]]
+
+        # when
+        result = await center_service.update_schedule(request_user,
+                                                      center_fixture.id,
+                                                      schedule_fixture.id,
+                                                      schedule_update_request_dto)
+
+        # then
+        assert [member.user_id for member in result.member_list] == [user_fixture.id, client_user_fixture.id]
+        mock_repo["center_schedule_member"].delete_by_schedule_id_and_user_ids.assert_not_called()
+        assert [member.user_id for member in mock_repo["center_schedule_member"].insert_all.call_args.args[1]] == \
+               [client_user_fixture.id]
 
     @pytest.mark.asyncio
     @pytest.mark.it('Fail case: center is not found')
@@ -149,7 +184,7 @@ class TestUpdateSchedule(object):
         request_user = RequestUser(id=user_fixture.id, sns="sns@gmail.com", role=Role.CENTER_ADMIN)
         mock_repo["center"].find_by_id.side_effect = [center_fixture]
         mock_repo["center_schedule"].find_by_id_and_center_id.side_effect = [schedule_fixture]
-        mock_repo["user"].find_by_id.side_effect = [None]
+        mock_repo["user"].find_by_ids.side_effect = [[]]
 
         with pytest.raises(NotFoundException) as exception:
             # when
@@ -160,3 +195,4 @@ class TestUpdateSchedule(object):
 
         # then
         assert exception.value.code == ErrorCode.DATA_DOES_NOT_EXIST
+        assert schedule_update_request_dto.member_list[0] in exception.value.message
@@ -12,10 +12,12 @@ from claon_admin.service.center import CenterService
 class TestUploadFile(object):
     @pytest.mark.asyncio
     @pytest.mark.it("Success case: upload image")
+    @patch("claon_admin.service.center.request_image_variants")
     @patch("claon_admin.service.center.upload_file")
     async def test_upload_file_with_purpose(
             self,
             mock_upload_file,
+            mock_request_image_variants,
             center_service: CenterService
     ):
         # given
@@ -31,13 +33,16 @@ class TestUploadFile(object):
         assert result.file_url.split('.')[-1] == "png"
         assert result.file_url.split('/')[-2] == "image"
         assert result.file_url.split('/')[-3] == "center"
+        mock_request_image_variants.assert_awaited_once_with(result.file_url)
 
     @pytest.mark.asyncio
     @pytest.mark.it("Success case: upload proof")
+    @patch("claon_admin.service.center.request_image_variants")
     @patch("claon_admin.service.center.upload_file")
     async def test_upload_file_with_purpose_proof(
             self,
             mock_upload_file,
+            mock_request_image_variants,
             center_service: CenterService
     ):
         # given
@@ -53,6 +58,7 @@ class TestUploadFile(object):
         assert result.file_url.split('.')[-1] == "pdf"
         assert result.file_url.split('/')[-2] == "proof"
         assert result.file_url.split('/')[-3] == "center"
+        mock_request_image_variants.assert_not_awaited()
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: invalid file format")
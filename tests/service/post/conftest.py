@@ -5,12 +5,13 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from claon_admin.common.enum import Role, WallType
-from claon_admin.common.util.time import now
+from claon_admin.common.enum import Role, WallType, PostCountPeriod
+from claon_admin.common.util.time import now, get_start_of_week
 from claon_admin.schema.center import CenterRepository, Center, CenterImage, OperatingTime, Utility, CenterFeeImage, \
     CenterFee, CenterHold, CenterWall
 from claon_admin.schema.post import PostRepository, Post, PostImage, ClimbingHistory, PostCountHistoryRepository, \
-    PostCountHistory
+    PostCountHistory, PostCountTotalRepository, PostCountTotal, PostCountRollupRepository, PostCountRollup
+from claon_admin.schema.file import ImageVariantRepository
 from claon_admin.schema.user import User
 from claon_admin.service.post import PostService
 
@@ -20,11 +21,18 @@ def mock_repo():
     center_repository = AsyncMock(spec=CenterRepository)
     post_repository = AsyncMock(spec=PostRepository)
     post_count_history_repository = AsyncMock(spec=PostCountHistoryRepository)
+    post_count_total_repository = AsyncMock(spec=PostCountTotalRepository)
+    post_count_rollup_repository = AsyncMock(spec=PostCountRollupRepository)
+    image_variant_repository = AsyncMock(spec=ImageVariantRepository)
+    image_variant_repository.find_thumbnails.return_value = {}
 
     return {
         "center": center_repository,
         "post": post_repository,
-        "post_count_history": post_count_history_repository
+        "post_count_history": post_count_history_repository,
+        "post_count_total": post_count_total_repository,
+        "post_count_rollup": post_count_rollup_repository,
+        "image_variant": image_variant_repository
     }
 
 
@@ -33,7 +41,10 @@ def post_service(mock_repo: dict):
     return PostService(
         center_repository=mock_repo["center"],
         post_repository=mock_repo["post"],
-        post_count_history_repository=mock_repo["post_count_history"]
+        post_count_history_repository=mock_repo["post_count_history"],
+        post_count_total_repository=mock_repo["post_count_total"],
+        post_count_rollup_repository=mock_repo["post_count_rollup"],
+        image_variant_repository=mock_repo["image_variant"]
     )
 
 
@@ -215,6 +226,29 @@ async def post_count_history_list_fixture(center_fixture: Center):
     ]
 
 
+@pytest.fixture
+async def post_count_total_fixture(center_fixture: Center, post_count_history_list_fixture: List[PostCountHistory]):
+    yield PostCountTotal(
+        center_id=center_fixture.id,
+        count=sum(history.count for history in post_count_history_list_fixture),
+        first_reg_date=post_count_history_list_fixture[0].reg_date,
+        last_reg_date=post_count_history_list_fixture[-1].reg_date
+    )
+
+
+@pytest.fixture
+async def post_count_rollup_list_fixture(center_fixture: Center,
+                                         post_count_history_list_fixture: List[PostCountHistory]):
+    yield [
+        PostCountRollup(
+            center_id=center_fixture.id,
+            period=PostCountPeriod.WEEK,
+            reg_date=get_start_of_week(history.reg_date),
+            count=history.count
+        ) for history in post_count_history_list_fixture
+    ]
+
+
 @pytest.fixture
 def climbing_history_fixture(post_fixture: Post,
                              center_holds_fixture: List[CenterHold],
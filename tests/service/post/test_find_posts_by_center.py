@@ -105,6 +105,38 @@ class TestFindPostsByCenter(object):
         assert pages.results[0].user_id == post_fixture.user.id
         assert pages.results[0].user_nickname == post_fixture.user.nickname
 
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: return thumbnails of images")
+    async def test_find_posts_by_center_with_thumbnail(
+            self,
+            mock_repo: dict,
+            center_fixture: Center,
+            post_fixture: Post,
+            post_service: PostService
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        params = Params(page=1, size=10)
+        mock_repo["center"].find_by_id_with_details.side_effect = [center_fixture]
+        mock_repo["post"].find_posts_by_center.return_value = Page(
+            items=[post_fixture], params=params, total=1, page=1, pages=1
+        )
+        thumbnail_url = "https://test.post.img.thumbnail.webp"
+        mock_repo["image_variant"].find_thumbnails.return_value = {post_fixture.img[0].url: thumbnail_url}
+        finder = PostFinder(start_date=datetime(2022, 4, 1), end_date=datetime(2023, 3, 31), hold_id=None)
+
+        # when
+        pages: Pagination[PostBriefResponseDto] = await post_service.find_posts_by_center(
+            request_user,
+            params,
+            center_fixture.id,
+            finder
+        )
+
+        # then
+        assert pages.results[0].image == thumbnail_url
+        assert pages.results[0].user_profile_image == post_fixture.user.profile_img
+
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: center is not found")
     async def test_find_posts_by_center_with_wrong_center_id(
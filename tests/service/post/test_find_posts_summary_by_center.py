@@ -1,15 +1,68 @@
+import random
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 from typing import List
+from unittest.mock import patch
 
 import pytest
 
-from claon_admin.common.enum import Role
+from claon_admin.common.enum import Role, PostCountPeriod
 from claon_admin.common.error.exception import UnauthorizedException, ErrorCode, NotFoundException
+from claon_admin.common.util.time import get_weekday, get_start_of_week
 from claon_admin.model.auth import RequestUser
 from claon_admin.schema.center import Center, Post
-from claon_admin.schema.post import PostCountHistory
+from claon_admin.schema.post import PostCountHistory, PostCountTotal, PostCountRollup
 from claon_admin.service.post import PostService
 
 
+def summarize_with_pandas(end_date: date, count_total: int, history_list: List[PostCountHistory]):
+    # PostSummaryResponseDto.from_entity as it was before the post count rollups, kept as the reference output
+    pd = pytest.importorskip("pandas")
+    if not history_list:
+        return {"count_today": 0, "count_week": 0, "count_month": 0, "count_total": count_total,
+                "count_per_day": [], "count_per_week": []}
+
+    count_by_month = list(filter(lambda x: end_date - timedelta(days=4 * 7) <= x.reg_date < end_date, history_list))
+    count_by_week = list(filter(lambda x: end_date - timedelta(days=7) <= x.reg_date < end_date, count_by_month))
+    count_by_day = list(filter(lambda x: end_date - timedelta(days=1) <= x.reg_date < end_date, count_by_week))
+
+    data_default = pd.DataFrame(pd.date_range(history_list[0].reg_date, end_date - timedelta(days=1), freq="D"),
+                                columns=["reg_date"]).fillna(0)
+    data = pd.DataFrame([{"reg_date": history.reg_date, "count": history.count} for history in history_list])
+    data.reg_date = data.reg_date.astype("datetime64[ns]")
+    data = pd.merge(data_default, data, on="reg_date", how="left").fillna(0).set_index("reg_date")
+    data_per_day = data.iloc[-7:].T.to_dict("records")[0]
+    data_per_week = data.resample("W")["count"].sum().to_frame()
+    if end_date.weekday() > 0:
+        data_per_week = data_per_week[0:-1]
+    # the old pipeline raised IndexError here when every row fell into the dropped partial week
+    data_per_week = data_per_week.T.to_dict("records")[0] if len(data_per_week) > 0 else {}
+
+    return {
+        "count_today": sum(history.count for history in count_by_day),
+        "count_week": sum(history.count for history in count_by_week),
+        "count_month": sum(history.count for history in count_by_month),
+        "count_total": count_total,
+        "count_per_day": [{"unit": get_weekday(day), "count": count} for day, count in data_per_day.items()],
+        "count_per_week": [{"unit": week.strftime("%Y-%m-%d"), "count": count}
+                           for week, count in data_per_week.items()]
+    }
+
+
+def days_ago_to_history(center: Center, end_date: date, counts: dict):
+    return sorted([PostCountHistory(center_id=center.id, reg_date=end_date - timedelta(days=days_ago), count=count)
+                   for days_ago, count in counts.items()], key=lambda history: history.reg_date)
+
+
+SUMMARY_CASES = {
+    "no history": {},
+    "no history in the window": {400: 5},
+    "single recent day": {3: 4},
+    "sparse": {400: 5, 200: 1, 30: 2, 9: 3, 1: 7},
+    "full year": {days_ago: random.Random(days_ago).randint(1, 30) for days_ago in range(1, 400)}
+}
+
+
 @pytest.mark.describe("Test case for find posts summary by center")
 class TestFindPostsSummaryByCenter(object):
     @pytest.mark.asyncio
@@ -23,13 +76,19 @@ class TestFindPostsSummaryByCenter(object):
             other_post_fixture: Post,
             another_post_fixture: Post,
             post_count_history_list_fixture: List[PostCountHistory],
+            post_count_total_fixture: PostCountTotal,
+            post_count_rollup_list_fixture: List[PostCountRollup],
             post_fixture: Post
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
         mock_repo["center"].find_by_id.side_effect = [center_fixture]
-        mock_repo["post_count_history"].sum_count_by_center.side_effect = [30]
-        mock_repo["post_count_history"].find_by_center_and_date.side_effect = [post_count_history_list_fixture]
+        mock_repo["post_count_total"].find_by_id.side_effect = [post_count_total_fixture]
+        mock_repo["post_count_history"].find_first_reg_date_by_center_and_date.side_effect = [
+            post_count_history_list_fixture[0].reg_date
+        ]
+        mock_repo["post_count_history"].find_by_center_and_date.side_effect = [post_count_history_list_fixture[1:]]
+        mock_repo["post_count_rollup"].find_by_center_and_period.side_effect = [post_count_rollup_list_fixture]
 
         # when
         results = await post_service.find_posts_summary_by_center(request_user, center_fixture.id)
@@ -40,12 +99,37 @@ class TestFindPostsSummaryByCenter(object):
         assert results.count_today == 10
         assert results.count_week == 10
         assert results.count_month == 30
-        assert results.count_total == 30
+        assert results.count_total == 40
         assert len(results.count_per_day) == 7
         assert results.count_per_day[-1].count == 10
         assert len(results.count_per_week) == 52
         assert results.count_per_week[-1].count == 10
 
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: center has no counted posts")
+    async def test_find_posts_summary_by_center_without_count(
+            self,
+            post_service: PostService,
+            mock_repo: dict,
+            center_fixture: Center
+    ):
+        # given
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["post_count_total"].find_by_id.side_effect = [None]
+        mock_repo["post_count_history"].find_first_reg_date_by_center_and_date.side_effect = [None]
+        mock_repo["post_count_history"].find_by_center_and_date.side_effect = [[]]
+        mock_repo["post_count_rollup"].find_by_center_and_period.side_effect = [[]]
+
+        # when
+        results = await post_service.find_posts_summary_by_center(request_user, center_fixture.id)
+
+        # then
+        assert results.count_today == 0
+        assert results.count_total == 0
+        assert results.count_per_day == []
+        assert results.count_per_week == []
+
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: center is not found")
     async def test_find_posts_summary_by_center_with_not_exist_center(
@@ -84,3 +168,51 @@ class TestFindPostsSummaryByCenter(object):
 
         # then
         assert exception.value.code == ErrorCode.NOT_ACCESSIBLE
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: summary matches the pandas pipeline it replaced")
+    @pytest.mark.parametrize("case", SUMMARY_CASES.keys())
+    @pytest.mark.parametrize("end_date", [date(2023, 6, 5), date(2023, 6, 7), date(2023, 6, 11)])
+    async def test_find_posts_summary_by_center_compared_with_pandas(
+            self,
+            post_service: PostService,
+            mock_repo: dict,
+            center_fixture: Center,
+            case: str,
+            end_date: date
+    ):
+        # given
+        history_list = days_ago_to_history(center_fixture, end_date, SUMMARY_CASES[case])
+        start_date = end_date - timedelta(days=52 * 7 + end_date.weekday())
+        history_by_year = [history for history in history_list if start_date <= history.reg_date < end_date]
+
+        count_per_week = defaultdict(int)
+        for history in history_by_year:
+            count_per_week[get_start_of_week(history.reg_date)] += history.count
+
+        request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
+        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["post_count_total"].find_by_id.side_effect = [PostCountTotal(
+            center_id=center_fixture.id,
+            count=sum(history.count for history in history_list),
+            first_reg_date=history_list[0].reg_date,
+            last_reg_date=history_list[-1].reg_date
+        ) if history_list else None]
+        mock_repo["post_count_history"].find_first_reg_date_by_center_and_date.side_effect = [
+            history_by_year[0].reg_date if history_by_year else None
+        ]
+        mock_repo["post_count_history"].find_by_center_and_date.side_effect = [
+            [history for history in history_by_year if history.reg_date >= end_date - timedelta(weeks=4)]
+        ]
+        mock_repo["post_count_rollup"].find_by_center_and_period.side_effect = [[
+            PostCountRollup(center_id=center_fixture.id, period=PostCountPeriod.WEEK, reg_date=week, count=count)
+            for week, count in sorted(count_per_week.items())
+        ]]
+
+        # when
+        with patch("claon_admin.service.post.now", return_value=datetime.combine(end_date, datetime.min.time())):
+            results = await post_service.find_posts_summary_by_center(request_user, center_fixture.id)
+
+        # then
+        expected = summarize_with_pandas(end_date, sum(history.count for history in history_list), history_by_year)
+        assert results.dict(exclude={"center_id", "center_name"}) == expected
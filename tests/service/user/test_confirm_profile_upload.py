@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.service.user import UserService
+
+
+@pytest.mark.describe("Test case for confirm profile upload")
+class TestConfirmProfileUpload(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    @patch("claon_admin.service.user.request_image_variants")
+    @patch("claon_admin.service.user.confirm_upload")
+    async def test_confirm_profile_upload(
+            self,
+            mock_confirm_upload,
+            mock_request_image_variants,
+            user_service: UserService
+    ):
+        # given
+        file_url = "https://test_bucket.s3.region.amazonaws.com/user/profile/2023-06-01/uuid.png"
+        mock_confirm_upload.return_value = file_url
+
+        # when
+        result = await user_service.confirm_profile_upload(file_url)
+
+        # then
+        mock_confirm_upload.assert_called_once_with(file_url, "user", "profile")
+        assert result.file_url == file_url
+        mock_request_image_variants.assert_awaited_once_with(file_url)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: invalid file format")
+    async def test_confirm_profile_upload_with_invalid_format(self, user_service: UserService):
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await user_service.confirm_profile_upload("https://test_bucket.s3.region.amazonaws.com/user/profile/2023-06-01/uuid.pdf")
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.enum import LectorUploadPurpose
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.service.user import UserService
+
+
+@pytest.mark.describe("Test case for confirm upload")
+class TestConfirmUpload(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    @patch("claon_admin.service.user.confirm_upload")
+    async def test_confirm_upload(
+            self,
+            mock_confirm_upload,
+            user_service: UserService
+    ):
+        # given
+        file_url = "https://test_bucket.s3.region.amazonaws.com/lector/proof/2023-06-01/uuid.pdf"
+        mock_confirm_upload.return_value = file_url
+
+        # when
+        result = await user_service.confirm_upload(LectorUploadPurpose.PROOF, file_url)
+
+        # then
+        mock_confirm_upload.assert_called_once_with(file_url, "lector", "proof")
+        assert result.file_url == file_url
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: invalid file format")
+    async def test_confirm_upload_with_invalid_format(self, user_service: UserService):
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await user_service.confirm_upload(LectorUploadPurpose.PROOF, "https://test_bucket.s3.region.amazonaws.com/lector/proof/2023-06-01/uuid.gif")
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.service.user import UserService
+
+
+@pytest.mark.describe("Test case for create profile upload url")
+class TestCreateProfileUploadUrl(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    @patch("claon_admin.service.user.create_presigned_upload")
+    async def test_create_profile_upload_url(
+            self,
+            mock_create_presigned_upload,
+            user_service: UserService
+    ):
+        # given
+        mock_create_presigned_upload.return_value = (
+            "https://test_bucket.s3.amazonaws.com/",
+            {"key": "user/profile/2023-06-01/uuid.png"},
+            "https://test_bucket.s3.region.amazonaws.com/user/profile/2023-06-01/uuid.png"
+        )
+
+        # when
+        result = await user_service.create_profile_upload_url("test.png")
+
+        # then
+        mock_create_presigned_upload.assert_called_once_with("test.png", "user", "profile")
+        assert result.fields["key"] == "user/profile/2023-06-01/uuid.png"
+        assert result.file_url.split('/')[-3] == "profile"
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: invalid file format")
+    async def test_create_profile_upload_url_with_invalid_format(self, user_service: UserService):
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await user_service.create_profile_upload_url("test.pdf")
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.enum import LectorUploadPurpose
+from claon_admin.common.error.exception import BadRequestException, ErrorCode
+from claon_admin.service.user import UserService
+
+
+@pytest.mark.describe("Test case for create upload url")
+class TestCreateUploadUrl(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case")
+    @patch("claon_admin.service.user.create_presigned_upload")
+    async def test_create_upload_url(
+            self,
+            mock_create_presigned_upload,
+            user_service: UserService
+    ):
+        # given
+        mock_create_presigned_upload.return_value = (
+            "https://test_bucket.s3.amazonaws.com/",
+            {"key": "lector/proof/2023-06-01/uuid.pdf"},
+            "https://test_bucket.s3.region.amazonaws.com/lector/proof/2023-06-01/uuid.pdf"
+        )
+
+        # when
+        result = await user_service.create_upload_url(LectorUploadPurpose.PROOF, "test.pdf")
+
+        # then
+        mock_create_presigned_upload.assert_called_once_with("test.pdf", "lector", "proof")
+        assert result.fields["key"] == "lector/proof/2023-06-01/uuid.pdf"
+        assert result.file_url.split('/')[-3] == "proof"
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: invalid file format")
+    async def test_create_upload_url_with_invalid_format(self, user_service: UserService):
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await user_service.create_upload_url(LectorUploadPurpose.PROOF, "test.gif")
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
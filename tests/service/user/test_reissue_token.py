@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.enum import Role
+from claon_admin.model.auth import RefreshUser
+from claon_admin.schema.user import User
+from claon_admin.service.user import UserService
+
+
+@pytest.mark.describe("Test case for reissue token")
+class TestReissueToken(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: rotated refresh key is returned")
+    @patch("claon_admin.service.user.create_access_token")
+    async def test_reissue_token(
+            self,
+            mock_create_access_token,
+            user_service: UserService,
+            user_fixture: User
+    ):
+        # given
+        subject = RefreshUser(id=user_fixture.id, sns=user_fixture.sns, role=Role.USER, refresh_key="new_refresh_key")
+        mock_create_access_token.return_value = "test_access_token"
+
+        # when
+        result = await user_service.reissue_token(subject)
+
+        # then
+        assert result.access_token == "test_access_token"
+        assert result.refresh_key == "new_refresh_key"
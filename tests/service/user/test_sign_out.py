@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.enum import Role
+from claon_admin.model.auth import RequestUser
+from claon_admin.service.user import UserService
+
+
+@pytest.mark.describe("Test case for sign out")
+class TestSignOut(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: revoke every refresh key of user")
+    @patch("claon_admin.service.user.revoke_refresh_keys_by_user_id")
+    async def test_sign_out(
+            self,
+            mock_revoke_refresh_keys_by_user_id,
+            user_service: UserService
+    ):
+        # given
+        subject = RequestUser(id="user_id", sns="test@claon.com", role=Role.USER)
+
+        # when
+        await user_service.sign_out(subject)
+
+        # then
+        mock_revoke_refresh_keys_by_user_id.assert_awaited_once_with("user_id")
@@ -60,9 +60,9 @@ class TestSignUpCenter(object):
         mock_repo["user"].exist_by_nickname.side_effect = [False]
         mock_repo["user"].find_by_id.side_effect = [user_fixture]
         mock_repo["center"].save.side_effect = [center_fixture]
-        mock_repo["center_hold"].save_all.side_effect = [center_holds_fixture]
-        mock_repo["center_wall"].save_all.side_effect = [center_walls_fixture]
-        mock_repo["center_approved_file"].save_all.side_effect = [center_approved_files_fixture]
+        mock_repo["center_hold"].insert_all.side_effect = [center_holds_fixture]
+        mock_repo["center_wall"].insert_all.side_effect = [center_walls_fixture]
+        mock_repo["center_approved_file"].insert_all.side_effect = [center_approved_files_fixture]
 
         # when
         result = await user_service.sign_up_center(request_user, center_request_dto)
@@ -79,8 +79,12 @@ class TestSignUpCenter(object):
         assert result.image_list == center_request_dto.center.image_list
         assert result.utility_list == center_request_dto.center.utility_list
         assert result.operating_time_list == center_request_dto.center.operating_time_list
-        assert result.hold_info == center_request_dto.hold_info
-        assert result.wall_list == center_request_dto.wall_list
+        assert result.hold_info.dict(exclude={"hold_list": {"__all__": {"hold_id"}}}) == \
+               center_request_dto.hold_info.dict(exclude={"hold_list": {"__all__": {"hold_id"}}})
+        assert [e.hold_id for e in result.hold_info.hold_list] == [e.id for e in center_holds_fixture]
+        assert [e.dict(exclude={"wall_id"}) for e in result.wall_list] == \
+               [e.dict(exclude={"wall_id"}) for e in center_request_dto.wall_list]
+        assert [e.wall_id for e in result.wall_list] == [e.id for e in center_walls_fixture]
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: user nickname already exist")
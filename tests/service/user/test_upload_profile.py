@@ -11,10 +11,12 @@ from claon_admin.service.user import UserService
 class TestUploadProfile(object):
     @pytest.mark.asyncio
     @pytest.mark.it("Success case")
+    @patch("claon_admin.service.user.request_image_variants")
     @patch("claon_admin.service.user.upload_file")
     async def test_upload_profile(
             self,
             mock_upload_file,
+            mock_request_image_variants,
             user_service: UserService
     ):
         # given
@@ -29,6 +31,7 @@ class TestUploadProfile(object):
         assert result.file_url.split('.')[-1] == "png"
         assert result.file_url.split('/')[-2] == "profile"
         assert result.file_url.split('/')[-3] == "user"
+        mock_request_image_variants.assert_awaited_once_with(result.file_url)
 
     @pytest.mark.asyncio
     @pytest.mark.it("Fail case: invalid file format")
@@ -0,0 +1,68 @@
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.enum import Role
+from claon_admin.common.error.exception import UnauthorizedException, ErrorCode
+from claon_admin.common.util import auth, transaction
+from claon_admin.common.util.db import Database
+from claon_admin.common.util.transaction import get_session
+from claon_admin.schema.user import User, UserRepository
+
+find_user_by_id = getattr(auth, "__find_user_by_id")
+
+
+@pytest.fixture
+async def database(tmp_path, monkeypatch):
+    database = Database(f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'auth.db')}")
+    monkeypatch.setattr(transaction, "db", database)
+    yield database
+    await database.dispose()
+
+
+def user_repository_returning(user: User | None):
+    async def find_by_id(session: AsyncSession, user_id: str):
+        await session.execute(text("SELECT 1"))
+        return user
+
+    user_repository = AsyncMock(spec=UserRepository)
+    user_repository.find_by_id.side_effect = find_by_id
+    return user_repository
+
+
+@pytest.mark.describe("Test case for request user lookup")
+class TestFindUserById(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Lookup ends the transaction it began on the request session")
+    async def test_find_user_by_id(self, database: Database):
+        # given
+        user = User(id="user", nickname="nickname", role=Role.USER)
+        session_generator = get_session()
+        session = await session_generator.__anext__()
+
+        # when
+        result = await find_user_by_id(user_id=user.id, user_repository=user_repository_returning(user))
+
+        # then
+        assert result is user
+        assert not session.in_transaction()
+        await session_generator.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: user does not exist")
+    async def test_find_user_by_id_with_not_exist_user(self, database: Database):
+        # given
+        session_generator = get_session()
+        session = await session_generator.__anext__()
+
+        with pytest.raises(UnauthorizedException) as exception:
+            # when
+            await find_user_by_id(user_id="wrong id", user_repository=user_repository_returning(None))
+
+        # then
+        assert exception.value.code == ErrorCode.USER_DOES_NOT_EXIST
+        assert not session.in_transaction()
+        await session_generator.aclose()
@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+import pytest
+
+from claon_admin.common.util.cache import LRUCache
+
+
+@pytest.mark.describe("Test case for lru cache")
+class TestLRUCache(object):
+    @pytest.mark.it("Return stored value and count hits and misses")
+    def test_get(self):
+        # given
+        cache = LRUCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+
+        # when
+        hit = cache.get("a")
+        miss = cache.get("b")
+
+        # then
+        assert hit == 1
+        assert miss is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.it("Evict least recently used value over capacity")
+    def test_put_over_capacity(self):
+        # given
+        cache = LRUCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # when
+        cache.put("c", 3)
+
+        # then
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats()["size"] == 2
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.it("Expire value after ttl")
+    def test_get_expired(self):
+        # given
+        cache = LRUCache(max_size=2, ttl=60)
+        with patch("claon_admin.common.util.cache.monotonic", return_value=100.0):
+            cache.put("a", 1)
+
+        # when
+        with patch("claon_admin.common.util.cache.monotonic", return_value=159.0):
+            before_ttl = cache.get("a")
+        with patch("claon_admin.common.util.cache.monotonic", return_value=160.0):
+            after_ttl = cache.get("a")
+
+        # then
+        assert before_ttl == 1
+        assert after_ttl is None
+        assert cache.stats()["size"] == 0
+
+    @pytest.mark.it("Evict value by key")
+    def test_evict(self):
+        # given
+        cache = LRUCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+
+        # when
+        cache.evict("a")
+        cache.evict("not-existing")
+
+        # then
+        assert cache.get("a") is None
+
+    @pytest.mark.it("Disable cache with zero ttl or size")
+    def test_put_disabled(self):
+        # given
+        no_ttl = LRUCache(max_size=2, ttl=0)
+        no_size = LRUCache(max_size=0, ttl=60)
+
+        # when
+        no_ttl.put("a", 1)
+        no_size.put("a", 1)
+
+        # then
+        assert no_ttl.get("a") is None
+        assert no_size.get("a") is None
@@ -0,0 +1,138 @@
+import asyncio
+import os
+import time
+
+import pytest
+from sqlalchemy import event, text, MetaData, Table, Column, String, Index
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import claon_admin.container  # noqa: F401, registers every table on Base.metadata
+from claon_admin.common.util.db import MeasuredQueuePool, Database
+from claon_admin.config.config import Config
+from claon_admin.schema.post import PostCountHistory
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'pool.db')}",
+        poolclass=MeasuredQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=5
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def slow_connect(dbapi_connection, connection_record):
+        time.sleep(0.2)
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.describe("Test case for measured queue pool")
+class TestMeasuredQueuePool(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Opening a new connection is not counted as checkout wait")
+    async def test_connect_not_counted(self, engine):
+        # when
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        # then
+        stats = engine.pool.stats()
+        assert stats["checkout_count"] == 1
+        assert stats["checkout_wait_max_ms"] < 100
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Waiting for a checked out connection is counted as checkout wait")
+    async def test_wait_counted(self, engine):
+        # given
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        async def hold():
+            async with engine.connect() as held:
+                await held.execute(text("SELECT 1"))
+                await asyncio.sleep(0.2)
+
+        async def wait():
+            await asyncio.sleep(0.05)
+            async with engine.connect() as waited:
+                await waited.execute(text("SELECT 1"))
+
+        # when
+        await asyncio.gather(hold(), wait())
+
+        # then
+        stats = engine.pool.stats()
+        assert stats["checkout_count"] == 3
+        assert stats["checked_out"] == 0
+        assert stats["checkout_wait_max_ms"] >= 100
+        assert stats["checkout_wait_avg_ms"] < stats["checkout_wait_max_ms"]
+
+
+@pytest.fixture
+async def legacy_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config.DATABASE_CONFIG, "DDL_AUTO", "update")
+    database = Database(f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'legacy.db')}")
+    async with database.async_session_maker() as session:
+        await session.execute(text(
+            f"CREATE TABLE {PostCountHistory.__tablename__} (id INTEGER PRIMARY KEY, center_id VARCHAR(255) NOT NULL, "
+            "reg_date DATETIME NOT NULL, count INTEGER NOT NULL, created_at DATETIME NOT NULL)"
+        ))
+        await session.execute(text(
+            "CREATE INDEX ix_tb_post_count_history_center_id_reg_date ON tb_post_count_history (center_id, reg_date)"
+        ))
+        await session.execute(text(
+            "INSERT INTO tb_post_count_history (id, center_id, reg_date, count, created_at) VALUES "
+            "(1, 'center', '2023-06-01 00:00:00.000000', 1, '2023-06-02 00:00:00.000000'), "
+            "(2, 'center', '2023-06-01 00:00:00.000000', 2, '2023-06-02 00:00:00.000000'), "
+            "(3, 'center', '2023-06-02 00:00:00.000000', 3, '2023-06-03 00:00:00.000000')"
+        ))
+        await session.commit()
+    yield database
+    await database.dispose()
+
+
+@pytest.mark.describe("Test case for database migration")
+class TestCreateDatabase(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Delete duplicate rows before creating a unique index and drop the obsolete index")
+    async def test_create_unique_index(self, legacy_database: Database):
+        # when
+        await legacy_database.create_database()
+
+        # then
+        async with legacy_database.async_session_maker() as session:
+            rows = await session.execute(text("SELECT id, count FROM tb_post_count_history ORDER BY id"))
+            indexes = await session.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tb_post_count_history'"
+            ))
+            assert rows.all() == [(2, 2), (3, 3)]
+            index_names = set(indexes.scalars().all())
+        assert "ux_tb_post_count_history_center_id_reg_date" in index_names
+        assert "ix_tb_post_count_history_center_id_reg_date" not in index_names
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: refuse to pick a duplicate to keep when the primary key is not an integer")
+    async def test_create_unique_index_with_string_primary_key(self, tmp_path):
+        # given
+        table = Table("tb_legacy", MetaData(), Column("id", String(36), primary_key=True), Column("key", String(255)))
+        index = Index("ux_tb_legacy_key", table.c.key, unique=True)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'string.db')}")
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE tb_legacy (id VARCHAR(36) PRIMARY KEY, key VARCHAR(255))"))
+            await conn.execute(text("INSERT INTO tb_legacy (id, key) VALUES ('b', 'key'), ('a', 'key')"))
+
+        with pytest.raises(RuntimeError) as exception:
+            # when
+            async with engine.begin() as conn:
+                await conn.run_sync(getattr(Database, "_Database__delete_duplicates"), index)
+
+        # then
+        assert "ux_tb_legacy_key" in str(exception.value)
+        async with engine.connect() as conn:
+            rows = await conn.execute(text("SELECT id FROM tb_legacy ORDER BY id"))
+            assert rows.scalars().all() == ["a", "b"]
+        await engine.dispose()
@@ -0,0 +1,103 @@
+import io
+from unittest.mock import AsyncMock, MagicMock, ANY
+
+import boto3
+import pytest
+from moto import mock_aws
+from PIL import Image
+
+from claon_admin.common.util import image as image_util
+from claon_admin.common.util import s3 as s3_util
+from claon_admin.schema.file import ImageVariantRepository, ImageVariant
+
+BUCKET = "claon-test"
+REGION = "us-east-1"
+KEY = "center/image/2023-06-01/uuid.png"
+
+
+def create_image(size, mode: str = "RGB", color=(255, 0, 0)):
+    buffer = io.BytesIO()
+    Image.new(mode, size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    with mock_aws():
+        client = boto3.client("s3", region_name=REGION)
+        client.create_bucket(Bucket=BUCKET)
+        client.put_object(Bucket=BUCKET, Key=KEY, Body=create_image((800, 600)), ContentType="image/png")
+        monkeypatch.setattr(s3_util, "s3", client)
+        monkeypatch.setattr(s3_util, "AWS_S3_BUCKET", BUCKET)
+        monkeypatch.setattr(s3_util, "AWS_REGION", REGION)
+        yield client
+
+
+@pytest.fixture
+def image_variant_repository(monkeypatch):
+    image_variant_repository = AsyncMock(spec=ImageVariantRepository)
+    image_variant_repository.find_by_id.return_value = None
+    mock_db = MagicMock()
+    mock_db.async_session_maker.return_value.__aenter__.return_value = AsyncMock()
+    monkeypatch.setattr(image_util, "image_variant_repository", image_variant_repository)
+    monkeypatch.setattr(image_util, "db", mock_db)
+    return image_variant_repository
+
+
+@pytest.mark.describe("Test case for image variants")
+class TestImageVariants(object):
+    @pytest.mark.it("Create square thumbnail and bounded webp")
+    def test_create_variants(self):
+        # when
+        variants = image_util.create_variants(create_image((4000, 1000)))
+
+        # then
+        with Image.open(io.BytesIO(variants[image_util.THUMBNAIL])) as thumbnail:
+            assert thumbnail.format == "WEBP"
+            assert thumbnail.size == (image_util.THUMBNAIL_SIZE, image_util.THUMBNAIL_SIZE)
+        with Image.open(io.BytesIO(variants[image_util.WEBP])) as webp:
+            assert webp.format == "WEBP"
+            assert webp.size == (image_util.WEBP_MAX_SIZE, image_util.WEBP_MAX_SIZE // 4)
+
+    @pytest.mark.it("Keep transparency of images with alpha")
+    def test_create_variants_with_alpha(self):
+        # when
+        variants = image_util.create_variants(create_image((100, 100), "RGBA", (255, 0, 0, 0)))
+
+        # then
+        with Image.open(io.BytesIO(variants[image_util.THUMBNAIL])) as thumbnail:
+            assert thumbnail.mode == "RGBA"
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Upload variants next to the original and register them")
+    async def test_create_image_variants(self, s3_client, image_variant_repository):
+        # given
+        url = s3_util.get_url_prefix() + "/" + KEY
+
+        # when
+        await image_util.create_image_variants(url)
+
+        # then
+        prefix = s3_util.get_url_prefix() + "/center/image/2023-06-01/uuid"
+        image_variant_repository.register.assert_awaited_once_with(
+            ANY,
+            url,
+            prefix + ".thumbnail.webp",
+            prefix + ".webp"
+        )
+        head = s3_client.head_object(Bucket=BUCKET, Key="center/image/2023-06-01/uuid.thumbnail.webp")
+        assert head["ContentType"] == "image/webp"
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Skip images which already have variants")
+    async def test_create_image_variants_with_existing_variants(self, s3_client, image_variant_repository):
+        # given
+        url = s3_util.get_url_prefix() + "/" + KEY
+        image_variant_repository.find_by_id.return_value = ImageVariant(url=url)
+
+        # when
+        await image_util.create_image_variants(url)
+
+        # then
+        image_variant_repository.register.assert_not_awaited()
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 1
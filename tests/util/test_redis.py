@@ -0,0 +1,170 @@
+import asyncio
+
+import fakeredis
+import pytest
+import redis.asyncio as redis_client
+from fakeredis.aioredis import FakeConnection
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from claon_admin.common.util import redis as redis_util
+from claon_admin.common.util.redis import REFRESH_KEY_INDEX_PREFIX
+from claon_admin.config.redis import RedisClient
+
+
+def create_redis_client(max_connections: int = 1, pool_timeout: float = 0.1):
+    return RedisClient(connection_pool=redis_client.BlockingConnectionPool(
+        connection_class=FakeConnection,
+        server=fakeredis.FakeServer(),
+        decode_responses=True,
+        max_connections=max_connections,
+        timeout=pool_timeout
+    ))
+
+
+@pytest.mark.describe("Test case for redis connection pool")
+class TestRedisConnectionPool(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Wait for a released connection when the pool is exhausted")
+    async def test_wait_for_released_connection(self):
+        # given
+        redis = create_redis_client(pool_timeout=1)
+        connection = await redis.pool.get_connection("GET")
+
+        async def release():
+            await asyncio.sleep(0.05)
+            await redis.pool.release(connection)
+
+        # when
+        async with redis.get_connection() as conn:
+            _, result = await asyncio.gather(release(), conn.set("key", "value"))
+
+        # then
+        assert result is True
+        assert redis.stats()["pool"]["created_connections"] == 1
+        await redis.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Raise connection error after pool timeout")
+    async def test_pool_timeout(self):
+        # given
+        redis = create_redis_client(pool_timeout=0.1)
+        connection = await redis.pool.get_connection("GET")
+
+        with pytest.raises(RedisConnectionError):
+            # when
+            async with redis.get_connection() as conn:
+                await conn.get("key")
+
+        # then
+        assert redis.stats()["pool"]["in_use_connections"] == 1
+        await redis.pool.release(connection)
+        assert redis.stats()["pool"]["in_use_connections"] == 0
+        await redis.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Share connections of the pool between concurrent commands")
+    async def test_concurrent_commands(self):
+        # given
+        redis = create_redis_client(max_connections=2, pool_timeout=1)
+
+        # when
+        async with redis.get_connection() as conn:
+            await asyncio.gather(*[conn.incr("counter") for _ in range(20)])
+            result = await conn.get("counter")
+
+        # then
+        assert result == "20"
+        assert redis.stats()["pool"]["created_connections"] <= 2
+        await redis.close()
+
+
+@pytest.fixture
+def refresh_key_redis(monkeypatch):
+    redis = create_redis_client(max_connections=4, pool_timeout=1)
+    monkeypatch.setattr(redis_util, "redis", redis)
+    monkeypatch.setattr(redis_util, "REFRESH_TOKEN_EXPIRE_MINUTES", 60)
+    return redis
+
+
+@pytest.mark.describe("Test case for refresh keys")
+class TestRefreshKeys(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Rotate refresh key and update the index of user")
+    async def test_rotate_refresh_key(self, refresh_key_redis: RedisClient):
+        # given
+        await redis_util.save_refresh_key("old_key", "user_id")
+
+        # when
+        user_id, new_key = await redis_util.rotate_refresh_key("old_key")
+
+        # then
+        async with refresh_key_redis.get_connection() as conn:
+            assert user_id == "user_id"
+            assert await conn.get("old_key") is None
+            assert await conn.get(new_key) == "user_id"
+            assert await conn.smembers(REFRESH_KEY_INDEX_PREFIX + "user_id") == {new_key}
+            assert await conn.ttl(new_key) > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Reject reuse of a rotated refresh key")
+    async def test_rotate_reused_refresh_key(self, refresh_key_redis: RedisClient):
+        # given
+        await redis_util.save_refresh_key("old_key", "user_id")
+        await redis_util.rotate_refresh_key("old_key")
+
+        # when
+        result = await redis_util.rotate_refresh_key("old_key")
+
+        # then
+        assert result == (None, None)
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Only one of concurrent rotations of the same key succeeds")
+    async def test_rotate_refresh_key_concurrently(self, refresh_key_redis: RedisClient):
+        # given
+        await redis_util.save_refresh_key("old_key", "user_id")
+
+        # when
+        results = await asyncio.gather(*[redis_util.rotate_refresh_key("old_key") for _ in range(4)])
+
+        # then
+        rotated = [new_key for user_id, new_key in results if user_id is not None]
+        assert len(rotated) == 1
+        async with refresh_key_redis.get_connection() as conn:
+            assert await conn.smembers(REFRESH_KEY_INDEX_PREFIX + "user_id") == {rotated[0]}
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Delete refresh key and remove it from the index")
+    async def test_delete_refresh_key(self, refresh_key_redis: RedisClient):
+        # given
+        await redis_util.save_refresh_key("first_key", "user_id")
+        await redis_util.save_refresh_key("second_key", "user_id")
+
+        # when
+        await redis_util.delete_refresh_key("first_key")
+        await redis_util.delete_refresh_key("not_existing_key")
+
+        # then
+        assert await redis_util.find_user_id_by_refresh_key("first_key") is None
+        async with refresh_key_redis.get_connection() as conn:
+            assert await conn.smembers(REFRESH_KEY_INDEX_PREFIX + "user_id") == {"second_key"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Revoke every refresh key of user")
+    async def test_revoke_refresh_keys_by_user_id(self, refresh_key_redis: RedisClient):
+        # given
+        await redis_util.save_refresh_key("first_key", "user_id")
+        await redis_util.save_refresh_key("second_key", "user_id")
+        await redis_util.save_refresh_key("other_key", "other_user_id")
+
+        # when
+        result = await redis_util.revoke_refresh_keys_by_user_id("user_id")
+
+        # then
+        assert result == 2
+        assert await redis_util.find_user_id_by_refresh_key("first_key") is None
+        assert await redis_util.find_user_id_by_refresh_key("second_key") is None
+        assert await redis_util.find_user_id_by_refresh_key("other_key") == "other_user_id"
+        assert await redis_util.rotate_refresh_key("first_key") == (None, None)
+        async with refresh_key_redis.get_connection() as conn:
+            assert await conn.exists(REFRESH_KEY_INDEX_PREFIX + "user_id") == 0
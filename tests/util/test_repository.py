@@ -0,0 +1,77 @@
+import os
+
+import pytest
+from sqlalchemy import Column, String, text, select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import declarative_base
+
+from claon_admin.common.util.repository import Repository
+
+ItemBase = declarative_base()
+
+
+class Item(ItemBase):
+    __tablename__ = "tb_item"
+
+    id = Column(String(length=255), primary_key=True)
+    name = Column(String(length=255), nullable=False)
+    status = Column(String(length=255), nullable=False, server_default=text("'pending'"))
+
+
+class ItemRepository(Repository[Item]):
+    pass
+
+
+item_repository = ItemRepository()
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'repository.db')}")
+    async with engine.begin() as conn:
+        await conn.run_sync(ItemBase.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+async def find_statuses(session: AsyncSession):
+    result = await session.execute(select(Item.id, Item.status).order_by(Item.id))
+    return result.all()
+
+
+@pytest.mark.describe("Test case for bulk insert of repository")
+class TestRepository(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Insert leaves unset columns with a server default to the database")
+    async def test_insert_all_with_server_default(self, session: AsyncSession):
+        # given
+        items = [
+            Item(id="a", name="a"),
+            Item(id="b", name="b", status="approved"),
+            Item(id="c", name="c")
+        ]
+
+        # when
+        await item_repository.insert_all(session, items)
+
+        # then
+        assert await find_statuses(session) == [("a", "pending"), ("b", "approved"), ("c", "pending")]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Upsert leaves unset columns with a server default to the database")
+    async def test_upsert_all_with_server_default(self, session: AsyncSession):
+        # given
+        await item_repository.insert_all(session, [Item(id="a", name="a", status="approved")])
+
+        # when
+        items = await item_repository.upsert_all(session, [
+            Item(id="a", name="renamed"),
+            Item(id="b", name="b")
+        ], ["id"])
+
+        # then
+        assert sorted((item.id, item.name, item.status) for item in items) == [
+            ("a", "renamed", "approved"),
+            ("b", "b", "pending")
+        ]
@@ -0,0 +1,230 @@
+import hashlib
+import threading
+from tempfile import SpooledTemporaryFile
+from unittest.mock import AsyncMock, MagicMock, ANY
+
+import boto3
+import pytest
+import requests
+from fastapi import UploadFile
+from moto import mock_aws
+
+from claon_admin.common.error.exception import BadRequestException, ErrorCode, NotFoundException
+from claon_admin.common.util import s3 as s3_util
+from claon_admin.schema.file import FileObjectRepository, FileDeletionRepository
+
+BUCKET = "claon-test"
+REGION = "us-east-1"
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    with mock_aws():
+        client = boto3.client("s3", region_name=REGION)
+        client.create_bucket(Bucket=BUCKET)
+        monkeypatch.setattr(s3_util, "s3", client)
+        monkeypatch.setattr(s3_util, "AWS_S3_BUCKET", BUCKET)
+        monkeypatch.setattr(s3_util, "AWS_REGION", REGION)
+        yield client
+
+
+def create_upload_file(content: bytes):
+    file = SpooledTemporaryFile()
+    file.write(content)
+    file.seek(0)
+    return UploadFile(file=file, filename="logo.png")
+
+
+@pytest.mark.describe("Test case for presigned upload")
+class TestPresignedUpload(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: upload with presigned post and confirm")
+    async def test_presigned_upload(self, s3_client):
+        # given
+        url, fields, file_url = s3_util.create_presigned_upload("test.png", "center", "image")
+        response = requests.post(url, data=fields, files={"file": ("test.png", b"image")})
+
+        # when
+        result = await s3_util.confirm_upload(file_url, "center", "image")
+
+        # then
+        assert response.status_code == 204
+        assert result == file_url
+        assert fields["Content-Type"] == "image/png"
+        assert fields["key"].startswith("center/image/")
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: file is not uploaded")
+    async def test_confirm_upload_with_not_uploaded_file(self, s3_client):
+        # given
+        _, _, file_url = s3_util.create_presigned_upload("test.png", "center", "image")
+
+        with pytest.raises(NotFoundException) as exception:
+            # when
+            await s3_util.confirm_upload(file_url, "center", "image")
+
+        # then
+        assert exception.value.code == ErrorCode.DATA_DOES_NOT_EXIST
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: uploaded content type does not match and the object is deleted")
+    async def test_confirm_upload_with_wrong_content_type(self, s3_client):
+        # given
+        _, fields, file_url = s3_util.create_presigned_upload("test.png", "center", "image")
+        s3_client.put_object(Bucket=BUCKET, Key=fields["key"], Body=b"<html/>", ContentType="text/html")
+
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await s3_util.confirm_upload(file_url, "center", "image")
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: url is out of the purpose prefix")
+    async def test_confirm_upload_with_other_purpose(self, s3_client):
+        # given
+        _, _, file_url = s3_util.create_presigned_upload("test.png", "user", "profile")
+
+        with pytest.raises(BadRequestException) as exception:
+            # when
+            await s3_util.confirm_upload(file_url, "center", "image")
+
+        # then
+        assert exception.value.code == ErrorCode.INVALID_FORMAT
+
+
+@pytest.mark.describe("Test case for delete objects")
+class TestDeleteObjects(object):
+    @pytest.mark.it("Success case: delete objects in batches")
+    def test_delete_objects(self, s3_client, monkeypatch):
+        # given
+        monkeypatch.setattr(s3_util, "DELETE_OBJECTS_BATCH_SIZE", 2)
+        urls = []
+        for i in range(5):
+            s3_client.put_object(Bucket=BUCKET, Key=f"center/proof/{i}.pdf", Body=b"proof")
+            urls.append(f"{s3_util.get_url_prefix()}/center/proof/{i}.pdf")
+
+        # when
+        errors = s3_util.delete_objects(urls)
+
+        # then
+        assert errors == {}
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 0
+
+    @pytest.mark.it("Fail case: report urls of a failed batch")
+    def test_delete_objects_with_failure(self, s3_client, monkeypatch):
+        # given
+        monkeypatch.setattr(s3_util, "AWS_S3_BUCKET", "not-existing-bucket")
+        urls = [f"{s3_util.get_url_prefix()}/center/proof/0.pdf"]
+
+        # when
+        errors = s3_util.delete_objects(urls)
+
+        # then
+        assert list(errors.keys()) == urls
+        assert "NoSuchBucket" in errors[urls[0]]
+
+
+@pytest.mark.describe("Test case for delete file")
+class TestDeleteFile(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: delete the object off the event loop thread without celery")
+    async def test_delete_file(self, s3_client, monkeypatch):
+        # given
+        threads = []
+        delete_object = s3_util.delete_object
+        monkeypatch.setattr(s3_util, "celery", None)
+        monkeypatch.setattr(s3_util, "delete_object",
+                            lambda url: threads.append(threading.current_thread()) or delete_object(url))
+        s3_client.put_object(Bucket=BUCKET, Key="center/proof/0.pdf", Body=b"proof")
+
+        # when
+        await s3_util.delete_file(f"{s3_util.get_url_prefix()}/center/proof/0.pdf")
+
+        # then
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 0
+        assert threads != [threading.current_thread()]
+        assert len(threads) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fail case: log the failure without raising")
+    async def test_delete_file_with_failure(self, s3_client, monkeypatch):
+        # given
+        delete_object = MagicMock(side_effect=RuntimeError())
+        monkeypatch.setattr(s3_util, "celery", None)
+        monkeypatch.setattr(s3_util, "delete_object", delete_object)
+
+        # when
+        await s3_util.delete_file(f"{s3_util.get_url_prefix()}/center/proof/0.pdf")
+
+        # then
+        delete_object.assert_called_once()
+
+
+@pytest.mark.describe("Test case for deduplicated upload")
+class TestUploadFile(object):
+    @pytest.fixture
+    def file_repositories(self, monkeypatch):
+        file_object_repository = AsyncMock(spec=FileObjectRepository)
+        file_deletion_repository = AsyncMock(spec=FileDeletionRepository)
+        mock_db = MagicMock()
+        mock_db.async_session_maker.return_value.__aenter__.return_value = AsyncMock()
+        monkeypatch.setattr(s3_util, "file_object_repository", file_object_repository)
+        monkeypatch.setattr(s3_util, "file_deletion_repository", file_deletion_repository)
+        monkeypatch.setattr(s3_util, "db", mock_db)
+        return file_object_repository, file_deletion_repository
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: upload new content and register its hash")
+    async def test_upload_file(self, s3_client, file_repositories):
+        # given
+        file_object_repository, _ = file_repositories
+        file_object_repository.acquire.side_effect = [None]
+        file_object_repository.register.side_effect = lambda session, prefix, file_hash, url, size: url
+
+        # when
+        result = await s3_util.upload_file(create_upload_file(b"logo"), "center", "profile")
+
+        # then
+        assert result.startswith(f"{s3_util.get_url_prefix()}/center/profile/")
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 1
+        file_object_repository.register.assert_called_once_with(
+            ANY,
+            "center/profile",
+            hashlib.sha256(b"logo").hexdigest(),
+            result,
+            4
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: return the existing url for the same content without upload")
+    async def test_upload_file_with_same_content(self, s3_client, file_repositories):
+        # given
+        file_object_repository, _ = file_repositories
+        file_object_repository.acquire.side_effect = ["https://claon-test.s3.us-east-1.amazonaws.com/center/logo.png"]
+
+        # when
+        result = await s3_util.upload_file(create_upload_file(b"logo"), "center", "profile")
+
+        # then
+        assert result == "https://claon-test.s3.us-east-1.amazonaws.com/center/logo.png"
+        assert s3_client.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 0
+        file_object_repository.register.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Success case: discard own upload when a concurrent upload registered the hash first")
+    async def test_upload_file_with_concurrent_upload(self, s3_client, file_repositories):
+        # given
+        file_object_repository, file_deletion_repository = file_repositories
+        file_object_repository.acquire.side_effect = [None]
+        file_object_repository.register.side_effect = ["https://claon-test.s3.us-east-1.amazonaws.com/center/logo.png"]
+
+        # when
+        result = await s3_util.upload_file(create_upload_file(b"logo"), "center", "profile")
+
+        # then
+        assert result == "https://claon-test.s3.us-east-1.amazonaws.com/center/logo.png"
+        uploaded_url = file_object_repository.register.call_args.args[3]
+        file_deletion_repository.add_all.assert_called_once_with(ANY, [uploaded_url], ANY)
@@ -0,0 +1,271 @@
+import os
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+from sqlalchemy import text, insert, table, column
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from claon_admin.common.util import transaction
+from claon_admin.common.util.db import Database
+from claon_admin.common.util.transaction import transactional, get_session, current_session, \
+    READ_ONLY_EXECUTION_OPTIONS
+
+item_table = table("item", column("id"))
+
+
+async def create_item_table(database: Database):
+    async with database.async_session_maker() as session:
+        await session.execute(text("CREATE TABLE IF NOT EXISTS item (id TEXT PRIMARY KEY)"))
+        await session.commit()
+
+
+async def find_item_ids(database: Database):
+    async with database.async_session_maker() as session:
+        result = await session.execute(text("SELECT id FROM item ORDER BY id"))
+        return result.scalars().all()
+
+
+@pytest.fixture
+async def database(tmp_path, monkeypatch):
+    database = Database(f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'primary.db')}")
+    await create_item_table(database)
+    monkeypatch.setattr(transaction, "db", database)
+    yield database
+    await database.dispose()
+
+
+class ItemService:
+    def __init__(self):
+        self.sessions = []
+
+    @transactional()
+    async def add(self, session: AsyncSession, item_id: str):
+        self.sessions.append(session)
+        await session.execute(text("INSERT INTO item (id) VALUES (:id)"), {"id": item_id})
+
+    @transactional()
+    async def add_all(self, session: AsyncSession, item_ids: list[str]):
+        self.sessions.append(session)
+        for item_id in item_ids:
+            await self.add(item_id)
+
+    @transactional()
+    async def add_and_fail(self, session: AsyncSession, item_id: str):
+        await self.add(item_id)
+        raise RuntimeError()
+
+    @transactional()
+    async def add_with_failing_nested(self, session: AsyncSession, item_id: str):
+        await session.execute(text("INSERT INTO item (id) VALUES (:id)"), {"id": item_id})
+        await self.add_and_fail(item_id + "-nested")
+
+    @transactional(read_only=True)
+    async def find_all(self, session: AsyncSession):
+        self.sessions.append(session)
+        result = await session.execute(text("SELECT id FROM item ORDER BY id"))
+        return result.scalars().all()
+
+    @transactional(read_only=True)
+    async def add_in_read_only(self, session: AsyncSession, item_id: str):
+        await session.execute(insert(item_table).values(id=item_id))
+
+
+@pytest.mark.describe("Test case for transactional")
+class TestTransactional(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Nested transactional calls join one session and commit once")
+    async def test_nested_join(self, database: Database):
+        # given
+        service = ItemService()
+
+        # when
+        await service.add_all(["a", "b"])
+
+        # then
+        assert len(service.sessions) == 3
+        assert all(session is service.sessions[0] for session in service.sessions)
+        assert await find_item_ids(database) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Exception in nested call rolls back the whole transaction")
+    async def test_nested_rollback(self, database: Database):
+        # given
+        service = ItemService()
+
+        with pytest.raises(RuntimeError):
+            # when
+            await service.add_with_failing_nested("a")
+
+        # then
+        assert await find_item_ids(database) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Transactional calls join the request-scoped session")
+    async def test_request_scoped_session(self, database: Database):
+        # given
+        service = ItemService()
+        request_session = get_session()
+
+        # when
+        session = await request_session.__anext__()
+        await service.add("a")
+        await service.add("b")
+        await request_session.aclose()
+
+        # then
+        assert service.sessions == [session, session]
+        assert await find_item_ids(database) == ["a", "b"]
+
+
+def create_postgresql_session():
+    session = MagicMock()
+    session.bind.dialect.name = "postgresql"
+    session.info = {}
+    session.in_transaction.return_value = True
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.commit = AsyncMock()
+    session.connection = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    return session
+
+
+@pytest.mark.describe("Test case for read-only transactional")
+class TestReadOnlyTransactional(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Read-only transaction refuses write statements")
+    async def test_refuse_write(self, database: Database):
+        # given
+        service = ItemService()
+
+        with pytest.raises(InvalidRequestError):
+            # when
+            await service.add_in_read_only("a")
+
+        # then
+        assert await find_item_ids(database) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Write transaction after a read-only one on the same session is allowed")
+    async def test_write_after_read_only(self, database: Database):
+        # given
+        service = ItemService()
+        request_session = get_session()
+        await request_session.__anext__()
+
+        # when
+        before = await service.find_all()
+        await service.add("a")
+        after = await service.find_all()
+        await request_session.aclose()
+
+        # then
+        assert before == []
+        assert after == ["a"]
+        assert service.sessions[0] is service.sessions[1]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Commit an open transaction before beginning a read-only one")
+    async def test_commit_before_read_only(self, monkeypatch):
+        # given
+        session = create_postgresql_session()
+        manager = MagicMock()
+        manager.attach_mock(session.commit, "commit")
+        manager.attach_mock(session.connection, "connection")
+        database = MagicMock()
+        database.async_session_maker.return_value = session
+        database.next_replica.return_value = None
+        monkeypatch.setattr(transaction, "db", database)
+
+        # when
+        await ItemService().find_all()
+
+        # then
+        assert manager.mock_calls[:3] == [
+            call.commit(),
+            call.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS),
+            call.commit()
+        ]
+        assert READ_ONLY_EXECUTION_OPTIONS["postgresql_readonly"] is True
+
+
+@pytest.fixture
+async def replicated_database(tmp_path, monkeypatch):
+    replica_url = f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'replica.db')}"
+    missing_replica_url = f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'missing', 'replica.db')}"
+    database = Database(
+        f"sqlite+aiosqlite:///{os.path.join(tmp_path, 'primary.db')}",
+        replica_urls=[missing_replica_url, replica_url],
+        replica_eject_seconds=30
+    )
+    await create_item_table(database)
+    async with database.replicas[1].async_session_maker() as session:
+        await session.execute(text("CREATE TABLE item (id TEXT PRIMARY KEY)"))
+        await session.execute(text("INSERT INTO item (id) VALUES ('replica')"))
+        await session.commit()
+    monkeypatch.setattr(transaction, "db", database)
+    yield database
+    await database.dispose()
+
+
+@pytest.mark.describe("Test case for read replicas")
+class TestReadReplica(object):
+    @pytest.mark.asyncio
+    @pytest.mark.it("Eject an unreachable replica and read from the next one")
+    async def test_eject_unreachable_replica(self, replicated_database: Database):
+        # when
+        result = await ItemService().find_all()
+
+        # then
+        assert result == ["replica"]
+        assert not replicated_database.replicas[0].healthy
+        assert replicated_database.replicas[1].healthy
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Fall back to the primary when every replica is ejected")
+    async def test_fall_back_to_primary(self, replicated_database: Database):
+        # given
+        replicated_database.eject(replicated_database.replicas[1])
+
+        # when
+        result = await ItemService().find_all()
+
+        # then
+        assert result == []
+        assert not replicated_database.replicas[0].healthy
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Read from the primary after a write in the same request")
+    async def test_read_your_writes(self, replicated_database: Database):
+        # given
+        service = ItemService()
+        request_session = get_session()
+        await request_session.__anext__()
+
+        # when
+        await service.add("a")
+        result = await service.find_all()
+        await request_session.aclose()
+
+        # then
+        assert result == ["a"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.it("Current session of a request is the primary session")
+    async def test_current_session_on_primary(self, replicated_database: Database):
+        # given
+        await ItemService().add("primary")
+        request_session = get_session()
+        session = await request_session.__anext__()
+
+        # when
+        async with current_session() as current:
+            result = await current.execute(text("SELECT id FROM item"))
+            item_ids = result.scalars().all()
+        await request_session.aclose()
+
+        # then
+        assert current is session
+        assert item_ids == ["primary"]
+        assert replicated_database.replicas[0].healthy